@@ -0,0 +1,600 @@
+import argparse, bisect, hashlib, itertools, json, os, shutil, sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+TIMESTAMP_FORMAT = "%Y%m%d%H%M%S"
+CATALOG_FILE = "catalog.jsonl"
+MANIFEST_FILE = ".manifest.json"
+VERIFY_CACHE_FILE = "verify_cache.json"
+TIMELINE_FILE = "timeline.jsonl"
+INITIAL_FEATURE = "Initial"
+# Entries in <save>_Backup that belong to the editor rather than the initial save copy
+BACKUP_METADATA = {"feature_backups", MANIFEST_FILE, VERIFY_CACHE_FILE}
+HASH_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+_PATH_VERSIONS = itertools.count(1)  # Shared by every FileTimeline, so versions never repeat across saves
+
+
+def parse_timestamp(timestamp: str) -> datetime:
+    return datetime.strptime(timestamp, TIMESTAMP_FORMAT)
+
+
+def directory_stats(path: Path) -> Tuple[int, int]:
+    """Return (file_count, total_bytes) for every file below path."""
+    files = total = 0
+    for root, _, names in os.walk(path):
+        for name in names:
+            if name == MANIFEST_FILE:
+                continue
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+                files += 1
+            except OSError:
+                continue
+    return files, total
+
+
+class RetentionPolicy:
+    """Settings deciding which feature snapshots survive pruning."""
+
+    def __init__(self, keep_last: int = 10, keep_daily: int = 7, keep_weekly: int = 4,
+                 max_total_mb: int = 500):
+        self.keep_last = keep_last          # newest N snapshots per feature
+        self.keep_daily = keep_daily        # newest snapshot of each of the last N days
+        self.keep_weekly = keep_weekly      # newest snapshot of each of the last N weeks
+        self.max_total_mb = max_total_mb    # size budget for all snapshots, 0 = unlimited
+
+    @property
+    def max_total_bytes(self) -> int:
+        return self.max_total_mb * 1024 * 1024
+
+    def to_dict(self) -> dict:
+        return {
+            "keep_last": self.keep_last,
+            "keep_daily": self.keep_daily,
+            "keep_weekly": self.keep_weekly,
+            "max_total_mb": self.max_total_mb,
+        }
+
+    @classmethod
+    def load(cls, path: Path) -> "RetentionPolicy":
+        policy = cls()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            for key, value in data.items():
+                if key in policy.to_dict():
+                    setattr(policy, key, max(0, int(value)))
+        except (FileNotFoundError, json.JSONDecodeError, TypeError, ValueError):
+            pass
+        return policy
+
+    def save(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=4)
+
+
+def select_evictions(snapshots: Dict[str, Dict[str, int]],
+                     policy: RetentionPolicy) -> List[Tuple[str, str]]:
+    """
+    Decide which snapshots to drop.
+
+    Args:
+        snapshots: {feature: {timestamp: size_in_bytes}}.
+        policy: The retention settings to apply.
+
+    Returns:
+        list[tuple[str, str]]: (feature, timestamp) pairs to evict, least valuable first.
+    """
+    evicted = []
+    # Value of each surviving snapshot: 3 = within keep_last, 2 = daily checkpoint, 1 = weekly checkpoint
+    ranks: Dict[Tuple[str, str], int] = {}
+    newest = set()
+
+    for feature, entries in snapshots.items():
+        days, weeks = set(), set()
+        for i, timestamp in enumerate(sorted(entries, reverse=True)):
+            if i == 0:
+                newest.add((feature, timestamp))
+            try:
+                dt = parse_timestamp(timestamp)
+            except ValueError:
+                continue  # Not a snapshot we created, leave it alone
+            rank = 3 if i < policy.keep_last else 0
+            if dt.date() not in days and len(days) < policy.keep_daily:
+                days.add(dt.date())
+                rank = max(rank, 2)
+            week = dt.isocalendar()[:2]
+            if week not in weeks and len(weeks) < policy.keep_weekly:
+                weeks.add(week)
+                rank = max(rank, 1)
+            if rank or i == 0:
+                ranks[(feature, timestamp)] = rank
+            else:
+                evicted.append((feature, timestamp))
+
+    evicted.sort(key=lambda key: key[1])
+
+    if policy.max_total_bytes:
+        total = sum(snapshots[f][t] for f, t in ranks)
+        # The newest snapshot of each feature is never dropped for space
+        candidates = sorted((key for key in ranks if key not in newest),
+                            key=lambda key: (ranks[key], key[1]))
+        for feature, timestamp in candidates:
+            if total <= policy.max_total_bytes:
+                break
+            total -= snapshots[feature][timestamp]
+            evicted.append((feature, timestamp))
+
+    return evicted
+
+
+class SnapshotLog:
+    """
+    Append-only log of per-snapshot records kept next to the snapshots.
+
+    Each record is keyed by (feature, timestamp). Adding or removing a snapshot
+    appends one line, so updates never rewrite or rescan the backup tree.
+    """
+
+    def __init__(self, feature_backups: Path, filename: str):
+        self.feature_backups = feature_backups
+        self.path = feature_backups / filename
+        self._entries: Optional[Dict[Tuple[str, str], dict]] = None
+        self._log_lines = 0
+
+    @property
+    def entries(self) -> Dict[Tuple[str, str], dict]:
+        if self._entries is None:
+            self._entries = self._load()
+        return self._entries
+
+    def _load(self) -> Dict[Tuple[str, str], dict]:
+        entries = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # Torn write at the end of the log
+                    key = (record.get("feature"), record.get("timestamp"))
+                    if record.get("op") == "remove":
+                        entries.pop(key, None)
+                    else:
+                        entries[key] = {k: v for k, v in record.items() if k != "op"}
+                    self._log_lines += 1
+            return entries
+        except FileNotFoundError:
+            pass
+        # No log yet (older editor version): rebuild it from the snapshots once
+        self._entries = self._rebuild()
+        self._compact()
+        return self._entries
+
+    def _rebuild(self) -> Dict[Tuple[str, str], dict]:
+        return {}
+
+    def _append(self, record: dict):
+        if not self.feature_backups.exists():
+            return
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record) + "\n")
+        self._log_lines += 1
+        # Rewrite the log once removed entries make up most of it
+        if self._log_lines > 2 * len(self.entries) + 100:
+            self._compact()
+
+    def _compact(self):
+        if not self.feature_backups.exists():
+            return
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for entry in self.entries.values():
+                f.write(json.dumps({"op": "add", **entry}) + "\n")
+        os.replace(tmp_path, self.path)
+        self._log_lines = len(self.entries)
+
+    def _add_entry(self, entry: dict):
+        self.entries[(entry["feature"], entry["timestamp"])] = entry
+        self._append({"op": "add", **entry})
+
+    def remove(self, feature: str, timestamp: str) -> Optional[dict]:
+        entry = self.entries.pop((feature, timestamp), None)
+        if entry is not None:
+            self._append({"op": "remove", "feature": feature, "timestamp": timestamp})
+        return entry
+
+    def get(self, feature: str, timestamp: str) -> Optional[dict]:
+        return self.entries.get((feature, timestamp))
+
+    def clear(self):
+        """Forget every snapshot, e.g. after all backups were deleted."""
+        self._entries = {}
+        self._log_lines = 0
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class BackupCatalog(SnapshotLog):
+    """
+    Index of every feature snapshot (feature, timestamp, files, bytes, description).
+
+    Listing backups is a single read of catalog.jsonl instead of a directory walk.
+    """
+
+    def __init__(self, feature_backups: Path):
+        super().__init__(feature_backups, CATALOG_FILE)
+
+    def _rebuild(self) -> Dict[Tuple[str, str], dict]:
+        entries = {}
+        if self.feature_backups.exists():
+            for feature_dir in self.feature_backups.iterdir():
+                if not feature_dir.is_dir():
+                    continue
+                for snapshot in feature_dir.iterdir():
+                    if snapshot.is_dir():
+                        files, size = directory_stats(snapshot)
+                        entries[(feature_dir.name, snapshot.name)] = {
+                            "feature": feature_dir.name, "timestamp": snapshot.name,
+                            "files": files, "bytes": size, "description": ""
+                        }
+        return entries
+
+    def add(self, feature: str, timestamp: str, files: int, size: int, description: str = "",
+            roots: Optional[List[str]] = None) -> dict:
+        entry = {"feature": feature, "timestamp": timestamp, "files": files,
+                 "bytes": size, "description": description, "roots": roots or []}
+        self._add_entry(entry)
+        return entry
+
+    def by_feature(self) -> Dict[str, List[str]]:
+        """{feature: [timestamps, newest first]}"""
+        backups: Dict[str, List[str]] = {}
+        for feature, timestamp in self.entries:
+            backups.setdefault(feature, []).append(timestamp)
+        for timestamps in backups.values():
+            timestamps.sort(reverse=True)
+        return backups
+
+    def sizes(self) -> Dict[str, Dict[str, int]]:
+        """{feature: {timestamp: bytes}} as consumed by select_evictions."""
+        snapshots: Dict[str, Dict[str, int]] = {}
+        for (feature, timestamp), entry in self.entries.items():
+            snapshots.setdefault(feature, {})[timestamp] = entry.get("bytes", 0)
+        return snapshots
+
+    def total_bytes(self) -> int:
+        return sum(entry.get("bytes", 0) for entry in self.entries.values())
+
+
+class RetentionEngine:
+    """Prunes feature_backups after every new snapshot using only the catalog."""
+
+    def __init__(self, catalog: BackupCatalog, policy: RetentionPolicy):
+        self.catalog = catalog
+        self.policy = policy
+
+    def enforce(self) -> List[Tuple[str, str]]:
+        """Apply the policy to the catalogued snapshots, deleting whatever it evicts."""
+        evicted = select_evictions(self.catalog.sizes(), self.policy)
+        for feature, timestamp in evicted:
+            self._remove(feature, timestamp)
+        return evicted
+
+    def _remove(self, feature: str, timestamp: str):
+        feature_dir = self.catalog.feature_backups / feature
+        shutil.rmtree(feature_dir / timestamp, ignore_errors=True)
+        self.catalog.remove(feature, timestamp)
+        try:
+            feature_dir.rmdir()  # Only succeeds once the last snapshot is gone
+        except OSError:
+            pass
+
+
+def hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _hash_or_none(path: Path) -> Optional[str]:
+    try:
+        return hash_file(path)
+    except OSError:
+        return None
+
+
+def hash_files(paths: List[Path], progress: Optional[Callable[[int, int], None]] = None) -> List[Optional[str]]:
+    """Hash files across a thread pool. Unreadable files hash to None."""
+    results = []
+    with ThreadPoolExecutor(max_workers=HASH_WORKERS) as pool:
+        for digest in pool.map(_hash_or_none, paths):
+            results.append(digest)
+            if progress:
+                progress(len(results), len(paths))
+    return results
+
+
+def list_files(root: Path, exclude: Iterable[str] = ()) -> List[str]:
+    """Every file below root as a posix path relative to root, skipping top-level names in exclude."""
+    exclude = set(exclude) | {MANIFEST_FILE}
+    files = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        if Path(dirpath) == root:
+            dirnames[:] = [d for d in dirnames if d not in exclude]
+            filenames = [f for f in filenames if f not in exclude]
+        rel_dir = Path(dirpath).relative_to(root)
+        files.extend((rel_dir / name).as_posix() for name in filenames)
+    return files
+
+
+def write_manifest(root: Path, exclude: Iterable[str] = ()) -> dict:
+    """Record the size and SHA-256 of every file in a backup so it can be verified later."""
+    rel_paths = list_files(root, exclude)
+    digests = hash_files([root / rel for rel in rel_paths])
+    manifest = {
+        "created": datetime.now().strftime(TIMESTAMP_FORMAT),
+        "files": {
+            rel: {"size": (root / rel).stat().st_size, "sha256": digest}
+            for rel, digest in zip(rel_paths, digests) if digest
+        }
+    }
+    with open(root / MANIFEST_FILE, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=4)
+    return manifest
+
+
+def load_manifest(root: Path) -> Optional[dict]:
+    try:
+        with open(root / MANIFEST_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+class BackupVerifier:
+    """
+    Checks <save>_Backup and every feature snapshot against their manifests.
+
+    Digests of files that were already verified are cached by size and
+    modification time, so re-verifying only hashes files that changed.
+    """
+
+    def __init__(self, backup_path: Path):
+        self.backup_path = backup_path
+        self.feature_backups = backup_path / "feature_backups"
+        self.cache_path = backup_path / VERIFY_CACHE_FILE
+
+    def snapshots(self) -> List[Tuple[str, Path, set]]:
+        """(label, root, excluded top-level names) for every backup to verify."""
+        snapshots = []
+        if self.backup_path.exists():
+            snapshots.append(("Initial", self.backup_path, BACKUP_METADATA))
+        catalog = BackupCatalog(self.feature_backups)
+        for feature, timestamp in sorted(catalog.entries):
+            snapshots.append((f"{feature}/{timestamp}", self.feature_backups / feature / timestamp, set()))
+        return snapshots
+
+    def _load_cache(self) -> Dict[str, list]:
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def verify(self, full: bool = False,
+               progress: Optional[Callable[[int, int], None]] = None) -> List[dict]:
+        """
+        Verify every backup.
+
+        Args:
+            full: Re-hash every file instead of trusting the digest cache.
+            progress: Called with (files_hashed, files_to_hash).
+
+        Returns:
+            list[dict]: One report per backup with "snapshot", "checked", "missing",
+            "altered", "extra" and "has_manifest" keys.
+        """
+        cache = {} if full else self._load_cache()
+        new_cache: Dict[str, list] = {}
+        reports = []
+        pending: List[Tuple[dict, str, Path, dict, str, os.stat_result]] = []
+
+        for label, root, exclude in self.snapshots():
+            report = {"snapshot": label, "checked": 0, "missing": [], "altered": [], "extra": [],
+                      "has_manifest": True}
+            reports.append(report)
+            manifest = load_manifest(root)
+            if manifest is None:
+                report["has_manifest"] = False
+                continue
+            expected = manifest.get("files", {})
+            report["extra"] = sorted(set(list_files(root, exclude)) - set(expected))
+            for rel, entry in expected.items():
+                path = root / rel
+                try:
+                    stat = path.stat()
+                except OSError:
+                    report["missing"].append(rel)
+                    continue
+                cache_key = path.relative_to(self.backup_path).as_posix()
+                cached = cache.get(cache_key)
+                if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+                    new_cache[cache_key] = cached
+                    self._compare(report, rel, entry, cached[2])
+                else:
+                    pending.append((report, rel, path, entry, cache_key, stat))
+
+        digests = hash_files([item[2] for item in pending], progress)
+        for (report, rel, path, entry, cache_key, stat), digest in zip(pending, digests):
+            if digest is None:
+                report["missing"].append(rel)
+                continue
+            new_cache[cache_key] = [stat.st_size, stat.st_mtime_ns, digest]
+            self._compare(report, rel, entry, digest)
+
+        if self.backup_path.exists():
+            with open(self.cache_path, 'w', encoding='utf-8') as f:
+                json.dump(new_cache, f)
+        return reports
+
+    @staticmethod
+    def _compare(report: dict, rel: str, entry: dict, digest: str):
+        report["checked"] += 1
+        if digest != entry.get("sha256"):
+            report["altered"].append(rel)
+
+
+class FileTimeline(SnapshotLog):
+    """
+    Maps every save-relative path to each backed-up version of it.
+
+    The versions of a path are kept sorted by timestamp, so looking up the
+    version in effect at a point in time is a binary search.
+    """
+
+    def __init__(self, backup_path: Path, catalog: BackupCatalog):
+        super().__init__(backup_path / "feature_backups", TIMELINE_FILE)
+        self.backup_path = backup_path
+        self.catalog = catalog
+        # path -> (timestamps ascending, features in the same order)
+        self._index: Optional[Dict[str, Tuple[List[str], List[str]]]] = None
+        self.paths_version = next(_PATH_VERSIONS)  # Changes whenever the set of paths may have changed
+
+    def _rebuild(self) -> Dict[Tuple[str, str], dict]:
+        entries = {}
+        for feature, timestamp in self.catalog.entries:
+            root = self.feature_backups / feature / timestamp
+            manifest = load_manifest(root)
+            paths = sorted(manifest["files"]) if manifest else list_files(root)
+            entries[(feature, timestamp)] = {"feature": feature, "timestamp": timestamp, "paths": paths}
+        return entries
+
+    def _initial_entry(self) -> Optional[dict]:
+        """The initial backup is described by its manifest rather than the log."""
+        if not self.backup_path.exists():
+            return None
+        manifest = load_manifest(self.backup_path)
+        if manifest:
+            return {"feature": INITIAL_FEATURE, "timestamp": manifest.get("created", ""),
+                    "paths": list(manifest.get("files", {}))}
+        created = datetime.fromtimestamp(self.backup_path.stat().st_mtime).strftime(TIMESTAMP_FORMAT)
+        return {"feature": INITIAL_FEATURE, "timestamp": created,
+                "paths": list_files(self.backup_path, BACKUP_METADATA)}
+
+    @property
+    def index(self) -> Dict[str, Tuple[List[str], List[str]]]:
+        if self._index is None:
+            self._index = {}
+            initial = self._initial_entry()
+            if initial:
+                self._insert(initial)
+            for entry in self.entries.values():
+                self._insert(entry)
+        return self._index
+
+    def _insert(self, entry: dict):
+        for path in entry["paths"]:
+            if path not in self._index:
+                self.paths_version = next(_PATH_VERSIONS)
+            timestamps, features = self._index.setdefault(path, ([], []))
+            i = bisect.bisect_right(timestamps, entry["timestamp"])
+            timestamps.insert(i, entry["timestamp"])
+            features.insert(i, entry["feature"])
+
+    def _discard(self, entry: dict):
+        for path in entry["paths"]:
+            if path not in self._index:
+                continue
+            timestamps, features = self._index[path]
+            i = bisect.bisect_left(timestamps, entry["timestamp"])
+            while i < len(timestamps) and timestamps[i] == entry["timestamp"]:
+                if features[i] == entry["feature"]:
+                    del timestamps[i], features[i]
+                    break
+                i += 1
+            if not timestamps:
+                del self._index[path]
+                self.paths_version = next(_PATH_VERSIONS)
+
+    def add_snapshot(self, feature: str, timestamp: str, paths: List[str]):
+        self.remove(feature, timestamp)  # A second backup in the same second replaces the first
+        entry = {"feature": feature, "timestamp": timestamp, "paths": paths}
+        self._add_entry(entry)
+        if self._index is not None:
+            self._insert(entry)
+
+    def remove(self, feature: str, timestamp: str) -> Optional[dict]:
+        entry = super().remove(feature, timestamp)
+        if entry is not None and self._index is not None:
+            self._discard(entry)
+        return entry
+
+    def clear(self):
+        super().clear()
+        self._index = None
+        self.paths_version = next(_PATH_VERSIONS)
+
+    def paths(self) -> List[str]:
+        return sorted(self.index)
+
+    def versions(self, path: str) -> List[Tuple[str, str]]:
+        """Every (timestamp, feature) version of path, newest first."""
+        timestamps, features = self.index.get(path, ([], []))
+        return list(zip(reversed(timestamps), reversed(features)))
+
+    def version_at(self, path: str, timestamp: str) -> Optional[Tuple[str, str]]:
+        """The newest (timestamp, feature) version of path taken at or before timestamp."""
+        timestamps, features = self.index.get(path, ([], []))
+        i = bisect.bisect_right(timestamps, timestamp) - 1
+        return (timestamps[i], features[i]) if i >= 0 else None
+
+    def source(self, path: str, timestamp: str, feature: str) -> Path:
+        """Location of one stored version inside the backups."""
+        if feature == INITIAL_FEATURE:
+            return self.backup_path / path
+        return self.feature_backups / feature / timestamp / path
+
+
+def summarize_reports(reports: List[dict]) -> str:
+    lines = []
+    for report in reports:
+        if not report["has_manifest"]:
+            lines.append(f"{report['snapshot']}: no stored digests (created by an older version)")
+            continue
+        problems = len(report["missing"]) + len(report["altered"])
+        status = "OK" if not problems else f"{problems} problem(s)"
+        lines.append(f"{report['snapshot']}: {report['checked']} files checked, {status}")
+        lines.extend(f"    missing: {rel}" for rel in report["missing"])
+        lines.extend(f"    altered: {rel}" for rel in report["altered"])
+        lines.extend(f"    untracked: {rel}" for rel in report["extra"])
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Schedule I Save Editor backup tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+    verify_cmd = commands.add_parser("verify", help="Verify backups against their stored digests")
+    verify_cmd.add_argument("save", help="Save folder (SaveGame_N) or its _Backup folder")
+    verify_cmd.add_argument("--full", action="store_true", help="Re-hash every file, ignoring the digest cache")
+    args = parser.parse_args(argv)
+
+    save = Path(args.save)
+    backup_path = save if save.name.endswith("_Backup") else save.parent / (save.name + "_Backup")
+    if not backup_path.exists():
+        print(f"No backups found at {backup_path}")
+        return 2
+    reports = BackupVerifier(backup_path).verify(full=args.full)
+    print(summarize_reports(reports))
+    return 1 if any(r["missing"] or r["altered"] for r in reports) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
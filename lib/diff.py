@@ -0,0 +1,163 @@
+import json, os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from lib.backups import MANIFEST_FILE, hash_file, list_files
+
+MISSING = object()
+
+
+class DigestCache:
+    """SHA-256 digests keyed by path, size and mtime so unchanged files are hashed once."""
+
+    def __init__(self):
+        self._digests: Dict[str, Tuple[int, int, str]] = {}
+
+    def digest(self, path: Path) -> Optional[str]:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        key = str(path)
+        cached = self._digests.get(key)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            return cached[2]
+        digest = hash_file(path)
+        self._digests[key] = (stat.st_size, stat.st_mtime_ns, digest)
+        return digest
+
+
+def _decode_item(value):
+    """Items arrays hold JSON-encoded strings; decode them so items diff field by field."""
+    if isinstance(value, str):
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            pass
+    return value
+
+
+def diff_json(old, new, path: str = "") -> List[dict]:
+    """
+    Structural diff of two decoded JSON documents.
+
+    Returns:
+        list[dict]: Changes with "path", "kind" ("added", "removed" or "changed"),
+        "old" and "new" keys. Missing sides are None.
+    """
+    changes = []
+    _diff_value(old, new, path, changes)
+    return changes
+
+
+def _diff_value(old, new, path: str, changes: List[dict]):
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in [*old, *(k for k in new if k not in old)]:
+            child = f"{path}.{key}" if path else key
+            a, b = old.get(key, MISSING), new.get(key, MISSING)
+            if key == "Items" and isinstance(a, list) and isinstance(b, list):
+                a, b = [_decode_item(v) for v in a], [_decode_item(v) for v in b]
+            _diff_value(a, b, child, changes)
+    elif isinstance(old, list) and isinstance(new, list):
+        for i in range(max(len(old), len(new))):
+            a = old[i] if i < len(old) else MISSING
+            b = new[i] if i < len(new) else MISSING
+            _diff_value(a, b, f"{path}[{i}]", changes)
+    elif old is MISSING:
+        changes.append({"path": path, "kind": "added", "old": None, "new": new})
+    elif new is MISSING:
+        changes.append({"path": path, "kind": "removed", "old": old, "new": None})
+    elif old != new or type(old) is not type(new):
+        changes.append({"path": path, "kind": "changed", "old": old, "new": new})
+
+
+class SaveTree:
+    """
+    One side of a comparison: a save, the initial backup or a feature snapshot.
+
+    When a manifest is available its sizes and digests are used directly,
+    so only files whose size matches but content might differ get hashed.
+    """
+
+    def __init__(self, root: Path, roots: Optional[Iterable[str]] = None,
+                 exclude: Iterable[str] = (), use_manifest: bool = False):
+        self.root = root
+        self.roots = list(roots) if roots else None
+        self.exclude = set(exclude)
+        self.manifest = None
+        if use_manifest:
+            try:
+                with open(root / MANIFEST_FILE, 'r', encoding='utf-8') as f:
+                    self.manifest = json.load(f).get("files")
+            except (FileNotFoundError, json.JSONDecodeError):
+                self.manifest = None
+
+    def _in_scope(self, rel: str) -> bool:
+        if self.roots is None:
+            return True
+        return any(rel == root or rel.startswith(root + "/") for root in self.roots)
+
+    def files(self) -> Dict[str, int]:
+        """{relative path: size} for every file in scope."""
+        if self.manifest is not None:
+            return {rel: entry["size"] for rel, entry in self.manifest.items() if self._in_scope(rel)}
+        if self.roots is None:
+            rel_paths = list_files(self.root, self.exclude)
+        else:
+            rel_paths = []
+            for root in self.roots:
+                path = self.root / root
+                if path.is_file():
+                    rel_paths.append(root)
+                elif path.is_dir():
+                    rel_paths.extend(f"{root}/{rel}" for rel in list_files(path))
+        sizes = {}
+        for rel in rel_paths:
+            try:
+                sizes[rel] = os.path.getsize(self.root / rel)
+            except OSError:
+                continue
+        return sizes
+
+    def digest(self, rel: str, cache: DigestCache) -> Optional[str]:
+        if self.manifest is not None and rel in self.manifest:
+            return self.manifest[rel].get("sha256")
+        return cache.digest(self.root / rel)
+
+    def load(self, rel: str):
+        with open(self.root / rel, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+
+def diff_trees(old: SaveTree, new: SaveTree, cache: Optional[DigestCache] = None) -> List[dict]:
+    """
+    Compare two save trees file by file.
+
+    Files with identical digests are skipped without being parsed. The rest are
+    diffed structurally when both sides are JSON.
+
+    Returns:
+        list[dict]: One entry per differing file with "path", "status"
+        ("added", "removed" or "modified") and "changes" (see diff_json).
+    """
+    cache = cache or DigestCache()
+    old_files, new_files = old.files(), new.files()
+    results = []
+    for rel in sorted(old_files.keys() | new_files.keys()):
+        if rel not in new_files:
+            results.append({"path": rel, "status": "removed", "changes": []})
+            continue
+        if rel not in old_files:
+            results.append({"path": rel, "status": "added", "changes": []})
+            continue
+        if old_files[rel] == new_files[rel] and old.digest(rel, cache) == new.digest(rel, cache):
+            continue
+        try:
+            changes = diff_json(old.load(rel), new.load(rel))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            changes = [{"path": "", "kind": "changed", "old": "(binary or invalid JSON)", "new": None}]
+        except OSError as e:
+            changes = [{"path": "", "kind": "changed", "old": f"(unreadable: {e})", "new": None}]
+        if changes:
+            results.append({"path": rel, "status": "modified", "changes": changes})
+    return results
@@ -0,0 +1,263 @@
+import json, os, threading
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+USER_AGENT = "Schedule-1-Save-Editor"
+CHUNK_SIZE = 64 * 1024
+MAX_REDIRECTS = 5
+
+# http.client pulls in the email package and hashlib loads OpenSSL, so both are imported
+# on first use rather than at startup. The editor only downloads on demand.
+
+
+class DownloadError(Exception):
+    pass
+
+
+class DownloadCancelled(DownloadError):
+    pass
+
+
+class DownloadManager:
+    """
+    Streams files over keep-alive connections, one per host, and reuses them across downloads.
+
+    Downloads go to "<dest>.part" and are resumed with a Range request when a partial file
+    is left behind by a cancel or dropped connection. "<dest>.part.json" records the URL and
+    the ETag or Last-Modified the partial came from; a resume sends it as If-Range, and a
+    partial from another URL or without a validator is thrown away. The finished file is
+    checked against an optional SHA-256 before it replaces dest.
+    """
+
+    def __init__(self, timeout: float = 30, retries: int = 3, chunk_size: int = CHUNK_SIZE):
+        self.timeout = timeout
+        self.retries = retries
+        self.chunk_size = chunk_size
+        self._connections: Dict[Tuple[str, str], "http.client.HTTPConnection"] = {}
+        self._lock = threading.Lock()
+
+    def _connection(self, scheme: str, netloc: str) -> "http.client.HTTPConnection":
+        import http.client
+        key = (scheme, netloc)
+        conn = self._connections.get(key)
+        if conn is None:
+            if scheme == "https":
+                conn = http.client.HTTPSConnection(netloc, timeout=self.timeout)
+            elif scheme == "http":
+                conn = http.client.HTTPConnection(netloc, timeout=self.timeout)
+            else:
+                raise DownloadError(f"Unsupported URL scheme: {scheme}")
+            self._connections[key] = conn
+        return conn
+
+    def _drop(self, scheme: str, netloc: str):
+        conn = self._connections.pop((scheme, netloc), None)
+        if conn:
+            conn.close()
+
+    def _send(self, url: str, headers: Dict[str, str]) -> Tuple["http.client.HTTPResponse", str]:
+        """GET a URL, following redirects. Returns the response and the URL that answered."""
+        import http.client
+        for _ in range(MAX_REDIRECTS + 1):
+            parts = urlsplit(url)
+            path = parts.path or "/"
+            if parts.query:
+                path += "?" + parts.query
+            request_headers = {"User-Agent": USER_AGENT, **headers}
+            for attempt in range(2):
+                conn = self._connection(parts.scheme, parts.netloc)
+                try:
+                    conn.request("GET", path, headers=request_headers)
+                    response = conn.getresponse()
+                    break
+                except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                    # The server closed an idle keep-alive connection; reconnect once
+                    self._drop(parts.scheme, parts.netloc)
+                    if attempt:
+                        raise
+            if response.status in (301, 302, 303, 307, 308):
+                location = response.getheader("Location")
+                response.read()
+                if not location:
+                    raise DownloadError(f"Redirect without a location from {url}")
+                url = urljoin(url, location)
+                continue
+            return response, url
+        raise DownloadError(f"Too many redirects for {url}")
+
+    def download(self, url: str, dest: Path, sha256: Optional[str] = None,
+                 progress: Optional[Callable[[int, Optional[int]], None]] = None,
+                 cancelled: Optional[Callable[[], bool]] = None) -> Path:
+        """
+        Download url to dest.
+
+        Args:
+            sha256: Expected hex digest. A mismatch deletes the partial file and raises DownloadError.
+            progress: Called as progress(received, total) after every chunk. total is None when
+                the server sends no length.
+            cancelled: Polled between chunks; returning True stops the download and keeps the
+                partial file so the next call resumes it.
+
+        Returns:
+            Path: dest.
+        """
+        import http.client
+        dest = Path(dest)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        partial = dest.with_name(dest.name + ".part")
+        with self._lock:
+            for attempt in range(self.retries + 1):
+                try:
+                    self._fetch(url, partial, progress, cancelled)
+                    break
+                except (OSError, http.client.HTTPException) as e:
+                    # abort() makes the blocked read fail; that is a cancel, not a dropped connection
+                    if cancelled and cancelled():
+                        self._close_connections()
+                        raise DownloadCancelled("Download canceled") from e
+                    # Resume from whatever reached the partial file on fresh connections
+                    self._close_connections()
+                    if attempt == self.retries:
+                        raise DownloadError(f"Failed to download {url}: {e}") from e
+
+        if sha256:
+            import hashlib
+            digest = hashlib.sha256()
+            with open(partial, 'rb') as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                    digest.update(chunk)
+            if digest.hexdigest().lower() != sha256.lower():
+                self._discard(partial)
+                raise DownloadError(f"Checksum mismatch for {dest.name}")
+        os.replace(partial, dest)
+        _meta_path(partial).unlink(missing_ok=True)
+        return dest
+
+    def _fetch(self, url: str, partial: Path, progress, cancelled):
+        import http.client
+        offset = partial.stat().st_size if partial.exists() else 0
+        validator = _read_meta(partial, url) if offset else None
+        if offset and not validator:
+            # Left behind by another URL, or the server gave nothing to check a resume against
+            self._discard(partial)
+            offset = 0
+        headers = {"Range": f"bytes={offset}-", "If-Range": validator} if offset else {}
+        response, final_url = self._send(url, headers)
+        final = urlsplit(final_url)
+
+        if response.status == 416 and offset:
+            response.read()
+            # Nothing left to fetch only if the partial is exactly as long as the file
+            if _content_range(response)[2] == offset:
+                return
+            self._discard(partial)
+            return self._fetch(url, partial, progress, cancelled)
+        if response.status == 200:
+            # Either a fresh download or If-Range found the file changed; start over
+            offset = 0
+        elif response.status == 206:
+            start, _, size = _content_range(response)
+            if start != offset:
+                self._drop(final.scheme, final.netloc)
+                # Not the bytes that follow the partial file; fetch the whole file again
+                self._discard(partial)
+                return self._fetch(url, partial, progress, cancelled)
+        else:
+            response.read()
+            raise DownloadError(f"HTTP {response.status} {response.reason} for {url}")
+
+        if response.status == 206 and size is not None:
+            total = size
+        else:
+            length = response.getheader("Content-Length")
+            total = offset + int(length) if length and length.isdigit() else None
+        _write_meta(partial, url, _validator(response) or (validator if response.status == 206 else None))
+        received = offset
+        with open(partial, 'ab' if offset else 'wb') as out:
+            while True:
+                if cancelled and cancelled():
+                    # The rest of the body is unread, so this connection cannot be reused
+                    self._drop(final.scheme, final.netloc)
+                    raise DownloadCancelled("Download canceled")
+                chunk = response.read(self.chunk_size)
+                if not chunk:
+                    break
+                out.write(chunk)
+                received += len(chunk)
+                if progress:
+                    progress(received, total)
+        if total is not None and received < total:
+            raise http.client.IncompleteRead(b'', total - received)
+        if response.will_close:
+            self._drop(final.scheme, final.netloc)
+
+    @staticmethod
+    def _discard(partial: Path):
+        partial.unlink(missing_ok=True)
+        _meta_path(partial).unlink(missing_ok=True)
+
+    def _close_connections(self):
+        for conn in self._connections.values():
+            conn.close()
+        self._connections.clear()
+
+    def abort(self):
+        """
+        Shut down the open connections so a read blocked in another thread fails at once
+        instead of waiting out the timeout. The downloading thread then raises
+        DownloadCancelled if its cancelled() callback returns True.
+        """
+        import socket
+        for conn in list(self._connections.values()):
+            sock = conn.sock
+            if sock is not None:
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+
+    def close(self):
+        with self._lock:
+            self._close_connections()
+
+
+def _meta_path(partial: Path) -> Path:
+    return partial.with_name(partial.name + ".json")
+
+
+def _read_meta(partial: Path, url: str) -> Optional[str]:
+    """The validator recorded for a partial file, or None if it came from a different URL."""
+    try:
+        with open(_meta_path(partial), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(meta, dict) or meta.get("url") != url:
+        return None
+    return meta.get("validator")
+
+
+def _write_meta(partial: Path, url: str, validator: Optional[str]):
+    with open(_meta_path(partial), 'w', encoding='utf-8') as f:
+        json.dump({"url": url, "validator": validator}, f)
+
+
+def _validator(response) -> Optional[str]:
+    # If-Range needs a strong validator; weak ETags fall back to Last-Modified
+    etag = response.getheader("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return response.getheader("Last-Modified")
+
+
+def _content_range(response) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+    """(first byte, last byte, full size) from "Content-Range: bytes a-b/n" or "bytes */n"; None for any part missing."""
+    value = (response.getheader("Content-Range") or "").strip()
+    unit, _, spec = value.partition(" ")
+    if unit.lower() != "bytes":
+        return None, None, None
+    span, _, size = spec.partition("/")
+    first, _, last = span.partition("-")
+    as_int = lambda text: int(text) if text.strip().isdigit() else None
+    return as_int(first), as_int(last), as_int(size)
@@ -0,0 +1,98 @@
+import threading, time
+from typing import Optional
+
+from PySide6.QtCore import Qt, QCoreApplication, QObject, QThread, QTimer, Signal
+
+GAME_PROCESS_NAME = "Schedule I"
+POLL_INTERVAL_MS = 2000  # How often the monitor thread wakes up
+SCAN_INTERVAL = 10.0  # Seconds between full process scans while the game is not running
+
+
+class GameMonitor(QObject):
+    """
+    Tracks whether the game is running without scanning every process each time.
+
+    A full scan happens only while the game has not been found, at most once per
+    SCAN_INTERVAL. Once found, the monitor keeps the psutil.Process and only checks
+    that this PID is still alive, which psutil does by comparing the process creation
+    time, so a reused PID is not mistaken for the game.
+
+    Polling, including the PID check, runs on its own thread. The GUI reads the cached
+    state through is_running() and can react to running_changed.
+    """
+
+    running_changed = Signal(bool)
+
+    def __init__(self, process_name: str = GAME_PROCESS_NAME, interval: int = POLL_INTERVAL_MS,
+                 scan_interval: float = SCAN_INTERVAL, parent=None):
+        super().__init__(parent)
+        self.process_name = process_name
+        self.scan_interval = scan_interval
+        self.running = False
+        self._process = None
+        self._last_scan: Optional[float] = None
+        self._lock = threading.Lock()
+
+        self._thread = QThread(self)
+        self._timer = QTimer()
+        self._timer.setInterval(interval)
+        self._timer.moveToThread(self._thread)
+        # Direct connections so poll() runs on the monitor thread, not queued to the GUI thread
+        # this object lives in. running_changed still reaches GUI slots queued.
+        self._timer.timeout.connect(self.poll, Qt.DirectConnection)
+        self._thread.started.connect(self.poll, Qt.DirectConnection)
+        self._thread.started.connect(self._timer.start)
+        # The timer belongs to the monitor thread and goes away with it
+        self._thread.finished.connect(self._timer.deleteLater)
+
+    def start(self):
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.stop)  # Never leave the thread running at exit
+        self._thread.start()
+
+    def stop(self):
+        self._thread.quit()
+        self._thread.wait()
+
+    def is_running(self) -> bool:
+        """The state as of the last poll. Takes no lock and makes no psutil calls, so the GUI never waits."""
+        return self.running
+
+    def poll(self):
+        """Revalidate the known PID, or scan for the game if its scan interval has passed."""
+        # psutil runs outside the lock; only the result is swapped in under it
+        process = self._process
+        if process is not None and not self._alive(process):
+            process = None
+        if process is None:
+            now = time.monotonic()
+            if self._last_scan is None or now - self._last_scan >= self.scan_interval:
+                self._last_scan = now
+                process = self._find()
+        with self._lock:
+            self._process = process
+            self._set_running(process is not None)
+
+    @staticmethod
+    def _alive(process) -> bool:
+        import psutil
+        try:
+            return process.is_running() and process.status() != psutil.STATUS_ZOMBIE
+        except psutil.Error:
+            return False
+
+    def _find(self):
+        import psutil
+        try:
+            for proc in psutil.process_iter(['name']):
+                if self.process_name in (proc.info['name'] or ""):
+                    return proc
+        except Exception as e:
+            print(f"Error checking for running processes: {e}")
+        return None
+
+    def _set_running(self, running: bool):
+        if running != self.running:
+            self.running = running
+            self.running_changed.emit(running)
@@ -0,0 +1,311 @@
+import json
+from collections.abc import Mapping
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QFont, QIntValidator
+from PySide6.QtWidgets import QComboBox, QLineEdit, QStyledItemDelegate
+
+from lib import records
+
+PRODUCT_TYPES = ("WeedData", "CocaineData", "MethData")
+QUALITIES = ["Trash", "Poor", "Standard", "Premium", "Heavenly"]
+PACKAGINGS = ["none", "baggie", "jar"]
+
+
+class InventoryModel(QAbstractTableModel):
+    """
+    Table model over the JSON item strings of an inventory.
+
+    Items are decoded only when a row is first displayed, into slotted records for the
+    common item types, and only edited rows are re-encoded on save, so large stacks open
+    instantly and untouched items (including ones that fail to decode) are written back
+    byte for byte.
+    """
+
+    HEADERS = ["Item Type", "ID", "Quantity", "Quality", "PackagingID"]
+    FIELDS = ["DataType", "ID", "Quantity", "Quality", "PackagingID"]
+    DEFAULTS = {"DataType": "Unknown", "ID": "Unknown", "Quantity": 0, "Quality": "Standard", "PackagingID": "none"}
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._strings: List[Optional[str]] = []  # None once a row has been edited
+        self._records: List[Optional[Mapping]] = []
+
+    def load(self, items: Sequence[str]):
+        """Replace the rows with the given item strings."""
+        self.beginResetModel()
+        self._strings = [item if isinstance(item, str) else json.dumps(item) for item in items]
+        self._records = [None] * len(self._strings)
+        self.endResetModel()
+
+    def record(self, row: int) -> Mapping:
+        record = self._records[row]
+        if record is None:
+            try:
+                record = records.loads(self._strings[row])
+            except json.JSONDecodeError:
+                record = None
+            if not isinstance(record, Mapping):
+                record = {}
+            self._records[row] = record
+        return record
+
+    def items(self) -> List[str]:
+        """The inventory as item strings, re-encoding only rows that were edited."""
+        return [item if item is not None else records.dumps(self._records[row])
+                for row, item in enumerate(self._strings)]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._strings)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def _is_product(self, row: int) -> bool:
+        return self.record(row).get("DataType") in PRODUCT_TYPES
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        row, column = index.row(), index.column()
+        if column >= 3 and not self._is_product(row):
+            return "N/A"
+        field = self.FIELDS[column]
+        value = self.record(row).get(field)
+        if value is None or (value == "" and column >= 3):
+            value = self.DEFAULTS[field]
+        return str(value)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if index.column() < 3 or self._is_product(index.row()):
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        row, column = index.row(), index.column()
+        field = self.FIELDS[column]
+        if field == "Quantity":
+            try:
+                value = int(value)
+            except (TypeError, ValueError):
+                return False
+        record = self.record(row)
+        if record.get(field) == value:
+            return False
+        record[field] = value
+        if field == "DataType":
+            if value in PRODUCT_TYPES:
+                record.setdefault("Quality", "Standard")
+                record.setdefault("PackagingID", "none")
+            else:
+                record.pop("Quality", None)
+                record.pop("PackagingID", None)
+        self._strings[row] = None  # Mark the row for re-encoding
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+        return True
+
+    def insert_item(self, item: Dict) -> int:
+        row = len(self._strings)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._strings.append(None)
+        self._records.append(dict(item))
+        self.endInsertRows()
+        return row
+
+    def remove_item(self, row: int):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._strings[row]
+        del self._records[row]
+        self.endRemoveRows()
+
+
+class ChoiceDelegate(QStyledItemDelegate):
+    """Edits a cell with a combo box of fixed choices."""
+
+    def __init__(self, choices: Sequence[str], parent=None):
+        super().__init__(parent)
+        self.choices = list(choices)
+
+    def createEditor(self, parent, option, index):
+        editor = QComboBox(parent)
+        editor.addItems(self.choices)
+        # Commit as soon as a choice is picked, like the old always-visible combo boxes
+        editor.activated.connect(lambda: self.commitData.emit(editor))
+        return editor
+
+    def setEditorData(self, editor, index):
+        editor.setCurrentText(index.data(Qt.EditRole))
+
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.currentText(), Qt.EditRole)
+
+
+class IntegerDelegate(QStyledItemDelegate):
+    """Edits a cell with a line edit that only accepts non-negative integers."""
+
+    def __init__(self, maximum: int = 2**31 - 1, parent=None):
+        super().__init__(parent)
+        self.maximum = maximum
+
+    def createEditor(self, parent, option, index):
+        editor = QLineEdit(parent)
+        editor.setValidator(QIntValidator(0, self.maximum, editor))
+        return editor
+
+    def setEditorData(self, editor, index):
+        editor.setText(index.data(Qt.EditRole))
+
+    def setModelData(self, editor, model, index):
+        if editor.hasAcceptableInput():
+            model.setData(index, editor.text(), Qt.EditRole)
+
+
+SEED_IDS = ["ogkushseed", "sourdieselseed", "greencrackseed", "granddaddypurpleseed"]
+POT_QUALITIES = ["trash", "poor", "standard", "premium", "heavenly"]
+GROWTH_STAGES = ["not grown", "abit grown", "medium grown", "near grown", "fully grown"]
+LEVEL_VALUES = [0.15, 0.35, 0.55, 0.75, 0.95]
+
+
+def level_label(value, labels: Sequence[str]) -> str:
+    """Map a 0-1 plant level to its label: 0.1-0.2 is the first label, 0.3-0.4 the second and so on."""
+    for i, label in enumerate(labels):
+        low = round(0.1 + 0.2 * i, 1)
+        if low <= value <= round(low + 0.1, 1):
+            return label
+    return "unknown"
+
+
+def level_value(label: str, labels: Sequence[str]) -> float:
+    return LEVEL_VALUES[labels.index(label)] if label in labels else 0.0
+
+
+class PlasticPotModel(QAbstractTableModel):
+    """
+    Table model over plastic pots as returned by SaveManager.get_plastic_pots.
+
+    Edits are kept per row until saved, so only the pots that were actually changed
+    need to be written.
+    """
+
+    HEADERS = ["Property Type", "Object ID", "SeedID", "QualityLevel", "GrowthProgress", "RemainingSoilUses"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pots: List[dict] = []
+        self._edits: Dict[int, Dict[int, object]] = {}
+
+    def load(self, pots: List[dict]):
+        self.beginResetModel()
+        self._pots = pots
+        self._edits = {}
+        self.endResetModel()
+
+    def _value(self, row: int, column: int) -> str:
+        pot = self._pots[row]
+        if column == 0:
+            return pot['property_type']
+        if column == 1:
+            return pot['object_id']
+        plant_data = pot['data'].get("PlantData") or {}
+        if column == 2:
+            return plant_data.get("SeedID", "")
+        if column == 3:
+            return level_label(plant_data.get("QualityLevel", 0.0), POT_QUALITIES)
+        if column == 4:
+            return level_label(plant_data.get("GrowthProgress", 0.0), GROWTH_STAGES)
+        return str(pot['data'].get("RemainingSoilUses", 0))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._pots)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            edits = self._edits.get(row, {})
+            return str(edits[column]) if column in edits else self._value(row, column)
+        if role == Qt.FontRole and row in self._edits:
+            font = QFont()
+            font.setBold(True)  # Unsaved rows stand out
+            return font
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if index.column() >= 2:
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole or index.column() < 2:
+            return False
+        row, column = index.row(), index.column()
+        if column == 5:
+            try:
+                value = int(value)
+            except (TypeError, ValueError):
+                return False
+        if str(value) == self.data(index, Qt.EditRole):
+            return False
+        self._edits.setdefault(row, {})[column] = value
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+        return True
+
+    def dirty_pots(self) -> List[Tuple[dict, Dict[int, object]]]:
+        """Each modified pot with its pending edits, keyed by column."""
+        return [(self._pots[row], edits) for row, edits in sorted(self._edits.items())]
+
+    def mark_saved(self):
+        rows = list(self._edits)
+        self._edits = {}
+        for row in rows:
+            self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+
+    @staticmethod
+    def apply_edits(data: dict, edits: Dict[int, object]) -> dict:
+        """Write pending edits into a pot's Data.json contents."""
+        # Clean up incorrect root-level fields written by older versions
+        for field in ["SeedID", "QualityLevel", "GrowthProgress"]:
+            data.pop(field, None)
+        if "PlantData" not in data:
+            data["PlantData"] = {
+                "DataType": "PlantData",
+                "DataVersion": 0,
+                "GameVersion": "0.3.3f15",
+                "SeedID": "",
+                "GrowthProgress": 0.0,
+                "YieldLevel": 0.0,
+                "QualityLevel": 0.0,
+                "ActiveBuds": []
+            }
+        if 2 in edits:
+            data["PlantData"]["SeedID"] = edits[2]
+        if 3 in edits:
+            data["PlantData"]["QualityLevel"] = level_value(edits[3], POT_QUALITIES)
+        if 4 in edits:
+            data["PlantData"]["GrowthProgress"] = level_value(edits[4], GROWTH_STAGES)
+        if 5 in edits:
+            data["RemainingSoilUses"] = edits[5]
+        return data
@@ -0,0 +1,83 @@
+import json
+from pathlib import Path
+from typing import Dict, List, Optional
+
+NPC_FILE = "NPC.json"
+RELATIONSHIP_FILE = "Relationship.json"
+DEALER_DATA = "DealerData"
+
+
+def _read_json(path: Path) -> Optional[dict]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+class NPCIndex:
+    """
+    Summary of every NPCs/<name> folder, read once per save.
+
+    Each entry is a dict with "data_type", "id", "recruited" and "cash" from NPC.json
+    (None when the file is missing) and "relationship", the RelationDelta, Unlocked
+    and UnlockType of Relationship.json (None when there is no such file).
+
+    The folders are scanned on first use. Afterwards update() re-reads a single NPC
+    after it is written, and invalidate() drops everything so the next lookup rescans,
+    e.g. after a revert or a template install.
+    """
+
+    def __init__(self, npcs_dir: Path):
+        self.npcs_dir = npcs_dir
+        self._npcs: Optional[Dict[str, dict]] = None
+
+    def _entries(self) -> Dict[str, dict]:
+        if self._npcs is None:
+            npcs = {}
+            if self.npcs_dir.is_dir():
+                for folder in sorted(self.npcs_dir.iterdir()):
+                    if folder.is_dir():
+                        npcs[folder.name] = self._read(folder)
+            self._npcs = npcs
+        return self._npcs
+
+    @staticmethod
+    def _read(folder: Path) -> dict:
+        npc = _read_json(folder / NPC_FILE) or {}
+        relationship = _read_json(folder / RELATIONSHIP_FILE)
+        return {
+            "data_type": npc.get("DataType"),
+            "id": npc.get("ID"),
+            "recruited": npc.get("Recruited"),
+            "cash": npc.get("Cash"),
+            "relationship": None if relationship is None else {
+                key: relationship.get(key) for key in ("RelationDelta", "Unlocked", "UnlockType")
+            },
+        }
+
+    def invalidate(self):
+        self._npcs = None
+
+    def update(self, name: str):
+        """Re-read one NPC after its files were written. Nothing happens until the index is first used."""
+        if self._npcs is None:
+            return
+        folder = self.npcs_dir / name
+        if folder.is_dir():
+            npcs = self._npcs
+            npcs[name] = self._read(folder)
+            if list(npcs) != sorted(npcs):
+                self._npcs = dict(sorted(npcs.items()))
+        else:
+            self._npcs.pop(name, None)
+
+    def get(self, name: str) -> Optional[dict]:
+        return self._entries().get(name)
+
+    def names(self) -> List[str]:
+        return list(self._entries())
+
+    def dealers(self) -> List[str]:
+        return [name for name, npc in self._entries().items() if npc["data_type"] == DEALER_DATA]
@@ -0,0 +1,108 @@
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from lib import records
+
+OBJECTS_DIR = "Objects"
+DATA_FILE = "Data.json"
+PLASTIC_POT = "plasticpot"
+
+
+def object_type(object_id: str) -> str:
+    """The type prefix of an object folder name, e.g. plasticpot for plasticpot_46b275."""
+    return object_id.rsplit("_", 1)[0]
+
+
+class PropertyIndex:
+    """
+    Properties/<property>/Objects/<type>_<id> folders grouped by property and object type.
+
+    The folder listing is read on first use; each object's Data.json is parsed the first
+    time it is asked for and then kept, so switching between properties reuses parsed
+    data. Objects parse through lib.records, so plant data stays compact.
+
+    update() re-checks one object (or a whole property) after a write, and
+    invalidate() forgets everything, e.g. after a revert.
+    """
+
+    def __init__(self, properties_dir: Path):
+        self.properties_dir = properties_dir
+        self._objects: Optional[Dict[str, Dict[str, List[str]]]] = None  # property -> type -> object IDs
+        self._data: Dict[Tuple[str, str], Optional[dict]] = {}
+
+    def _listing(self) -> Dict[str, Dict[str, List[str]]]:
+        if self._objects is None:
+            objects = {}
+            if self.properties_dir.is_dir():
+                for prop_dir in sorted(self.properties_dir.iterdir()):
+                    if prop_dir.is_dir():
+                        objects[prop_dir.name] = self._scan(prop_dir.name)
+            self._objects = objects
+        return self._objects
+
+    def _scan(self, prop: str) -> Dict[str, List[str]]:
+        by_type: Dict[str, List[str]] = {}
+        objects_path = self.properties_dir / prop / OBJECTS_DIR
+        if objects_path.is_dir():
+            for obj_dir in sorted(objects_path.iterdir()):
+                if obj_dir.is_dir():
+                    by_type.setdefault(object_type(obj_dir.name), []).append(obj_dir.name)
+        return by_type
+
+    def invalidate(self):
+        self._objects = None
+        self._data.clear()
+
+    def update(self, prop: str, object_id: Optional[str] = None):
+        """Re-check one object after a write or, without an object, whether the property was added or removed."""
+        if object_id is not None:
+            self._data.pop((prop, object_id), None)
+        if not (self.properties_dir / prop).is_dir():
+            for key in [key for key in self._data if key[0] == prop]:
+                del self._data[key]
+            if self._objects is not None:
+                self._objects.pop(prop, None)
+            return
+        if self._objects is None:
+            return
+        if prop not in self._objects:
+            self._objects[prop] = self._scan(prop)
+            self._objects = dict(sorted(self._objects.items()))
+        elif object_id is not None:
+            ids = self._objects[prop].setdefault(object_type(object_id), [])
+            exists = (self.properties_dir / prop / OBJECTS_DIR / object_id).is_dir()
+            if exists and object_id not in ids:
+                ids.append(object_id)
+                ids.sort()
+            elif not exists and object_id in ids:
+                ids.remove(object_id)
+
+    def properties(self) -> List[str]:
+        return list(self._listing())
+
+    def objects(self, prop: Optional[str] = None, kind: Optional[str] = None) -> List[Tuple[str, str]]:
+        """(property, object ID) pairs, optionally limited to one property and/or one object type."""
+        listing = self._listing()
+        props = [prop] if prop else list(listing)
+        return [(p, object_id)
+                for p in props
+                for k, ids in listing.get(p, {}).items() if kind is None or k == kind
+                for object_id in ids]
+
+    def data_path(self, prop: str, object_id: str) -> Path:
+        return self.properties_dir / prop / OBJECTS_DIR / object_id / DATA_FILE
+
+    def data(self, prop: str, object_id: str) -> Optional[dict]:
+        """
+        An object's parsed Data.json, or None if it is missing or not valid JSON.
+
+        The cached object itself is returned. Callers that change it must write it
+        back; the write path then calls update() so the next call re-reads the file.
+        """
+        key = (prop, object_id)
+        if key not in self._data:
+            try:
+                self._data[key] = records.load(self.data_path(prop, object_id))
+            except (OSError, UnicodeDecodeError, ValueError):
+                self._data[key] = None
+        return self._data[key]
@@ -0,0 +1,137 @@
+import json
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+QUESTS_DIR = "Quests"
+QUEST_DATA = "QuestData"
+NOT_STARTED, IN_PROGRESS, COMPLETED = 0, 1, 2
+STATE_NAMES = {NOT_STARTED: "Not started", IN_PROGRESS: "In progress", COMPLETED: "Completed",
+               3: "Failed", 4: "Expired", 5: "Cancelled"}
+
+Match = Tuple[str, dict, Optional[List[int]]]  # (file, quest data, entry indices or None for the whole quest)
+
+
+def state_name(state) -> str:
+    return STATE_NAMES.get(state, str(state))
+
+
+def _changes_state(current, state: int) -> bool:
+    # Completing leaves finished quests (completed, failed, expired) alone, like the game would
+    if state == COMPLETED:
+        return current in (NOT_STARTED, IN_PROGRESS)
+    return current != state
+
+
+def changes(data: dict, entries: Optional[List[int]], state: int) -> Tuple[bool, List[int]]:
+    """
+    What setting state would change in one quest: (whether the quest's own State changes,
+    indices of the objectives that change). entries=None means the quest and all its objectives.
+    """
+    objectives = data.get("Entries") or []
+    indices = range(len(objectives)) if entries is None else entries
+    return (entries is None and _changes_state(data.get("State"), state),
+            [i for i in indices if _changes_state(objectives[i].get("State"), state)])
+
+
+def _matches(pattern: str, *names) -> bool:
+    pattern = pattern.lower()
+    return any(name and fnmatchcase(str(name).lower(), pattern) for name in names)
+
+
+class QuestIndex:
+    """
+    Every QuestData file under Quests/, parsed once per save.
+
+    Quests are selected by "<quest>" or "<quest>/<objective>", each part an exact name or
+    an fnmatch pattern compared case-insensitively. A quest matches by Title, GUID or file
+    name (e.g. Quest_004e14), an objective by its Name; "*" selects every quest.
+
+    Other files under Quests/ (contracts and the like) are read once and left out.
+    update() re-reads one file after it is written; invalidate() forgets everything.
+    """
+
+    def __init__(self, save_root: Path):
+        self.save_root = save_root
+        self._quests: Optional[Dict[str, dict]] = None  # file relative to the save -> quest data
+
+    def _entries(self) -> Dict[str, dict]:
+        if self._quests is None:
+            quests = {}
+            quests_path = self.save_root / QUESTS_DIR
+            if quests_path.is_dir():
+                for path in sorted(quests_path.rglob("*.json")):
+                    rel = path.relative_to(self.save_root).as_posix()
+                    data = self._read(rel)
+                    if data is not None:
+                        quests[rel] = data
+            self._quests = quests
+        return self._quests
+
+    def _read(self, rel: str) -> Optional[dict]:
+        try:
+            with open(self.save_root / rel, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+            return None
+        return data if isinstance(data, dict) and data.get("DataType") == QUEST_DATA else None
+
+    def invalidate(self):
+        self._quests = None
+
+    def update(self, rel: str):
+        """Re-read one quest file, relative to the save, after it was written or removed."""
+        if self._quests is None:
+            return
+        rel = Path(rel).as_posix()
+        data = self._read(rel)
+        if data is None:
+            self._quests.pop(rel, None)
+        else:
+            self._quests[rel] = data
+            if list(self._quests) != sorted(self._quests):
+                self._quests = dict(sorted(self._quests.items()))
+
+    def quests(self) -> List[Tuple[str, dict]]:
+        """(file, parsed contents) for every quest. The contents are the cached objects."""
+        return list(self._entries().items())
+
+    def select(self, selector: str) -> List[Match]:
+        """
+        The quests, or objectives within them, picked by selector.
+
+        Returns (file, quest data, objective indices) per matching quest; the indices
+        are None when the selector names whole quests. Quests with no matching
+        objective are left out.
+        """
+        quest_pattern, has_objective, objective_pattern = (part.strip() for part in selector.partition("/"))
+        selected = []
+        for rel, data in self._entries().items():
+            if not _matches(quest_pattern or "*", data.get("Title"), data.get("GUID"), Path(rel).stem):
+                continue
+            if not has_objective:
+                selected.append((rel, data, None))
+                continue
+            entries = [i for i, entry in enumerate(data.get("Entries") or [])
+                       if _matches(objective_pattern or "*", entry.get("Name"))]
+            if entries:
+                selected.append((rel, data, entries))
+        return selected
+
+    def describe(self, selector: str = "*") -> List[dict]:
+        """
+        Selected quests as dicts with "file", "title", "guid", "state" and "entries",
+        a list of {"name", "state"} for the selected objectives.
+        """
+        described = []
+        for rel, data, entries in self.select(selector):
+            objectives = data.get("Entries") or []
+            indices = range(len(objectives)) if entries is None else entries
+            described.append({
+                "file": rel,
+                "title": data.get("Title") or Path(rel).stem,
+                "guid": data.get("GUID"),
+                "state": data.get("State"),
+                "entries": [{"name": objectives[i].get("Name"), "state": objectives[i].get("State")} for i in indices],
+            })
+        return described
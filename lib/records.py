@@ -0,0 +1,348 @@
+import json
+from collections.abc import Mapping, MutableMapping
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Type
+
+COMMON_FIELDS = ("DataType", "DataVersion", "GameVersion")
+INTERN_MAX_LENGTH = 32
+
+
+class Record(MutableMapping):
+    """
+    Compact, slotted stand-in for a decoded JSON object of a known DataType.
+
+    Known fields live in __slots__ instead of a per-object dict. Fields the class does not
+    know are kept in _extra, and _order is set only when the original key order differs
+    from FIELDS order, so encoding a record gives back exactly the object it was read from.
+
+    Records behave like dicts (get, setdefault, pop, items, ==), so code written against
+    the parsed JSON works unchanged. json.dump needs default=encode to write them.
+    """
+
+    __slots__ = ("_extra", "_order")
+    FIELDS: Tuple[str, ...] = ()
+    _known = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._known = frozenset(cls.FIELDS)
+
+    def __init__(self, data: Optional[Mapping] = None, **kwargs):
+        self._extra = None
+        self._order = None
+        for key, value in (dict(data or {}, **kwargs)).items():
+            self[key] = value
+
+    @classmethod
+    def from_pairs(cls, pairs: List[Tuple[str, object]]) -> "Record":
+        record = cls.__new__(cls)
+        extra = None
+        known = cls._known
+        for key, value in pairs:
+            if key in known:
+                setattr(record, key, value)
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+        record._extra = extra
+        record._order = None
+        keys = [key for key, _ in pairs]
+        if keys != record._canonical_order():
+            record._order = tuple(keys)
+        return record
+
+    def _canonical_order(self) -> List[str]:
+        keys = [field for field in self.FIELDS if hasattr(self, field)]
+        if self._extra:
+            keys.extend(self._extra)
+        return keys
+
+    def __getitem__(self, key):
+        if key in self._known:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        is_new = key not in self
+        order = list(self) if is_new else None
+        if key in self._known:
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+        if is_new:
+            # New keys go last, like in a dict
+            order.append(key)
+            self._order = None if order == self._canonical_order() else tuple(order)
+
+    def __delitem__(self, key):
+        if key in self._known and hasattr(self, key):
+            delattr(self, key)
+        elif self._extra is not None and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+        if self._order is not None:
+            order = [k for k in self._order if k != key]
+            self._order = None if order == self._canonical_order() else tuple(order)
+
+    def __contains__(self, key):
+        if key in self._known:
+            return hasattr(self, key)
+        return self._extra is not None and key in self._extra
+
+    def __iter__(self):
+        return iter(self._order if self._order is not None else self._canonical_order())
+
+    def __len__(self):
+        return sum(1 for field in self.FIELDS if hasattr(self, field)) + len(self._extra or ())
+
+    def to_dict(self) -> dict:
+        """A plain dict in the original key order. Nested records are left as they are."""
+        return {key: self[key] for key in self}
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+class ItemData(Record):
+    FIELDS = COMMON_FIELDS + ("ID", "Quantity")
+    __slots__ = FIELDS
+
+
+class WeedData(Record):
+    """Product items. Cocaine and meth items share the same layout."""
+    FIELDS = COMMON_FIELDS + ("ID", "Quantity", "Quality", "PackagingID")
+    __slots__ = FIELDS
+
+
+class CashData(Record):
+    FIELDS = COMMON_FIELDS + ("ID", "Quantity", "CashBalance")
+    __slots__ = FIELDS
+
+
+class PlantData(Record):
+    FIELDS = COMMON_FIELDS + ("SeedID", "GrowthProgress", "YieldLevel", "QualityLevel", "ActiveBuds")
+    __slots__ = FIELDS
+
+
+class QuestEntryData(Record):
+    FIELDS = COMMON_FIELDS + ("Name", "State")
+    __slots__ = FIELDS
+
+
+class QuestData(Record):
+    FIELDS = COMMON_FIELDS + ("GUID", "State", "IsTracked", "Title", "Description", "Expires",
+                              "ExpiryDate", "Entries")
+    __slots__ = FIELDS
+
+
+class RelationshipData(Record):
+    FIELDS = COMMON_FIELDS + ("RelationDelta", "Unlocked", "UnlockType")
+    __slots__ = FIELDS
+
+
+class DealerData(Record):
+    FIELDS = COMMON_FIELDS + ("ID", "Recruited", "AssignedCustomerIDs", "ActiveContractGUIDs", "Cash",
+                              "OverflowItems", "HasBeenRecommended")
+    __slots__ = FIELDS
+
+
+RECORD_TYPES: Dict[str, Type[Record]] = {
+    "ItemData": ItemData,
+    "WeedData": WeedData,
+    "CocaineData": WeedData,
+    "MethData": WeedData,
+    "CashData": CashData,
+    "PlantData": PlantData,
+    "QuestEntryData": QuestEntryData,
+    "QuestData": QuestData,
+    "RelationshipData": RelationshipData,
+    "DealerData": DealerData,
+}
+
+
+def from_pairs(pairs: List[Tuple[str, object]]):
+    """object_pairs_hook for json: known DataTypes become records, everything else a dict."""
+    for key, value in pairs:
+        if key == "DataType":
+            cls = RECORD_TYPES.get(value) if isinstance(value, str) else None
+            if cls is not None:
+                return cls.from_pairs(pairs)
+            break
+    return dict(pairs)
+
+
+def encode(obj):
+    """default= hook for json.dump/json.dumps."""
+    if isinstance(obj, Record):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class StringTable:
+    """
+    Shared pool of JSON keys and short string values.
+
+    json already shares the keys within one document, but every file (and every item
+    string) is a separate document, so "DataType", "GameVersion", "0.3.3f15", "ItemData"
+    and the like would otherwise be stored once per object. Strings longer than
+    max_length (GUIDs, descriptions, encoded items) are rarely repeated and are left alone.
+    """
+
+    def __init__(self, max_length: int = INTERN_MAX_LENGTH):
+        self.max_length = max_length
+        self._strings: Dict[str, str] = {}
+
+    def __len__(self):
+        return len(self._strings)
+
+    def intern(self, value: str) -> str:
+        return self._strings.setdefault(value, value)
+
+    def clear(self):
+        self._strings.clear()
+
+    def pairs_hook(self, base: Callable = dict) -> Callable:
+        """An object_pairs_hook that interns keys and short strings, then builds the object with base."""
+        strings, max_length = self._strings, self.max_length
+
+        def hook(pairs):
+            interned = []
+            for key, value in pairs:
+                key = strings.setdefault(key, key)
+                if type(value) is str:
+                    if len(value) <= max_length:
+                        value = strings.setdefault(value, value)
+                elif type(value) is list:
+                    for i, element in enumerate(value):
+                        if type(element) is str and len(element) <= max_length:
+                            value[i] = strings.setdefault(element, element)
+                interned.append((key, value))
+            return base(interned)
+
+        return hook
+
+
+STRINGS = StringTable()  # Shared by every load below; SaveManager clears it when it opens a save
+_load_hook = STRINGS.pairs_hook(from_pairs)
+
+
+def loads(text: str):
+    return json.loads(text, object_pairs_hook=_load_hook)
+
+
+def load(path: Path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f, object_pairs_hook=_load_hook)
+
+
+def dumps(obj, **kwargs) -> str:
+    return json.dumps(obj, default=encode, **kwargs)
+
+
+def _decode_items(obj, hook):
+    """Decode the JSON strings inside "Items" arrays too, as the editor does when it shows them."""
+    if isinstance(obj, (dict, Record)):
+        items = obj.get("Items")
+        if isinstance(items, list):
+            decoded = []
+            for item in items:
+                try:
+                    decoded.append(json.loads(item, object_pairs_hook=hook) if isinstance(item, str) else item)
+                except json.JSONDecodeError:
+                    decoded.append(item)
+            obj["Items"] = decoded
+        for value in obj.values():
+            _decode_items(value, hook)
+    elif isinstance(obj, list):
+        for value in obj:
+            _decode_items(value, hook)
+    return obj
+
+
+def load_tree(files: Iterable[Path], hook=None) -> list:
+    """Parse every file with the given object_pairs_hook (plain dicts by default), skipping invalid ones."""
+    hook = hook or dict
+    documents = []
+    for path in files:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                documents.append(_decode_items(json.load(f, object_pairs_hook=hook), hook))
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+            continue
+    return documents
+
+
+def measure(files: List[Path], make_hook: Optional[Callable[[], Callable]] = None, copies: int = 1) -> int:
+    """Bytes still allocated after loading every file copies times, including any string table the hook builds."""
+    import gc, tracemalloc
+    gc.collect()
+    tracemalloc.start()
+    hook = make_hook() if make_hook else None
+    documents = [load_tree(files, hook) for _ in range(copies)]
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del documents
+    return size
+
+
+def container_sizes(documents) -> Tuple[int, int, int]:
+    """(record count, bytes as dicts, bytes as records) for the containers of every record in documents."""
+    import sys
+    count = as_dicts = as_records = 0
+    stack = list(documents)
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, Record):
+            count += 1
+            as_dicts += sys.getsizeof(obj.to_dict())
+            as_records += sys.getsizeof(obj) + sys.getsizeof(obj._extra or None) + sys.getsizeof(obj._order)
+            stack.extend(obj.values())
+        elif isinstance(obj, dict):
+            stack.extend(obj.values())
+        elif isinstance(obj, list):
+            stack.extend(obj)
+    return count, as_dicts, as_records
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Compare memory of plain dicts, slotted records and string interning for a save.")
+    parser.add_argument("save", type=Path, help="Save folder, e.g. .../SaveGame_1")
+    parser.add_argument("--copies", type=int, default=20,
+                        help="Load the save this many times to simulate a large save (default: 20)")
+    args = parser.parse_args(argv)
+
+    files = sorted(args.save.rglob("*.json"))
+    documents = load_tree(files, StringTable().pairs_hook(from_pairs))
+    roundtrip_ok = all(
+        json.dumps(document, default=encode) == json.dumps(plain)
+        for document, plain in zip(documents, load_tree(files))
+    )
+    count, as_dicts, as_records = container_sizes(documents)
+    plain = measure(files, copies=args.copies)
+    results = [
+        ("interned dicts", measure(files, lambda: StringTable().pairs_hook(), copies=args.copies)),
+        ("records", measure(files, lambda: from_pairs, copies=args.copies)),
+        ("records+intern", measure(files, lambda: StringTable().pairs_hook(from_pairs), copies=args.copies)),
+    ]
+    print(f"{len(files)} files x {args.copies} copies")
+    print(f"  plain dicts     {plain / 1024:10.1f} KiB")
+    for label, size in results:
+        print(f"  {label:<15} {size / 1024:10.1f} KiB  ({100 * (plain - size) / plain:.1f}% less)")
+    print(f"  {count} record objects per copy: {as_dicts / 1024:.1f} KiB as dicts, {as_records / 1024:.1f} KiB "
+          f"slotted ({100 * (as_dicts - as_records) / max(as_dicts, 1):.1f}% less)")
+    print(f"  round trip    {'identical' if roundtrip_ok else 'MISMATCH'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,338 @@
+import json, os, sqlite3, sys
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+ITEMS_TABLE = "items"
+FILES_TABLE = "files"
+META_COLUMNS = ("_file", "_path", "_dirty")
+ITEM_COLUMNS = ("DataType", "ID", "Quantity", "Quality", "PackagingID")  # Always present, so product queries work on any save
+SCALARS = (str, int, float, bool, type(None))
+
+Step = object  # A dict key (str) or list index (int) on the way from the file root to an object
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def format_path(steps: Tuple[Step, ...]) -> str:
+    """steps as a JSON path in the style of lib.diff, e.g. Contents.Items[3]."""
+    path = ""
+    for step in steps:
+        if isinstance(step, int):
+            path += f"[{step}]"
+        else:
+            path = f"{path}.{step}" if path else step
+    return path
+
+
+def json_file_stats(root: Path) -> Dict[str, Tuple[int, int]]:
+    """{posix path relative to root: (size, mtime_ns)} for every .json file below root."""
+    stats = {}
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            if name.endswith(".json"):
+                path = Path(dirpath) / name
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                stats[path.relative_to(root).as_posix()] = (stat.st_size, stat.st_mtime_ns)
+    return stats
+
+
+class SaveDatabase:
+    """
+    In-memory SQLite view of a save for set-based queries and bulk edits.
+
+    Every JSON object with a DataType becomes a row in the table named after it
+    (QuestData, DealerData, ...), and every entry of an "Items" array is decoded into
+    the items table. Columns are the object's scalar fields; lists and nested objects
+    stay in the files. Each row carries _file (files.id), _path (where the object sits
+    in its file) and _dirty.
+
+    Triggers flag updated rows and their files, so write_back() rewrites only the files
+    an UPDATE touched, and only the fields whose values changed. Rows cannot be
+    inserted or deleted, and _file/_path are read-only.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        # Queries run on the task thread pool, one at a time
+        self.connection = sqlite3.connect(":memory:", check_same_thread=False)
+        self.connection.execute(f"CREATE TABLE {FILES_TABLE} (id INTEGER PRIMARY KEY, path TEXT UNIQUE NOT NULL, "
+                                "dirty INTEGER NOT NULL DEFAULT 0)")
+        self.connection.execute("CREATE TABLE _engine (indexing INTEGER NOT NULL)")
+        self.connection.execute("INSERT INTO _engine VALUES (0)")
+        self.columns: Dict[str, List[str]] = {}  # table -> field columns, in the order they were added
+        self._stats: Dict[str, Tuple[int, int]] = {}  # rel path -> (size, mtime_ns) when indexed
+        self._ids: Dict[str, int] = {}
+        # (table, rowid) -> (steps, is_item, field values as indexed), for diffing on write back
+        self._origin: Dict[Tuple[str, int], Tuple[Tuple[Step, ...], bool, Dict[str, object]]] = {}
+
+    def tables(self) -> Dict[str, List[str]]:
+        """{table: columns} for every table a query can use, files first."""
+        tables = {FILES_TABLE: ["id", "path", "dirty"]}
+        for table in sorted(self.columns, key=lambda t: (t != ITEMS_TABLE, t)):
+            tables[table] = list(META_COLUMNS) + self.columns[table]
+        return tables
+
+    # Indexing
+
+    def refresh(self, progress: Optional[Callable[[int, int], None]] = None) -> int:
+        """
+        Bring the database in line with the files on disk.
+
+        New files and files whose size or mtime changed since they were indexed are
+        (re)parsed; removed files lose their rows. Returns the number of files parsed.
+        """
+        current = json_file_stats(self.root)
+        changed = sorted(rel for rel, stat in current.items() if self._stats.get(rel) != stat)
+        removed = [rel for rel in self._stats if rel not in current]
+        if not changed and not removed:
+            return 0
+        with self.connection:
+            self.connection.execute("UPDATE _engine SET indexing = 1")
+            try:
+                for rel in removed:
+                    self._drop_file(rel)
+                    self.connection.execute(f"DELETE FROM {FILES_TABLE} WHERE id = ?", (self._ids.pop(rel),))
+                    del self._stats[rel]
+                for n, rel in enumerate(changed):
+                    if progress:
+                        progress(n, len(changed))
+                    self._index_file(rel, current[rel])
+            finally:
+                self.connection.execute("UPDATE _engine SET indexing = 0")
+        return len(changed)
+
+    def _drop_file(self, rel: str):
+        file_id = self._ids[rel]
+        for table in self.columns:
+            rowids = [row[0] for row in self.connection.execute(
+                f"SELECT rowid FROM {_quote(table)} WHERE _file = ?", (file_id,))]
+            for rowid in rowids:
+                del self._origin[(table, rowid)]
+            self.connection.execute(f"DELETE FROM {_quote(table)} WHERE _file = ?", (file_id,))
+
+    def _index_file(self, rel: str, stat: Tuple[int, int]):
+        if rel in self._ids:
+            self._drop_file(rel)
+            file_id = self._ids[rel]
+        else:
+            file_id = self.connection.execute(f"INSERT INTO {FILES_TABLE} (path) VALUES (?)", (rel,)).lastrowid
+            self._ids[rel] = file_id
+        self._stats[rel] = stat
+        try:
+            with open(self.root / rel, 'r', encoding='utf-8') as f:
+                document = json.load(f)
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+            return  # Listed in files, but nothing to query
+
+        rows: List[Tuple[str, Tuple[Step, ...], bool, Dict[str, object]]] = []
+        self._collect(document, (), rows)
+        for table, steps, is_item, values in rows:
+            self._ensure_columns(table, values)
+            columns = ["_file", "_path"] + list(values)
+            cursor = self.connection.execute(
+                f"INSERT INTO {_quote(table)} ({', '.join(map(_quote, columns))}) "
+                f"VALUES ({', '.join('?' * len(columns))})",
+                [file_id, format_path(steps), *values.values()])
+            self._origin[(table, cursor.lastrowid)] = (steps, is_item, values)
+
+    def _collect(self, obj, steps: Tuple[Step, ...], rows: list):
+        if isinstance(obj, dict):
+            data_type = obj.get("DataType")
+            if isinstance(data_type, str) and data_type:
+                rows.append((data_type, steps, False, _scalar_fields(obj)))
+            for key, value in obj.items():
+                if key == "Items" and isinstance(value, list):
+                    for i, item in enumerate(value):
+                        if isinstance(item, str):
+                            try:
+                                decoded = json.loads(item)
+                            except json.JSONDecodeError:
+                                continue
+                            if isinstance(decoded, dict):
+                                rows.append((ITEMS_TABLE, steps + (key, i), True, _scalar_fields(decoded)))
+                        else:
+                            self._collect(item, steps + (key, i), rows)
+                else:
+                    self._collect(value, steps + (key,), rows)
+        elif isinstance(obj, list):
+            for i, value in enumerate(obj):
+                self._collect(value, steps + (i,), rows)
+
+    def _ensure_columns(self, table: str, values: Dict[str, object]):
+        columns = self.columns.get(table)
+        if columns is None:
+            columns = self.columns[table] = []
+            name = _quote(table)
+            self.connection.execute(f"CREATE TABLE {name} (_file INTEGER NOT NULL, _path TEXT NOT NULL, "
+                                    "_dirty INTEGER NOT NULL DEFAULT 0)")
+            self.connection.execute(f"CREATE INDEX {_quote(table + '_file')} ON {name} (_file)")
+            self.connection.executescript(f"""
+                CREATE TRIGGER {_quote(table + '_dirty')} AFTER UPDATE ON {name} WHEN OLD._dirty = 0
+                BEGIN
+                    UPDATE {name} SET _dirty = 1 WHERE rowid = NEW.rowid;
+                    UPDATE {FILES_TABLE} SET dirty = 1 WHERE id = NEW._file;
+                END;
+                CREATE TRIGGER {_quote(table + '_location')} BEFORE UPDATE OF _file, _path ON {name}
+                BEGIN
+                    SELECT RAISE(ABORT, '_file and _path are read-only');
+                END;
+                CREATE TRIGGER {_quote(table + '_insert')} BEFORE INSERT ON {name}
+                WHEN (SELECT indexing FROM _engine) = 0
+                BEGIN
+                    SELECT RAISE(ABORT, 'rows cannot be added; edit the save and refresh instead');
+                END;
+                CREATE TRIGGER {_quote(table + '_delete')} BEFORE DELETE ON {name}
+                WHEN (SELECT indexing FROM _engine) = 0
+                BEGIN
+                    SELECT RAISE(ABORT, 'rows cannot be deleted; only UPDATE is written back');
+                END;
+            """)
+            if table == ITEMS_TABLE:
+                self._ensure_columns(table, dict.fromkeys(ITEM_COLUMNS))
+        for key in values:
+            if key not in columns:
+                self.connection.execute(f"ALTER TABLE {_quote(table)} ADD COLUMN {_quote(key)}")
+                columns.append(key)
+                if table == ITEMS_TABLE and key in ("DataType", "ID"):
+                    self.connection.execute(
+                        f"CREATE INDEX {_quote(f'{table}_{key}')} ON {_quote(table)} ({_quote(key)})")
+
+    # Queries and write back
+
+    def execute(self, sql: str, params=()) -> Tuple[List[str], List[tuple]]:
+        """Run one SQL statement in a transaction. Returns (column names, rows); both empty for UPDATEs."""
+        with self.connection:
+            cursor = self.connection.execute(sql, params)
+            rows = cursor.fetchall()
+        return [d[0] for d in cursor.description or ()], rows
+
+    def dirty_files(self) -> List[str]:
+        """Files with rows an UPDATE has touched, whether or not any value actually changed."""
+        return [row[0] for row in self.connection.execute(
+            f"SELECT path FROM {FILES_TABLE} WHERE dirty = 1 ORDER BY path")]
+
+    def pending_changes(self) -> Dict[str, List[tuple]]:
+        """
+        {rel path: [(table, rowid, steps, is_item, changed fields)]} for every updated row
+        whose values differ from what was indexed. Files where nothing differs are left out.
+        """
+        paths = {file_id: rel for rel, file_id in self._ids.items()}
+        edits: Dict[str, List[tuple]] = {}
+        for table, columns in self.columns.items():
+            cursor = self.connection.execute(
+                f"SELECT rowid, _file, {', '.join(map(_quote, columns))} FROM {_quote(table)} WHERE _dirty = 1")
+            for rowid, file_id, *values in cursor:
+                steps, is_item, original = self._origin[(table, rowid)]
+                changed = {}
+                for column, value in zip(columns, values):
+                    old = original.get(column)
+                    if value == old and (value is None) == (old is None):
+                        continue
+                    if isinstance(old, bool) and value in (0, 1):
+                        value = bool(value)  # SQLite has no booleans
+                    changed[column] = value
+                if changed:
+                    edits.setdefault(paths[file_id], []).append((table, rowid, steps, is_item, changed))
+        return dict(sorted(edits.items()))
+
+    def write_back(self) -> List[str]:
+        """
+        Write the changed fields of every updated row to its file, then clear the dirty flags.
+
+        Only files from pending_changes() are rewritten. Raises RuntimeError, leaving
+        everything untouched, if one of them was modified on disk after it was indexed.
+        Returns the files written.
+        """
+        edits = self.pending_changes()
+        conflicts = [rel for rel in edits if self._stat(rel) != self._stats.get(rel)]
+        if conflicts:
+            raise RuntimeError("Changed on disk since the query ran: " + ", ".join(conflicts))
+
+        for rel, file_edits in edits.items():
+            path = self.root / rel
+            with open(path, 'r', encoding='utf-8') as f:
+                document = json.load(f)
+            for _, _, steps, is_item, changed in file_edits:
+                _apply(document, steps, is_item, changed)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(document, f, indent=4)
+            self._stats[rel] = self._stat(rel)
+
+        with self.connection:
+            for file_edits in edits.values():
+                for table, rowid, _, _, changed in file_edits:
+                    self._origin[(table, rowid)][2].update(changed)
+            for table in self.columns:
+                self.connection.execute(f"UPDATE {_quote(table)} SET _dirty = 0 WHERE _dirty = 1")
+            self.connection.execute(f"UPDATE {FILES_TABLE} SET dirty = 0")
+        return list(edits)
+
+    def _stat(self, rel: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = (self.root / rel).stat()
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    def close(self):
+        self.connection.close()
+
+
+def _scalar_fields(obj: dict) -> Dict[str, object]:
+    return {key: value for key, value in obj.items()
+            if isinstance(value, SCALARS) and key not in META_COLUMNS}
+
+
+def _apply(document, steps: Tuple[Step, ...], is_item: bool, changed: Dict[str, object]):
+    target = document
+    for step in steps[:-1] if is_item else steps:
+        target = target[step]
+    if is_item:
+        item = json.loads(target[steps[-1]])
+        item.update(changed)
+        target[steps[-1]] = json.dumps(item)
+    else:
+        target.update(changed)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+    parser = argparse.ArgumentParser(description="Query a save with SQL, e.g. "
+                                                 "\"SELECT ID, Quantity FROM items WHERE DataType = 'WeedData'\"")
+    parser.add_argument("save", type=Path, help="Save folder, e.g. .../SaveGame_1")
+    parser.add_argument("sql", nargs="?", help="Statement to run; omit to list the tables")
+    parser.add_argument("--write", action="store_true",
+                        help="Write UPDATEs back to the save (no backup is made; use the editor for that)")
+    args = parser.parse_args(argv)
+
+    db = SaveDatabase(args.save)
+    db.refresh()
+    if not args.sql:
+        for table, columns in db.tables().items():
+            print(f"{table}: {', '.join(columns)}")
+        return 0
+    try:
+        columns, rows = db.execute(args.sql)
+    except sqlite3.Error as e:
+        print(f"Error: {e}")
+        return 1
+    if columns:
+        print("\t".join(columns))
+        for row in rows:
+            print("\t".join("" if value is None else str(value) for value in row))
+    pending = list(db.pending_changes())
+    if pending and args.write:
+        for rel in db.write_back():
+            print(f"wrote {rel}")
+    elif pending:
+        print(f"{len(pending)} files would change (pass --write to save): {', '.join(pending)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
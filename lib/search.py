@@ -0,0 +1,223 @@
+import json, os, re, sys, threading, time
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from lib.savedb import format_path, json_file_stats
+
+MAX_RESULTS = 500
+PARSE_WORKERS = min(8, os.cpu_count() or 1)  # Parsing holds the GIL between reads, so a few threads are enough
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+Entry = Tuple[str, str]  # (JSON path, kind), kind being "file", "key" or "value"
+Hit = Tuple[str, str, str]  # (file, JSON path, kind)
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def extract(document) -> Dict[Entry, str]:
+    """Every key and scalar value in a document by JSON path, looking inside encoded Items strings too."""
+    entries: Dict[Entry, str] = {}
+    _walk(document, (), entries)
+    return entries
+
+
+def _walk(obj, steps: tuple, entries: Dict[Entry, str]):
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            child = steps + (key,)
+            entries[(format_path(child), "key")] = key
+            if key == "Items" and isinstance(value, list):
+                for i, item in enumerate(value):
+                    if isinstance(item, str):
+                        try:
+                            item = json.loads(item)
+                        except json.JSONDecodeError:
+                            pass
+                    _walk(item, child + (i,), entries)
+            else:
+                _walk(value, child, entries)
+    elif isinstance(obj, list):
+        for i, value in enumerate(obj):
+            _walk(value, steps + (i,), entries)
+    elif isinstance(obj, bool):
+        entries[(format_path(steps), "value")] = "true" if obj else "false"
+    elif obj is not None:
+        entries[(format_path(steps), "value")] = str(obj)
+
+
+class SearchIndex:
+    """
+    Inverted index from words to where they occur in a save: file names, JSON keys and values.
+
+    start() builds it on a background thread, parsing files across a thread pool.
+    The write path calls update() for each file it writes. After files change any
+    other way (reverts, template installs) start() is called again; it re-parses only
+    files whose size or mtime changed, and is_ready() is False until it finishes.
+    search() never touches the disk.
+
+    A query matches an entry when every word of the query occurs in it; the last
+    word may be a prefix, so results can follow the search box as the user types.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._building = False
+        self._stale = False  # start() was called during a build, so the build checks once more
+        self._files: Dict[str, Tuple[Optional[Tuple[int, int]], Dict[Entry, str]]] = {}
+        self._postings: Dict[str, Set[Hit]] = {}
+        self._vocabulary: Optional[List[str]] = None  # Sorted tokens for prefix lookups, rebuilt when needed
+
+    def start(self):
+        """Build the index, or bring it up to date with the save, on a background thread."""
+        with self._lock:
+            self._ready.clear()
+            if self._building:
+                self._stale = True
+                return
+            self._building = True
+        threading.Thread(target=self._build, name="SearchIndex", daemon=True).start()
+
+    def _build(self):
+        while True:
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"Error building search index: {e}")
+            with self._lock:
+                if not self._stale:
+                    self._building = False
+                    self._ready.set()
+                    return
+                self._stale = False
+
+    def is_ready(self) -> bool:
+        return self._ready.is_set()
+
+    def refresh(self) -> int:
+        """Re-index files whose size or mtime changed and drop removed ones. Returns the number parsed."""
+        current = json_file_stats(self.root)
+        with self._lock:
+            indexed = {rel: self._files[rel][0] if rel in self._files else None for rel in current}
+            changed = [rel for rel, stat in current.items() if indexed[rel] != stat]
+            for rel in [rel for rel in self._files if rel not in current]:
+                self._remove(rel)
+        with ThreadPoolExecutor(max_workers=PARSE_WORKERS) as pool:
+            for rel, entries in zip(changed, pool.map(self._read, changed)):
+                with self._lock:
+                    # update() re-indexed the file while it was parsed here; its entries are newer
+                    if (self._files[rel][0] if rel in self._files else None) != indexed[rel]:
+                        continue
+                    self._replace(rel, current[rel], entries)
+        return len(changed)
+
+    def update(self, rel: str):
+        """Re-index one save-relative file after it was written, or drop it if it no longer exists."""
+        path = self.root / rel
+        rel = Path(rel).as_posix()
+        try:
+            stat = path.stat()
+        except OSError:
+            with self._lock:
+                self._remove(rel)
+            return
+        entries = self._read(rel)
+        with self._lock:
+            self._replace(rel, (stat.st_size, stat.st_mtime_ns), entries)
+
+    def _read(self, rel: str) -> Dict[Entry, str]:
+        try:
+            with open(self.root / rel, 'r', encoding='utf-8') as f:
+                return extract(json.load(f))
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+            return {}  # Still findable by file name
+
+    def _replace(self, rel: str, stat, entries: Dict[Entry, str]):
+        self._remove(rel)
+        entries = {("", "file"): rel, **entries}
+        self._files[rel] = (stat, entries)
+        for (path, kind), text in entries.items():
+            hit = (rel, path, kind)
+            for token in set(tokenize(text)):
+                hits = self._postings.get(token)
+                if hits is None:
+                    hits = self._postings[token] = set()
+                    self._vocabulary = None
+                hits.add(hit)
+
+    def _remove(self, rel: str):
+        indexed = self._files.pop(rel, None)
+        if indexed is None:
+            return
+        for (path, kind), text in indexed[1].items():
+            hit = (rel, path, kind)
+            for token in set(tokenize(text)):
+                hits = self._postings.get(token)
+                if hits is not None:
+                    hits.discard(hit)
+                    if not hits:
+                        del self._postings[token]
+                        self._vocabulary = None
+
+    def _prefixed(self, prefix: str) -> Set[Hit]:
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        hits: Set[Hit] = set()
+        for i in range(bisect_left(self._vocabulary, prefix), len(self._vocabulary)):
+            token = self._vocabulary[i]
+            if not token.startswith(prefix):
+                break
+            hits |= self._postings[token]
+        return hits
+
+    def search(self, query: str, limit: int = MAX_RESULTS) -> Tuple[List[dict], int]:
+        """
+        Find every file name, key and value containing all words of query.
+
+        Answers from memory. While a build runs (is_ready() is False) the hits
+        cover only what has been indexed so far.
+
+        Returns:
+            tuple: (up to limit hits as dicts with "file", "path", "kind" and "text",
+            sorted by file and path; total number of hits)
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return [], 0
+        with self._lock:
+            candidates = [self._postings.get(token, set()) for token in tokens[:-1]]
+            candidates.append(self._prefixed(tokens[-1]))
+            candidates.sort(key=len)
+            matches = set(candidates[0]).intersection(*candidates[1:])
+            ordered = sorted(matches)
+            results = [{"file": rel, "path": path, "kind": kind, "text": self._files[rel][1][(path, kind)]}
+                       for rel, path, kind in ordered[:limit]]
+        return results, len(matches)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+    parser = argparse.ArgumentParser(description="Search a save for an item, NPC, product ID or any other text.")
+    parser.add_argument("save", type=Path, help="Save folder, e.g. .../SaveGame_1")
+    parser.add_argument("query", help="Words to find; the last one may be a prefix")
+    args = parser.parse_args(argv)
+
+    index = SearchIndex(args.save)
+    start = time.perf_counter()
+    index._build()
+    built = time.perf_counter()
+    results, total = index.search(args.query)
+    searched = time.perf_counter()
+    for hit in results:
+        print(f"{hit['file']}\t{hit['path'] or '(file)'}\t{hit['kind']}\t{hit['text']}")
+    print(f"{total} hits; indexed in {(built - start) * 1000:.1f} ms, searched in {(searched - built) * 1000:.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+import sys, threading, time
+from typing import List, Tuple
+
+PROFILE_FLAG = "--profile-startup"
+SLOWEST_IMPORTS = 15  # Modules listed in the import breakdown
+
+
+class StartupProfile:
+    """
+    Times the phases of application startup for the --profile-startup flag.
+
+    Each mark() closes the phase that began at the previous mark, so main.py only
+    has to call it after every import group and construction step. When profiling
+    is off, mark() returns immediately.
+
+    While profiling, every module first imported on the main thread is timed as well,
+    both on its own and including the modules it imports in turn, like python -X importtime.
+    report() lists the slowest after the phases.
+    """
+
+    def __init__(self, enabled: bool):
+        self.enabled = enabled
+        self.start = time.perf_counter()
+        self.last = self.start
+        self.phases: List[Tuple[str, float]] = []
+        self.imports: List[Tuple[str, float, float]] = []  # (module, self seconds, seconds including its imports)
+        self._original_import = None
+        if enabled:
+            self._watch_imports()
+
+    def mark(self, label: str):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.phases.append((label, now - self.last))
+        self.last = now
+
+    def _watch_imports(self):
+        import builtins
+        original = self._original_import = builtins.__import__
+        thread = threading.get_ident()
+        stack: List[List[float]] = []  # Time spent in nested imports, one entry per import in progress
+
+        def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+            module = self._new_module(name, globals, fromlist, level) if threading.get_ident() == thread else None
+            if module is None:
+                return original(name, globals, locals, fromlist, level)
+            nested = [0.0]
+            stack.append(nested)
+            start = time.perf_counter()
+            try:
+                return original(name, globals, locals, fromlist, level)
+            finally:
+                elapsed = time.perf_counter() - start
+                stack.pop()
+                if stack:
+                    stack[-1][0] += elapsed
+                self.imports.append((module, elapsed - nested[0], elapsed))
+
+        builtins.__import__ = timed_import
+
+    @staticmethod
+    def _new_module(name, globals, fromlist, level):
+        """The module an import statement is about to load, or None if everything it names is loaded."""
+        if level:
+            package = (globals or {}).get("__package__") or ""
+            base = package.rsplit(".", level - 1)[0] if level > 1 else package
+            name = f"{base}.{name}" if name else base
+        if name not in sys.modules:
+            return name
+        # "from package import submodule" loads the submodule even though the package is loaded
+        loaded = sys.modules[name]
+        for item in fromlist or ():
+            if item != "*" and not hasattr(loaded, item):
+                return f"{name}.{item}"
+        return None
+
+    def report(self, stream=None):
+        stream = stream or sys.stdout
+        if self._original_import is not None:
+            import builtins
+            builtins.__import__ = self._original_import
+            self._original_import = None
+        width = max([len(label) for label, _ in self.phases] + [len("total")])
+        print("Startup profile (ms):", file=stream)
+        for label, seconds in self.phases:
+            print(f"  {label:<{width}}  {seconds * 1000:8.1f}", file=stream)
+        print(f"  {'total':<{width}}  {(self.last - self.start) * 1000:8.1f}", file=stream)
+        if self.imports:
+            slowest = sorted(self.imports, key=lambda entry: entry[1], reverse=True)[:SLOWEST_IMPORTS]
+            width = max(len(module) for module, _, _ in slowest)
+            print(f"Slowest of {len(self.imports)} imports (ms, self and including nested imports):", file=stream)
+            for module, own, cumulative in slowest:
+                print(f"  {module:<{width}}  {own * 1000:8.1f}  {cumulative * 1000:8.1f}", file=stream)
+        stream.flush()
+
+
+PROFILE = StartupProfile(PROFILE_FLAG in sys.argv)
@@ -0,0 +1,176 @@
+import time
+from typing import Callable, Optional
+
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, Signal
+from PySide6.QtWidgets import QMessageBox, QProgressDialog
+
+PROGRESS_INTERVAL = 0.05  # Seconds between progress signals, so tight loops don't flood the GUI thread
+
+
+class TaskCancelled(Exception):
+    pass
+
+
+class TaskContext:
+    """
+    Handed to long-running operations so they can report progress and stop when cancelled.
+
+    Operations call progress() from inside their loops. It raises TaskCancelled once the
+    user has cancelled, so no extra checks are needed at the call sites.
+    """
+
+    def __init__(self, signals: Optional["TaskSignals"] = None):
+        self.signals = signals
+        self.cancelled = False
+        self._last_emit = 0.0
+
+    def progress(self, done: int, total: Optional[int] = None, message: str = ""):
+        if self.cancelled:
+            raise TaskCancelled()
+        if self.signals is None:
+            return
+        now = time.monotonic()
+        if now - self._last_emit >= PROGRESS_INTERVAL or (total and done >= total):
+            self._last_emit = now
+            self.signals.progress.emit(done, total or 0, message)
+
+    def check(self):
+        if self.cancelled:
+            raise TaskCancelled()
+
+
+NO_TASK = TaskContext()  # Default for direct calls: no progress reporting, never cancelled
+
+
+class TaskSignals(QObject):
+    progress = Signal(int, int, str)  # done, total (0 when unknown), message
+    finished = Signal(object)
+    failed = Signal(str)
+    cancelled = Signal()
+
+
+class Task(QRunnable):
+    """Runs fn(*args, task=context, **kwargs) on the thread pool and reports the outcome through signals."""
+
+    def __init__(self, fn: Callable, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = TaskSignals()
+        self.context = TaskContext(self.signals)
+
+    def cancel(self):
+        self.context.cancelled = True
+
+    def run(self):
+        try:
+            result = self.fn(*self.args, task=self.context, **self.kwargs)
+        except TaskCancelled:
+            self.signals.cancelled.emit()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+
+
+class TaskRunner(QObject):
+    """
+    Runs one task at a time on the global QThreadPool behind a shared progress dialog.
+
+    Every action that changes the save or its backups goes through here, so those changes
+    never overlap. The dialog is window modal and shown as soon as a task starts, so the
+    rest of the window cannot start a conflicting edit, but the event loop keeps running
+    and the window stays responsive.
+    """
+
+    def __init__(self, parent_widget, guard: Optional[Callable[[], bool]] = None):
+        super().__init__(parent_widget)
+        self.parent_widget = parent_widget
+        self.guard = guard  # Asked before every task; returning False skips it
+        self.pool = QThreadPool.globalInstance()
+        self.dialog: Optional[QProgressDialog] = None
+        self.task: Optional[Task] = None
+        self.title = ""
+        self.on_done: Optional[Callable] = None
+
+    def is_busy(self) -> bool:
+        return self.task is not None
+
+    def run(self, title: str, fn: Callable, *args, on_done: Optional[Callable] = None,
+            cancellable: bool = True, guarded: bool = True, **kwargs) -> Optional[Task]:
+        """
+        Start fn(*args, task=..., **kwargs) in the background.
+
+        on_done is called on the GUI thread with fn's return value. Failures and
+        cancellations are reported to the user here. Pass cancellable=False for
+        operations that must not stop halfway, such as restoring a backup, and
+        guarded=False for ones that only touch backups, which skip the guard.
+        """
+        if self.task is not None:
+            QMessageBox.warning(self.parent_widget, "Busy", "Please wait for the current operation to finish.")
+            return None
+        if guarded and self.guard and not self.guard():
+            return None
+        self.title = title
+        self.on_done = on_done
+        self.task = Task(fn, *args, **kwargs)
+        self.task.setAutoDelete(False)
+        self.task.signals.progress.connect(self._on_progress)
+        self.task.signals.finished.connect(self._on_finished)
+        self.task.signals.failed.connect(self._on_failed)
+        self.task.signals.cancelled.connect(self._on_cancelled)
+
+        self.dialog = QProgressDialog(f"{title}...", "Cancel", 0, 0, self.parent_widget)
+        self.dialog.setWindowTitle(title)
+        self.dialog.setWindowModality(Qt.WindowModal)
+        self.dialog.setAutoClose(False)
+        self.dialog.setAutoReset(False)
+        self.dialog.setMinimumDuration(0)  # Block the window at once, before any write happens
+        if cancellable:
+            self.dialog.canceled.connect(self.task.cancel)
+        else:
+            self.dialog.setCancelButton(None)
+        self.dialog.show()
+        self.pool.start(self.task)
+        return self.task
+
+    def _on_progress(self, done: int, total: int, message: str):
+        # setValue() processes events on a modal dialog, so the task may finish in between
+        dialog = self.dialog
+        if not dialog:
+            return
+        if message:
+            dialog.setLabelText(message)
+        if total:
+            dialog.setRange(0, total)
+            dialog.setValue(min(done, total))
+
+    def _finish(self):
+        if self.dialog:
+            self.dialog.blockSignals(True)  # Closing must not count as a cancel
+            self.dialog.close()
+            self.dialog.deleteLater()
+        self.dialog = None
+        self.task = None
+
+    def _on_finished(self, result):
+        on_done = self.on_done
+        self._finish()
+        if on_done:
+            on_done(result)
+
+    def _on_failed(self, error: str):
+        self._finish()
+        QMessageBox.critical(self.parent_widget, "Error", f"{self.title} failed: {error}")
+
+    def _on_cancelled(self):
+        self._finish()
+        QMessageBox.information(self.parent_widget, "Cancelled",
+                                f"{self.title} was cancelled. Changes made so far can be reverted from the Backups tab.")
+
+    def wait(self):
+        """Block until the running task ends. Used when the window closes."""
+        if self.task:
+            self.task.cancel()
+        self.pool.waitForDone()
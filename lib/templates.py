@@ -0,0 +1,197 @@
+import json, os, shutil, sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+from typing import Dict, List, Optional, Tuple
+
+from lib.backups import hash_file
+from lib.downloads import DownloadManager
+
+TEMPLATE_VERSION = 1
+TEMPLATE_BASE_URL = "https://github.com/N0edL/Schedule-1-Save-Editor/raw/refs/heads/main/NPCs/"
+
+COPY_BUFFER = 1024 * 1024
+EXTRACT_WORKERS = min(32, (os.cpu_count() or 1) + 4)  # Extraction is mostly file I/O, so more threads than cores
+INDEX_FILE = "index.json"
+SAVE_TEMPLATE = "SaveGame_1.zip"
+
+# SHA-256 of every template archive for TEMPLATE_VERSION. Bump the version whenever these change
+# so stale cached copies are never used.
+TEMPLATE_HASHES = {
+    "Businesses.zip": "c96b79815d0510d00ec43b727fe6b154277618fb7833eff4dd016af47767ab9f",
+    "NPCs.zip": "3b9a9205bd93ec74355fa1d37b7429b82e9484969298a694371c3d697882632b",
+    "Properties.zip": "75e22b6c8e1bcac737985b51ff133a62209ea77ac3fea50ba41f1a332eaa9153",
+    "SaveGame_1.zip": "f764e0475068481985581eb41e05e0f62a205aa2b42eafb1bd367b824fd4fd38",
+}
+
+
+def bundled_template_dir() -> Path:
+    """The NPCs/ folder shipped next to main.py, or inside the PyInstaller bundle."""
+    base_path = getattr(sys, '_MEIPASS', None)
+    if base_path:
+        return Path(base_path) / "NPCs"
+    return Path(__file__).resolve().parent.parent / "NPCs"
+
+
+class TemplateCache:
+    """
+    Resolves template archives to a local file, downloading only as a last resort.
+
+    Lookup order: the archive bundled with the editor, then a copy in the versioned
+    cache directory whose SHA-256 matches, then a fresh download into the cache.
+    """
+
+    def __init__(self, cache_dir: Path, bundled_dir: Optional[Path] = None,
+                 downloader: Optional[DownloadManager] = None):
+        self.cache_dir = cache_dir / f"v{TEMPLATE_VERSION}"
+        self.bundled_dir = bundled_dir or bundled_template_dir()
+        self.downloader = downloader or DownloadManager()
+        self._verified: Dict[Path, Tuple[int, int]] = {}
+        self._indexes: Dict[str, dict] = {}
+
+    def _is_valid(self, path: Path, name: str) -> bool:
+        """Check a cached archive against its expected hash, remembering files already checked."""
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+        key = (stat.st_size, stat.st_mtime_ns)
+        if self._verified.get(path) == key:
+            return True
+        if hash_file(path) != TEMPLATE_HASHES[name]:
+            return False
+        self._verified[path] = key
+        return True
+
+    def path(self, name: str) -> Path:
+        """Return a local path to the named template archive."""
+        if name not in TEMPLATE_HASHES:
+            raise KeyError(f"Unknown template: {name}")
+        bundled = self.bundled_dir / name
+        if bundled.is_file():
+            return bundled
+        cached = self.cache_dir / name
+        if self._is_valid(cached, name):
+            return cached
+        self.download(name)
+        return cached
+
+    def download(self, name: str) -> Path:
+        """Fetch a template into the cache, replacing the cached copy only once its hash checks out."""
+        return self.downloader.download(TEMPLATE_BASE_URL + name, self.cache_dir / name, TEMPLATE_HASHES[name])
+
+    def extracted(self, name: str, prefix: str) -> Tuple[Path, dict]:
+        """
+        Return a pre-extracted copy of a template and its index, extracting it once if needed.
+
+        The index lists every directory and file (with its size) so clones never walk the
+        tree, and records the archive hash so a new TEMPLATE_HASHES entry forces a re-extract.
+        """
+        target = self.cache_dir / "extracted" / prefix
+        index = self._indexes.get(name)
+        if index is None:
+            try:
+                with open(target / INDEX_FILE, 'r', encoding='utf-8') as f:
+                    index = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                index = None
+        if index is None or index.get("archive_sha256") != TEMPLATE_HASHES[name]:
+            index = self._extract(name, prefix, target)
+        self._indexes[name] = index
+        return target, index
+
+    def _extract(self, name: str, prefix: str, target: Path) -> dict:
+        staging = target.with_name(target.name + ".tmp")
+        shutil.rmtree(staging, ignore_errors=True)
+        install_template(self.path(name), prefix, staging)
+        dirs, files = [], {}
+        for dirpath, dirnames, filenames in os.walk(staging):
+            rel_dir = Path(dirpath).relative_to(staging)
+            dirs.extend((rel_dir / d).as_posix() for d in dirnames)
+            for filename in filenames:
+                files[(rel_dir / filename).as_posix()] = os.path.getsize(Path(dirpath) / filename)
+        index = {"archive_sha256": TEMPLATE_HASHES[name], "dirs": sorted(dirs), "files": files}
+        with open(staging / INDEX_FILE, 'w', encoding='utf-8') as f:
+            json.dump(index, f)
+        shutil.rmtree(target, ignore_errors=True)
+        os.replace(staging, target)
+        return index
+
+    def create_save(self, dest: Path, organisation_name: str, workers: int = EXTRACT_WORKERS) -> Path:
+        """
+        Create a new save folder by cloning the pre-extracted save template.
+
+        Files are copied in parallel rather than hard linked, because the game and the
+        editor rewrite save files in place and would otherwise change the template too.
+        Game.json is written once, already carrying the new organisation name.
+        """
+        template, index = self.extracted(SAVE_TEMPLATE, "SaveGame_1")
+        if "Game.json" not in index["files"]:
+            raise FileNotFoundError("Game.json not found in the save template")
+        dest = Path(dest)
+        dest.mkdir(parents=True)
+        for rel in index["dirs"]:
+            (dest / rel).mkdir(exist_ok=True)
+        copies = [rel for rel in index["files"] if rel != "Game.json"]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(lambda rel: shutil.copyfile(template / rel, dest / rel), copies))
+
+        with open(template / "Game.json", 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        data["OrganisationName"] = organisation_name
+        with open(dest / "Game.json", 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=4)
+        return dest
+
+
+def install_template(zip_path: Path, prefix: str, dest: Path, workers: int = EXTRACT_WORKERS) -> List[str]:
+    """
+    Stream the entries below prefix/ in a template archive straight into dest.
+
+    An entry is a top-level file or folder below prefix, e.g. one NPC or one property.
+    Entries that already exist in dest are left untouched and none of their members
+    are read. Members are copied in buffered chunks by a pool of writers, so nothing
+    is staged in a temp directory or held fully in memory.
+
+    Returns:
+        list[str]: Names of the entries that were installed, sorted.
+    """
+    import zipfile  # Only needed when a template is installed, keep it off the startup path
+    dest = Path(dest)
+    root = dest.resolve()
+    installed, skipped = set(), set()
+    dirs, files = [], []
+    with zipfile.ZipFile(zip_path, 'r') as zf:
+        found = False
+        for info in zf.infolist():
+            parts = PurePosixPath(info.filename).parts
+            if len(parts) < 2 or parts[0] != prefix:
+                continue
+            found = True
+            rel_parts = parts[1:]
+            if ".." in rel_parts:
+                raise ValueError(f"Unsafe path in template archive: {info.filename}")
+            entry = rel_parts[0]
+            if entry in skipped:
+                continue
+            if entry not in installed and (dest / entry).exists():
+                skipped.add(entry)
+                continue
+            installed.add(entry)
+            target = root.joinpath(*rel_parts)
+            (dirs if info.is_dir() else files).append((info, target))
+        if not found:
+            raise FileNotFoundError(f"{prefix} not found in {Path(zip_path).name}")
+
+        for _, target in dirs:
+            target.mkdir(parents=True, exist_ok=True)
+        for parent in {target.parent for _, target in files}:
+            parent.mkdir(parents=True, exist_ok=True)
+
+        def write(item):
+            info, target = item
+            with zf.open(info) as source, open(target, 'wb') as out:
+                shutil.copyfileobj(source, out, COPY_BUFFER)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(write, files))
+    return sorted(installed)
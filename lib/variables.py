@@ -0,0 +1,134 @@
+import json, re
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+VARIABLES_DIR = "Variables"
+PLAYERS_DIR = "Players"
+PLAYER_PATTERN = re.compile(r"Player_(\d+)")
+
+
+class VariableStore:
+    """
+    Every root and per-player variable of a save, indexed by name.
+
+    Variables live in Variables/ and Players/Player_N/Variables/, one JSON file per
+    variable. The folders are listed on first use and the files are parsed the first
+    time variable contents are needed; after that, lookups by name are dictionary
+    hits and patterns (fnmatch style, e.g. *_acquired) only scan the names.
+
+    Scopes are the variable folders relative to the save, as listed by directories().
+    update() re-reads one file after it is written; invalidate() forgets everything.
+    """
+
+    def __init__(self, save_root: Path):
+        self.save_root = save_root
+        self._files: Optional[Dict[str, List[str]]] = None  # scope -> variable files, relative to the save
+        self._data: Optional[Dict[str, dict]] = None  # file -> parsed contents
+        self._names: Dict[str, List[str]] = {}  # variable name -> files
+
+    def _scopes(self) -> Dict[str, List[str]]:
+        if self._files is None:
+            dirs = [VARIABLES_DIR]
+            players_path = self.save_root / PLAYERS_DIR
+            if players_path.is_dir():
+                players = [d.name for d in players_path.iterdir() if PLAYER_PATTERN.fullmatch(d.name)]
+                players.sort(key=lambda name: int(name.split("_")[1]))
+                dirs.extend(f"{PLAYERS_DIR}/{player}/{VARIABLES_DIR}" for player in players)
+            files = {}
+            for scope in dirs:
+                path = self.save_root / scope
+                if path.is_dir():
+                    files[scope] = sorted(f"{scope}/{f.name}" for f in path.glob("*.json"))
+            self._files = files
+        return self._files
+
+    def _contents(self) -> Dict[str, dict]:
+        if self._data is None:
+            self._data = {}
+            self._names = {}
+            for files in self._scopes().values():
+                for rel in files:
+                    self._read(rel)
+        return self._data
+
+    def _read(self, rel: str):
+        try:
+            with open(self.save_root / rel, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+            return
+        if not isinstance(data, dict):
+            return
+        self._data[rel] = data
+        self._names.setdefault(data.get("Name") or Path(rel).stem, []).append(rel)
+
+    def _forget(self, rel: str):
+        data = self._data.pop(rel, None)
+        if data is not None:
+            name = data.get("Name") or Path(rel).stem
+            files = self._names.get(name, [])
+            if rel in files:
+                files.remove(rel)
+            if not files:
+                self._names.pop(name, None)
+
+    def invalidate(self):
+        self._files = None
+        self._data = None
+        self._names = {}
+
+    def update(self, rel: str):
+        """Re-read one variable file, relative to the save, after it was written or removed."""
+        rel = Path(rel).as_posix()
+        scope = rel.rsplit("/", 1)[0]
+        if self._files is None:
+            return
+        if scope not in self._files:
+            self.invalidate()  # A new player folder; list everything again
+            return
+        exists = (self.save_root / rel).is_file()
+        files = self._files[scope]
+        if exists and rel not in files:
+            files.append(rel)
+            files.sort()
+        elif not exists and rel in files:
+            files.remove(rel)
+        if self._data is not None:
+            self._forget(rel)
+            if exists:
+                self._read(rel)
+
+    def directories(self) -> List[str]:
+        """The variable folders that exist, root first, then each player in order."""
+        return list(self._scopes())
+
+    def players(self) -> List[str]:
+        """Player_N folders that have variables."""
+        return [scope.split("/")[1] for scope in self._scopes() if scope != VARIABLES_DIR]
+
+    def names(self) -> List[str]:
+        self._contents()
+        return sorted(self._names)
+
+    def find(self, pattern: str = "*", scope: Optional[str] = None) -> List[Tuple[str, dict]]:
+        """
+        (file, parsed contents) for every variable whose name matches pattern.
+
+        pattern is an exact name or an fnmatch pattern. The contents are the cached
+        objects; change them only to write them back.
+        """
+        data = self._contents()
+        if any(c in pattern for c in "*?["):
+            names = [name for name in self._names if fnmatchcase(name, pattern)]
+        else:
+            names = [pattern] if pattern in self._names else []
+        matches = [(rel, data[rel]) for name in names for rel in self._names[name]]
+        if scope is not None:
+            matches = [(rel, d) for rel, d in matches if rel.rsplit("/", 1)[0] == scope]
+        return sorted(matches)
+
+    def get(self, name: str, scope: str = VARIABLES_DIR) -> Optional[str]:
+        """The Value of one variable, by default from the root folder."""
+        matches = self.find(name, scope)
+        return matches[0][1].get("Value") if matches else None
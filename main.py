@@ -1,43 +1,190 @@
 # pyinstaller --noconfirm schedule1_editor.spec
 
-import sys, json, os, random, string, shutil, tempfile, urllib.request, zipfile, winreg, re, subprocess, psutil
+from lib.startup import PROFILE  # First, so the profile covers every import below
+
+# winreg, urllib, subprocess, tempfile, psutil (in lib/game) and every lib module besides downloads, game and tasks
+# are imported where they are used, keeping them off the startup path
+import sys, json, os, random, string, shutil, time, re
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Union
+PROFILE.mark("import stdlib")
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QStackedWidget, QWidget,
-    QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem, QTableView,
     QLabel, QFormLayout, QLineEdit, QComboBox, QPushButton,
-    QMessageBox, QTabWidget, QCheckBox, QGroupBox, QTextEdit, QHeaderView, QDialog, QProgressDialog
+    QMessageBox, QTabWidget, QCheckBox, QGroupBox, QTextEdit, QHeaderView, QDialog, QProgressDialog,
+    QCompleter, QTreeWidget, QTreeWidgetItem, QDateTimeEdit
 )
-from PySide6.QtCore import Qt, QUrl, QObject, Signal, QThread
+from PySide6.QtCore import Qt, QUrl, QObject, Signal, QThread, QTimer, QEventLoop, QDateTime, QStringListModel
 from PySide6.QtGui import QRegularExpressionValidator, QIntValidator, QPalette, QColor, QDesktopServices, QIcon
+PROFILE.mark("import PySide6")
+from lib.downloads import DownloadCancelled, DownloadError, DownloadManager
+from lib.game import GameMonitor
+from lib.tasks import NO_TASK, TaskCancelled, TaskContext, TaskRunner
+PROFILE.mark("import lib")
 
 CURRENT_VERSION = "1.0.5"
+CONFIG_DIR = Path.home() / "AppData" / "Local" / "noedl.xyz" / "Schedule1Editor"
+DOWNLOADS = DownloadManager()  # Shared so downloads to the same host reuse one connection
 
 class UpdateChecker(QObject):
     finished = Signal(tuple) 
 
+    CACHE_FILE = CONFIG_DIR / "update_check.json"
+    CACHE_TTL = 6 * 60 * 60  # Seconds before the cached release is revalidated
+
+    @classmethod
+    def load_cache(cls) -> dict:
+        try:
+            with open(cls.CACHE_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    @classmethod
+    def save_cache(cls, etag: Optional[str], result: tuple):
+        cls.CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(cls.CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({"checked": time.time(), "etag": etag, "result": list(result)}, f)
+
+    @classmethod
+    def cached_result(cls) -> Optional[tuple]:
+        """The cached (version, url, sha256) if it is younger than CACHE_TTL, so no request is needed."""
+        cache = cls.load_cache()
+        if cache.get("result") and 0 <= time.time() - cache.get("checked", 0) < cls.CACHE_TTL:
+            return tuple(cache["result"])
+        return None
+
+    @staticmethod
+    def parse_release(data: dict) -> tuple:
+        latest_version = data.get('tag_name', '')
+        assets = data.get('assets', [])
+        download_url = None
+        sha256 = None
+        for asset in assets:
+            if asset['name'].lower().endswith('.exe'):
+                download_url = asset.get('browser_download_url', '')
+                digest = asset.get('digest') or ''
+                if digest.startswith('sha256:'):
+                    sha256 = digest[len('sha256:'):]
+                break
+        return (latest_version, download_url, sha256)
+
     def run(self):
+        cached = self.cached_result()
+        if cached:
+            self.finished.emit(cached)
+            return
+        cache = self.load_cache()
         try:
+            import urllib.error, urllib.request
             url = "https://api.github.com/repos/N0edL/Schedule-1-Save-Editor/releases/latest"
             req = urllib.request.Request(url)
             req.add_header('User-Agent', 'Schedule-1-Save-Editor')
-            with urllib.request.urlopen(req) as response:
-                data = json.loads(response.read().decode())
-                latest_version = data.get('tag_name', '')
-                assets = data.get('assets', [])
-                download_url = None
-                for asset in assets:
-                    if asset['name'].lower().endswith('.exe'):
-                        download_url = asset.get('browser_download_url', '')
-                        break
-                self.finished.emit((latest_version, download_url))
+            if cache.get("etag") and cache.get("result"):
+                req.add_header('If-None-Match', cache["etag"])
+            try:
+                with urllib.request.urlopen(req) as response:
+                    result = self.parse_release(json.loads(response.read().decode()))
+                    etag = response.headers.get('ETag')
+            except urllib.error.HTTPError as e:
+                if e.code != 304:
+                    raise
+                # Release unchanged; GitHub does not count 304s against the rate limit
+                result, etag = tuple(cache["result"]), cache["etag"]
+            self.save_cache(etag, result)
+            self.finished.emit(result)
         except Exception as e:
             print(f"Update check failed: {e}")
-            self.finished.emit(('', ''))
+            self.finished.emit(tuple(cache["result"]) if cache.get("result") else ('', '', None))
+
+class DownloadWorker(QObject):
+    progress = Signal(object, object)  # bytes received, total bytes or None when unknown
+    finished = Signal(list)
+    failed = Signal(str)
+
+    def __init__(self, downloader: DownloadManager, jobs: list):
+        super().__init__()
+        self.downloader = downloader
+        self.jobs = jobs
+        self._cancelled = False
+
+    def cancel(self):
+        # Called directly from the GUI thread. run() polls the flag between chunks, and
+        # aborting the connection wakes a read that is waiting on the network
+        self._cancelled = True
+        self.downloader.abort()
+
+    def run(self):
+        try:
+            paths = [
+                str(self.downloader.download(url, dest, sha256, self.progress.emit, lambda: self._cancelled))
+                for url, dest, sha256 in self.jobs
+            ]
+            self.finished.emit(paths)
+        except DownloadCancelled:
+            pass  # The dialog was closed by the cancel and waits for nothing but the thread
+        except Exception as e:
+            self.failed.emit(str(e))
+
+class DownloadDialog(QProgressDialog):
+    """Modal progress dialog that runs a list of (url, dest, sha256) downloads on a worker thread."""
+
+    def __init__(self, jobs: list, label: str, parent=None):
+        super().__init__(label, "Cancel", 0, 100, parent)
+        self.label = label
+        self.paths: Optional[list] = None
+        self.error: Optional[str] = None
+        self.setWindowTitle("Downloading")
+        self.setWindowModality(Qt.WindowModal)
+        self.setAutoClose(False)
+        self.setAutoReset(False)
+        self.setMinimumDuration(0)
+
+        self.download_thread = QThread()
+        self.worker = DownloadWorker(DOWNLOADS, jobs)
+        self.worker.moveToThread(self.download_thread)
+        self.download_thread.started.connect(self.worker.run)
+        self.worker.progress.connect(self.update_progress)
+        self.worker.finished.connect(self.download_finished)
+        self.worker.failed.connect(self.download_failed)
+        self.canceled.connect(self.worker.cancel, Qt.DirectConnection)
+
+    def update_progress(self, received, total):
+        if total:
+            self.setRange(0, 100)
+            self.setValue(received * 100 // total)
+        else:
+            self.setRange(0, 0)  # Busy indicator when the server sends no length
+            self.setLabelText(f"{self.label} {received / (1024 * 1024):.1f} MB")
+
+    def download_finished(self, paths):
+        self.paths = paths
+        self.accept()
+
+    def download_failed(self, error):
+        self.error = error
+        self.reject()
+
+    def run(self) -> Optional[list]:
+        """Run the downloads. Returns the downloaded paths, or None if the user canceled."""
+        self.download_thread.start()
+        self.exec()
+        self.worker.cancel()
+        self.download_thread.quit()
+        # Keep the event loop running until the worker has let go of the connection
+        loop = QEventLoop()
+        self.download_thread.finished.connect(loop.quit)
+        if self.download_thread.isRunning():
+            loop.exec()
+        self.download_thread.wait()
+        if self.error and self.paths is None:
+            raise DownloadError(self.error)
+        return self.paths
 
 def find_steam_path():
+    import winreg
     try:
         with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\Valve\Steam") as key:
             steam_path, _ = winreg.QueryValueEx(key, "InstallPath")
@@ -65,16 +212,6 @@ def find_game_directory():
             return game_dir
     return None
 
-def is_game_running():
-    """Check if the game is running."""
-    try:
-        for proc in psutil.process_iter(['pid', 'name']):
-            if "Schedule I" in proc.info['name']:
-                return True
-    except Exception as e:
-        print(f"Error checking for running processes: {e}")
-    return False
-
 def parse_npc_log(log_text: str) -> list[tuple[str, str]]:
     """
     Parse the NPC log text and extract (name, id) pairs.
@@ -117,6 +254,33 @@ GOOFYAHHHNAMES = [
     "Vancomycin", "Venlafaxine", "Verapamil", "Warfarin", "Zidovudine", "Zolpidem"
 ]
 
+# Files behind get_save_info, by their save_data key
+SUMMARY_SOURCES = {
+    "game": "Game.json",
+    "money": "Money.json",
+    "rank": "Rank.json",
+    "time": "Time.json",
+    "metadata": "Metadata.json",
+    "inventory": "Players/Player_0/Inventory.json",
+}
+# get_save_info fields read straight from a loaded file: field -> (save_data key, JSON key, default, cast)
+SUMMARY_FIELDS = {
+    "game_version": ("game", "GameVersion", "Unknown", None),
+    "organisation_name": ("game", "OrganisationName", "Unknown", None),
+    "online_money": ("money", "OnlineBalance", 0, int),
+    "networth": ("money", "Networth", 0, int),
+    "lifetime_earnings": ("money", "LifetimeEarnings", 0, int),
+    "weekly_deposit_sum": ("money", "WeeklyDepositSum", 0, int),
+    "current_rank": ("rank", "CurrentRank", "Unknown", None),
+    "rank_number": ("rank", "Rank", 0, int),
+    "tier": ("rank", "Tier", 0, int),
+}
+SUMMARY_ORDER = [
+    "game_version", "creation_date", "creation_time", "playtime", "organisation_name",
+    "online_money", "networth", "lifetime_earnings", "weekly_deposit_sum",
+    "current_rank", "rank_number", "tier", "cash_balance",
+]
+
 class SaveManager:
     def __init__(self):
         self.savefile_dir = self._find_save_directory()
@@ -124,9 +288,36 @@ class SaveManager:
         self.save_data: Dict[str, Union[dict, list]] = {}
         self.backup_path: Optional[Path] = None
         self.feature_backups: Optional[Path] = None
+        self._retention_policy = None  # lib.backups.RetentionPolicy, loaded on first use
+        self.backup_catalog: Optional["BackupCatalog"] = None
+        self.retention: Optional["RetentionEngine"] = None
+        self.timeline: Optional["FileTimeline"] = None
+        self.digest_cache = None  # lib.diff.DigestCache, created by the first diff
+        self._templates = None  # lib.templates.TemplateCache, created on first use
+        self.database = None  # lib.savedb.SaveDatabase, created by the first query
+        self.search_index = None  # lib.search.SearchIndex, built in the background when a save loads
+        self.npcs: Optional["NPCIndex"] = None
+        self.property_objects: Optional["PropertyIndex"] = None
+        self.variables: Optional["VariableStore"] = None
+        self.quests: Optional["QuestIndex"] = None
 
         self.used_names = set()
         self.available_names = []
+        self._reset_summary()
+
+    @property
+    def retention_policy(self) -> "RetentionPolicy":
+        if self._retention_policy is None:
+            from lib.backups import RetentionPolicy
+            self._retention_policy = RetentionPolicy.load(CONFIG_DIR / "retention.json")
+        return self._retention_policy
+
+    @property
+    def templates(self) -> "TemplateCache":
+        if self._templates is None:
+            from lib.templates import TemplateCache
+            self._templates = TemplateCache(CONFIG_DIR / "templates", downloader=DOWNLOADS)
+        return self._templates
 
     @staticmethod
     def _is_steamid_folder(name: str) -> bool:
@@ -160,10 +351,19 @@ class SaveManager:
                 if x.is_dir() and re.fullmatch(r"SaveGame_[1-9]", x.name)]
 
     def load_save(self, save_path: Union[str, Path]) -> bool:
+        from lib.backups import BackupCatalog, FileTimeline, RetentionEngine
+        from lib.npcs import NPCIndex
+        from lib.properties import PropertyIndex
+        from lib.quests import QuestIndex
+        from lib import records
+        from lib.variables import VariableStore
         self.current_save = Path(save_path)
         if not self.current_save.exists():
             return False
         self.save_data = {}
+        self._reset_summary()
+        self.close_database()
+        records.STRINGS.clear()  # Strings of the previous save stay only as long as something still uses them
         try:
             self.save_data["game"] = self._load_json_file("Game.json")
             self.save_data["money"] = self._load_json_file("Money.json")
@@ -176,7 +376,17 @@ class SaveManager:
             self.save_data["inventory"] = self._load_json_file("Players/Player_0/Inventory.json")
             self.backup_path = self.current_save.parent / (self.current_save.name + '_Backup')
             self.feature_backups = self.backup_path / 'feature_backups'
+            self.backup_catalog = BackupCatalog(self.feature_backups)
+            self.retention = RetentionEngine(self.backup_catalog, self.retention_policy)
+            self.timeline = FileTimeline(self.backup_path, self.backup_catalog)
             self.create_initial_backup()
+            from lib.search import SearchIndex
+            self.search_index = SearchIndex(self.current_save)
+            self.search_index.start()
+            self.npcs = NPCIndex(self.current_save / "NPCs")
+            self.property_objects = PropertyIndex(self.current_save / "Properties")
+            self.variables = VariableStore(self.current_save)
+            self.quests = QuestIndex(self.current_save)
 
             # Add this block to initialize used_names and available_names
             self.used_names = set()
@@ -199,43 +409,71 @@ class SaveManager:
             return False
 
     def _load_json_file(self, filename: str) -> dict:
+        """Parse a save file with shared key/string interning; common DataTypes load as records."""
+        from lib import records
         file_path = self.current_save / filename
         if not file_path.exists():
             return {}
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return records.load(file_path)
 
     def _load_folder_data(self, folder_name: str) -> list:
+        from lib import records
         folder_path = self.current_save / folder_name
         if not folder_path.exists():
             return []
         data = []
         for file in folder_path.glob("*.json"):
             try:
-                with open(file, 'r', encoding='utf-8') as f:
-                    data.append(json.load(f))
+                data.append(records.load(file))
             except json.JSONDecodeError:
                 continue
         return data
 
-    def get_save_info(self) -> dict:
-        if not self.save_data:
-            return {}
+    def _reset_summary(self):
+        self._summary: Dict[str, object] = {}  # Memoized get_save_info fields
+        self._cash_index: Optional[int] = None  # Index of the CashData item in Items, -1 if there is none
+        self._cash_item: Optional[dict] = None
+
+    def _invalidate(self, *fields: str):
+        """Drop memoized get_save_info fields so they are recomputed on the next call."""
+        for field in fields:
+            self._summary.pop(field, None)
+
+    def reload_summary_sources(self):
+        """Re-read the files behind get_save_info after they were replaced on disk, e.g. by a revert."""
+        if not self.current_save:
+            return
+        for source, filename in SUMMARY_SOURCES.items():
+            self.save_data[source] = self._load_json_file(filename)
+        self._reset_summary()
+
+    def _summary_field(self, field: str):
+        if field in SUMMARY_FIELDS:
+            source, key, default, cast = SUMMARY_FIELDS[field]
+            value = self.save_data.get(source, {}).get(key, default)
+            return cast(value) if cast else value
+        if field == "playtime":
+            playtime_seconds = self.save_data.get("time", {}).get("Playtime", 0)
+            days = playtime_seconds // 86400  # 24*3600
+            remaining_seconds = playtime_seconds % 86400
+            hours = remaining_seconds // 3600
+            remaining_seconds %= 3600
+            minutes = remaining_seconds // 60
+            seconds = remaining_seconds % 60
+            return f"{days}d, {hours}h, {minutes}m, {seconds}s"
+        if field == "cash_balance":
+            cash_item = self._find_cash_item()
+            return int(cash_item.get("CashBalance", 0)) if cash_item else 0
+        strings = self._creation_strings()  # Date and time are parsed together
+        self._summary.update(strings)
+        return strings[field]
+
+    def _creation_strings(self) -> Dict[str, str]:
         creation_date_data = self.save_data.get("metadata", {}).get("CreationDate", {})
-        
+
         # Initialize formatted strings
         creation_date_str = "Unknown"
         creation_time_str = "Unknown"
-        time_data = self.save_data.get("time", {})
-        playtime_seconds = time_data.get("Playtime", 0)
-        
-        days = playtime_seconds // 86400  # 24*3600
-        remaining_seconds = playtime_seconds % 86400
-        hours = remaining_seconds // 3600
-        remaining_seconds %= 3600
-        minutes = remaining_seconds // 60
-        seconds = remaining_seconds % 60
-        playtime_str = f"{days}d, {hours}h, {minutes}m, {seconds}s"
 
         # Check if all required keys are present
         required_keys = ['Year', 'Month', 'Day', 'Hour', 'Minute', 'Second']
@@ -269,82 +507,125 @@ class SaveManager:
             except (ValueError, KeyError):
                 # Handle invalid date/time values
                 pass
-
-        money_data = self.save_data.get("money", {})
-        rank_data = self.save_data.get("rank", {})
-        
-        # Extract cash balance from inventory
-        cash_balance = 0
-        inventory = self.save_data.get("inventory", {})
-        if "Items" in inventory:
-            for item_str in inventory["Items"]:
+        return {"creation_date": creation_date_str, "creation_time": creation_time_str}
+
+    def _find_cash_item(self) -> Optional[dict]:
+        """
+        The decoded CashData item of the player inventory.
+
+        The Items list is scanned once per load; afterwards the item is found by index,
+        so reading or writing the cash balance does not decode any other item.
+        """
+        from lib import records
+        if self._cash_index is None:
+            self._cash_index = -1
+            for i, item_str in enumerate(self.save_data.get("inventory", {}).get("Items", [])):
                 try:
-                    item = json.loads(item_str)
-                    if item.get("DataType") == "CashData":
-                        cash_balance = int(item.get("CashBalance", 0))  # Ensure cash balance is an integer
-                        break
+                    item = records.loads(item_str)
                 except json.JSONDecodeError:
                     continue
+                if isinstance(item, records.CashData):
+                    self._cash_index, self._cash_item = i, item
+                    break
+        return self._cash_item if self._cash_index >= 0 else None
 
-        return {
-            "game_version": self.save_data.get("game", {}).get("GameVersion", "Unknown"),
-            "creation_date": creation_date_str,
-            "creation_time": creation_time_str,
-            "playtime": playtime_str,
-            "organisation_name": self.save_data.get("game", {}).get("OrganisationName", "Unknown"),
-            "online_money": int(money_data.get("OnlineBalance", 0)),
-            "networth": int(money_data.get("Networth", 0)),
-            "lifetime_earnings": int(money_data.get("LifetimeEarnings", 0)),
-            "weekly_deposit_sum": int(money_data.get("WeeklyDepositSum", 0)),
-            "current_rank": rank_data.get("CurrentRank", "Unknown"),
-            "rank_number": int(rank_data.get("Rank", 0)),
-            "tier": int(rank_data.get("Tier", 0)),
-            "cash_balance": cash_balance  # Ensure cash balance is an integer
-        }
+    def get_save_info(self) -> dict:
+        """Summary of the loaded save. Fields are computed once and recomputed only after a set_* call changes them."""
+        if not self.save_data:
+            return {}
+        for field in SUMMARY_ORDER:
+            if field not in self._summary:
+                self._summary[field] = self._summary_field(field)
+        return dict(self._summary)
 
     def _save_json_file(self, filename: str, data: dict):
+        from lib import records
         file_path = self.current_save / filename
         with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4)
+            json.dump(data, f, indent=4, default=records.encode)
+        self.file_written(filename)
+
+    def file_written(self, rel_path: Union[str, Path]):
+        """Bring the in-memory indexes up to date with a save file that was just written."""
+        from lib.properties import OBJECTS_DIR
+        from lib.quests import QUESTS_DIR
+        from lib.variables import VARIABLES_DIR
+        rel_path = Path(rel_path)
+        if self.search_index:
+            self.search_index.update(rel_path)
+        parts = rel_path.parts
+        if self.npcs and len(parts) > 2 and parts[0] == "NPCs":
+            self.npcs.update(parts[1])
+        if self.property_objects and len(parts) > 2 and parts[0] == "Properties":
+            self.property_objects.update(parts[1], parts[3] if len(parts) > 4 and parts[2] == OBJECTS_DIR else None)
+        if self.variables and len(parts) > 1 and parts[-2] == VARIABLES_DIR:
+            self.variables.update(rel_path)
+        if self.quests and parts[0] == QUESTS_DIR:
+            self.quests.update(rel_path)
+
+    def invalidate_indexes(self):
+        """Forget indexed save contents after many files changed at once, e.g. a revert."""
+        self.refresh_search_index()
+        if self.npcs:
+            self.npcs.invalidate()
+        if self.property_objects:
+            self.property_objects.invalidate()
+        if self.variables:
+            self.variables.invalidate()
+        if self.quests:
+            self.quests.invalidate()
+
+    def refresh_search_index(self):
+        """Bring the search index up to date in the background after files were added or replaced in bulk."""
+        if self.search_index:
+            self.search_index.start()
 
     def set_online_money(self, new_amount: int):
         if "money" in self.save_data:
             self.save_data["money"]["OnlineBalance"] = new_amount
+            self._invalidate("online_money")
             self._save_json_file("Money.json", self.save_data["money"])
 
     def set_networth(self, new_networth: int):
         if "money" in self.save_data:
             self.save_data["money"]["Networth"] = new_networth
+            self._invalidate("networth")
             self._save_json_file("Money.json", self.save_data["money"])
 
     def set_lifetime_earnings(self, new_earnings: int):
         if "money" in self.save_data:
             self.save_data["money"]["LifetimeEarnings"] = new_earnings
+            self._invalidate("lifetime_earnings")
             self._save_json_file("Money.json", self.save_data["money"])
 
     def set_weekly_deposit_sum(self, new_sum: int):
         if "money" in self.save_data:
             self.save_data["money"]["WeeklyDepositSum"] = new_sum
+            self._invalidate("weekly_deposit_sum")
             self._save_json_file("Money.json", self.save_data["money"])
 
     def set_rank(self, new_rank: str):
         if "rank" in self.save_data:
             self.save_data["rank"]["CurrentRank"] = new_rank
+            self._invalidate("current_rank")
             self._save_json_file("Rank.json", self.save_data["rank"])
 
     def set_rank_number(self, new_rank: int):
         if "rank" in self.save_data:
             self.save_data["rank"]["Rank"] = new_rank
+            self._invalidate("rank_number")
             self._save_json_file("Rank.json", self.save_data["rank"])
 
     def set_tier(self, new_tier: int):
         if "rank" in self.save_data:
             self.save_data["rank"]["Tier"] = new_tier
+            self._invalidate("tier")
             self._save_json_file("Rank.json", self.save_data["rank"])
 
     def set_organisation_name(self, new_name: str):
         if "game" in self.save_data:
             self.save_data["game"]["OrganisationName"] = new_name
+            self._invalidate("organisation_name")
             self._save_json_file("Game.json", self.save_data["game"])
 
     def add_discovered_products(self, product_ids: list):
@@ -373,13 +654,12 @@ class SaveManager:
             if pid not in discovered:
                 discovered.append(pid)
 
-        with open(products_json, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4)
+        self._save_json_file("Products/Products.json", data)
 
     def generate_products(self, count: int, id_length: int, price: int, 
                         add_to_listed: bool = False, add_to_favourited: bool = False,
                         min_properties: int = 1, max_properties: int = 34, 
-                        drug_type: int = 0, use_id_as_name: bool = False):
+                        drug_type: int = 0, use_id_as_name: bool = False, task: TaskContext = NO_TASK):
         products_path = self.current_save / "Products"
         os.makedirs(products_path, exist_ok=True)
         created_path = products_path / "CreatedProducts"
@@ -425,265 +705,225 @@ class SaveManager:
         def generate_id(length):
             return ''.join(random.choice(string.ascii_letters + string.digits) for _ in range(length))
 
-        for _ in range(count):
-            if use_id_as_name:
-                # Generate unique product_id when using IDs as names
-                product_id = generate_id(id_length)
-                while product_id in existing_ids:
+        def save_products():
+            if add_to_listed:
+                listed_products.extend(new_product_ids)
+            if add_to_favourited:
+                favourited_products.extend(new_product_ids)
+            self._save_json_file(products_rel_path, data)
+
+        try:
+            for n in range(count):
+                task.progress(n, count, f"Generating product {n + 1} of {count}")
+                if use_id_as_name:
+                    # Generate unique product_id when using IDs as names
                     product_id = generate_id(id_length)
-                existing_ids.add(product_id)
-                product_name = product_id
-                product_key = product_id
-            else:
-                # Select unique product_name when using random names
-                if self.available_names:
-                    product_name = self.available_names.pop(0)
+                    while product_id in existing_ids:
+                        product_id = generate_id(id_length)
+                    existing_ids.add(product_id)
+                    product_name = product_id
+                    product_key = product_id
                 else:
-                    base_name = GOOFYAHHHNAMES[0]
-                    i = 1
-                    while True:
-                        candidate = f"{base_name} {i}"
-                        if candidate not in self.used_names:
-                            product_name = candidate
-                            break
-                        i += 1
-                self.used_names.add(product_name)
-                product_key = product_name
-
-            # Add to discovered products
-            discovered.append(product_key)
-
-            # Create mix recipe
-            ingredient = random.choice(ingredients)
-            mix_recipes.append({
-                "Product": ingredient,
-                "Mixer": product_key,
-                "Output": product_key
-            })
-
-            # Set price if specified
-            if price is not None and price > 0:
-                prices.append({"String": product_key, "Int": price})
-
-            # Create product data
-            properties = random.sample(property_pool, random.randint(min_properties, max_properties))
-            product_data = {
-                "DataType": "WeedProductData",
-                "DataVersion": 0,
-                "GameVersion": "0.3.3f15",
-                "Name": product_name,
-                "ID": product_key,  # Set "ID" to product_key
-                "DrugType": drug_type,
-                "Properties": properties,
-                "AppearanceSettings": {
-                    "MainColor": {"r": random.randint(0, 255), "g": random.randint(0, 255), "b": random.randint(0, 255), "a": 255},
-                    "SecondaryColor": {"r": random.randint(0, 255), "g": random.randint(0, 255), "b": random.randint(0, 255), "a": 255},
-                    "LeafColor": {"r": random.randint(0, 255), "g": random.randint(0, 255), "b": random.randint(0, 255), "a": 255},
-                    "StemColor": {"r": random.randint(0, 255), "g": random.randint(0, 255), "b": random.randint(0, 255), "a": 255}
+                    # Select unique product_name when using random names
+                    if self.available_names:
+                        product_name = self.available_names.pop(0)
+                    else:
+                        base_name = GOOFYAHHHNAMES[0]
+                        i = 1
+                        while True:
+                            candidate = f"{base_name} {i}"
+                            if candidate not in self.used_names:
+                                product_name = candidate
+                                break
+                            i += 1
+                    self.used_names.add(product_name)
+                    product_key = product_name
+
+                # Add to discovered products
+                discovered.append(product_key)
+
+                # Create mix recipe
+                ingredient = random.choice(ingredients)
+                mix_recipes.append({
+                    "Product": ingredient,
+                    "Mixer": product_key,
+                    "Output": product_key
+                })
+
+                # Set price if specified
+                if price is not None and price > 0:
+                    prices.append({"String": product_key, "Int": price})
+
+                # Create product data
+                properties = random.sample(property_pool, random.randint(min_properties, max_properties))
+                product_data = {
+                    "DataType": "WeedProductData",
+                    "DataVersion": 0,
+                    "GameVersion": "0.3.3f15",
+                    "Name": product_name,
+                    "ID": product_key,  # Set "ID" to product_key
+                    "DrugType": drug_type,
+                    "Properties": properties,
+                    "AppearanceSettings": {
+                        "MainColor": {"r": random.randint(0, 255), "g": random.randint(0, 255), "b": random.randint(0, 255), "a": 255},
+                        "SecondaryColor": {"r": random.randint(0, 255), "g": random.randint(0, 255), "b": random.randint(0, 255), "a": 255},
+                        "LeafColor": {"r": random.randint(0, 255), "g": random.randint(0, 255), "b": random.randint(0, 255), "a": 255},
+                        "StemColor": {"r": random.randint(0, 255), "g": random.randint(0, 255), "b": random.randint(0, 255), "a": 255}
+                    }
                 }
-            }
 
-            # Save individual product file
-            product_rel_path = f"Products/CreatedProducts/{product_key}.json"
-            self._save_json_file(product_rel_path, product_data)
-
-            # Collect new product keys
-            new_product_ids.append(product_key)
-
-        if add_to_listed:
-            listed_products.extend(new_product_ids)
-        if add_to_favourited:
-            favourited_products.extend(new_product_ids)
-
-        self._save_json_file(products_rel_path, data)
+                # Save individual product file
+                product_rel_path = f"Products/CreatedProducts/{product_key}.json"
+                self._save_json_file(product_rel_path, product_data)
+
+                # Collect new product keys
+                new_product_ids.append(product_key)
+        except TaskCancelled:
+            # Register the products written so far, so no CreatedProducts file is left out of Products.json
+            save_products()
+            raise
+        save_products()
     
     def update_property_quantities(self, property_type: str, quantity: int, 
-                                packaging: str, update_type: str, quality: str) -> int:
+                                packaging: str, update_type: str, quality: str,
+                                task: TaskContext = NO_TASK) -> int:
         """Update quantities and quality in property Data.json files"""
         updated_count = 0
-        properties_path = self.current_save / "Properties"
-        
-        if not properties_path.exists():
-            return 0
-
-        # Determine directories to process
-        directories = []
-        if property_type == "all":
-            # Get all property directories
-            directories = [d for d in properties_path.iterdir() if d.is_dir()]
-        else:
-            # Use specified directory if it exists
-            target_dir = properties_path / property_type
-            if target_dir.exists() and target_dir.is_dir():
-                directories = [target_dir]
-
-        for prop_dir in directories:
-            objects_path = prop_dir / "Objects"
-            if not objects_path.exists():
-                continue
-
-            # Process all Data.json files
-            for data_file in objects_path.rglob("Data.json"):
-                try:
-                    with open(data_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
+        objects = self.property_objects.objects(None if property_type == "all" else property_type)
 
-                    if "Contents" not in data or "Items" not in data["Contents"]:
-                        continue
-
-                    modified = False
-                    items = data["Contents"]["Items"]
-                    for i, item_str in enumerate(items):
-                        item = json.loads(item_str)
-                        
-                        # Determine if we should modify this item
-                        modify = False
-                        if update_type == "both":
-                            modify = True
-                        elif update_type == "weed" and item.get("DataType") in ("WeedData", "CocaineData", "MethData"):
-                            modify = True
-                        elif update_type == "item" and item.get("DataType") == "ItemData":
-                            modify = True
-
-                        if modify:
-                            item["Quantity"] = quantity
-                            if item.get("DataType") in ("WeedData", "CocaineData", "MethData"):
-                                if packaging != "none":
-                                    item["PackagingID"] = packaging
-                                item["Quality"] = quality  # Set quality here
-                            items[i] = json.dumps(item)
-                            modified = True
-
-                    if modified:
-                        with open(data_file, 'w', encoding='utf-8') as f:
-                            json.dump(data, f, indent=4)
-                        updated_count += 1
-
-                except Exception as e:
-                    print(f"Error processing {data_file}: {str(e)}")
-
-        return updated_count
-
-    def complete_all_quests(self) -> tuple[int, int]:
-        """Mark all quests and objectives as completed. Returns (quests_completed, objectives_completed)"""
-        quests_path = self.current_save / "Quests"
-        if not quests_path.exists():
-            return 0, 0
-
-        quests_completed = 0
-        objectives_completed = 0
-
-        # Process all quest files
-        for file_path in quests_path.rglob("*.json"):
+        # Process all Data.json files
+        for n, (prop, object_id) in enumerate(objects):
+            task.progress(n, len(objects), f"Updating {object_id}")
+            rel_path = self.property_objects.data_path(prop, object_id).relative_to(self.current_save)
             try:
-                rel_path = file_path.relative_to(self.current_save)
-                data = self._load_json_file(str(rel_path))
-                
-                if data.get("DataType") != "QuestData":
+                data = self.property_objects.data(prop, object_id)
+                if not data or "Contents" not in data or "Items" not in data["Contents"]:
                     continue
 
                 modified = False
-                current_state = data.get("State")
-                if current_state in (0, 1):  # 0 = Not started, 1 = In progress
-                    data["State"] = 2  # 2 = Completed
-                    quests_completed += 1
-                    modified = True
-
-                # Update objectives
-                if "Entries" in data:
-                    for entry in data["Entries"]:
-                        current_entry_state = entry.get("State")
-                        if current_entry_state in (0, 1):
-                            entry["State"] = 2
-                            objectives_completed += 1
-                            modified = True
+                items = list(data["Contents"]["Items"])
+                for i, item_str in enumerate(items):
+                    item = json.loads(item_str)
+                    
+                    # Determine if we should modify this item
+                    modify = False
+                    if update_type == "both":
+                        modify = True
+                    elif update_type == "weed" and item.get("DataType") in ("WeedData", "CocaineData", "MethData"):
+                        modify = True
+                    elif update_type == "item" and item.get("DataType") == "ItemData":
+                        modify = True
+
+                    if modify:
+                        item["Quantity"] = quantity
+                        if item.get("DataType") in ("WeedData", "CocaineData", "MethData"):
+                            if packaging != "none":
+                                item["PackagingID"] = packaging
+                            item["Quality"] = quality  # Set quality here
+                        items[i] = json.dumps(item)
+                        modified = True
 
                 if modified:
-                    self._save_json_file(str(rel_path), data)
+                    data["Contents"]["Items"] = items
+                    self._save_json_file(rel_path, data)
+                    updated_count += 1
 
             except Exception as e:
-                print(f"Error processing {file_path}: {str(e)}")
-                continue
+                self.property_objects.update(prop, object_id)  # Drop a copy that may be half edited
+                print(f"Error processing {rel_path}: {str(e)}")
 
-        return quests_completed, objectives_completed
+        return updated_count
 
-    def modify_variables(self) -> int:
+    def quest_changes(self, selector: str, state: int) -> list:
+        """
+        The quests and objectives that set_quest_state(selector, state) would change, as
+        (file, quest data, whether the quest's State changes, objective indices), one per file.
+        """
+        from lib.quests import changes
+        planned = []
+        for rel, data, entries in self.quests.select(selector):
+            quest_changed, objectives = changes(data, entries, state)
+            if quest_changed or objectives:
+                planned.append((rel, data, quest_changed, objectives))
+        return planned
+
+    def set_quest_state(self, selector: str, state: int, task: TaskContext = NO_TASK) -> tuple[int, int]:
+        """
+        Set the State of the quests or objectives picked by selector (see QuestIndex.select).
+
+        Completing only changes quests and objectives that are not started or in progress.
+        Only the quest files that change are written. Returns (quests_changed, objectives_changed)
+        """
+        planned = self.quest_changes(selector, state)
+        quests_changed = objectives_changed = 0
+        for n, (rel, data, quest_changed, objectives) in enumerate(planned):
+            task.progress(n, len(planned), f"Updating {data.get('Title') or Path(rel).stem}")
+            if quest_changed:
+                data["State"] = state
+                quests_changed += 1
+            for i in objectives:
+                data["Entries"][i]["State"] = state
+            objectives_changed += len(objectives)
+            self._save_json_file(rel, data)
+        return quests_changed, objectives_changed
+
+    def complete_all_quests(self, task: TaskContext = NO_TASK) -> tuple[int, int]:
+        """Mark all quests and objectives as completed. Returns (quests_completed, objectives_completed)"""
+        from lib.quests import COMPLETED
+        return self.set_quest_state("*", COMPLETED, task=task)
+
+    def set_variables(self, pattern: str, value, scope: Optional[str] = None,
+                      task: TaskContext = NO_TASK) -> list[str]:
+        """
+        Set the Value of every variable whose name matches pattern (see VariableStore.find).
+
+        value is the new string, or a function from the current value to the new one.
+        Only files whose value actually changes are written. Returns the files written.
+        """
+        matches = [(rel, data) for rel, data in self.variables.find(pattern, scope) if "Value" in data]
+        written = []
+        for n, (rel, data) in enumerate(matches):
+            task.progress(n, len(matches), f"Modifying {data.get('Name') or Path(rel).stem}")
+            new_value = value(data["Value"]) if callable(value) else value
+            if new_value != data["Value"]:
+                data["Value"] = new_value
+                self._save_json_file(rel, data)
+                written.append(rel)
+        return written
+
+    def modify_variables(self, task: TaskContext = NO_TASK) -> int:
         """Modify variables in both root and player Variables folders"""
         if not self.current_save:
             raise ValueError("No save loaded")
 
-        count = 0
-        variables_dirs = []
-
-        # Add root Variables directory
-        root_vars = self.current_save / "Variables"
-        if root_vars.exists():
-            variables_dirs.append(root_vars)
-
-        # Add player Variables directories that exist
-        for i in range(10):
-            player_vars = self.current_save / f"Players/Player_{i}/Variables"
-            if player_vars.exists():
-                variables_dirs.append(player_vars)
-
-        # Process all found Variables directories
-        for var_dir in variables_dirs:
-            # Process JSON files
-            for json_file in var_dir.glob("*.json"):
-                rel_path = json_file.relative_to(self.current_save)
-                data = self._load_json_file(str(rel_path))
-                
-                if "Value" in data:
-                    original = data["Value"]
-                    if data["Value"] == "False":
-                        data["Value"] = "True"
-                        count += 1
-                    elif data["Value"] not in ["True", "False"]:
-                        data["Value"] = "999999999"
-                        count += 1
-                    
-                    if data["Value"] != original:
-                        self._save_json_file(str(rel_path), data)
+        def unlocked(value):
+            # Flags become True, counters and everything else 999999999
+            return "True" if value in ("True", "False") else "999999999"
 
-        return count
+        return len(self.set_variables("*", unlocked, task=task))
 
     def unlock_all_items_weeds(self):
             """Unlock all items and weeds by setting rank and tier to 999."""
             try:
-                self.current_save / "Rank.json"
-                data = self._load_json_file("Rank.json")
+                data = self.save_data.setdefault("rank", {})
                 data["Rank"] = 999
                 data["Tier"] = 999
+                self._invalidate("rank_number", "tier")
                 self._save_json_file("Rank.json", data)
                 return 1
             except Exception as e:
                 raise RuntimeError(f"Failed to unlock items and weeds: {str(e)}")
 
-    def unlock_all_properties(self):
-        """Unlock all properties by downloading and updating property data."""
+    def unlock_all_properties(self, task: TaskContext = NO_TASK):
+        """Unlock all properties by adding missing ones from the template and updating property data."""
+        from lib.templates import install_template
         try:
             properties_path = self.current_save / "Properties"
-            
-            with tempfile.TemporaryDirectory() as temp_dir:
-                zip_path = Path(temp_dir) / "Properties.zip"
-                extract_path = Path(temp_dir) / "extracted"
-                extract_path.mkdir()
-                
-                urllib.request.urlretrieve(
-                    "https://github.com/N0edL/Schedule-1-Save-Editor/raw/refs/heads/main/NPCs/Properties.zip",
-                    zip_path
-                )
-                
-                with zipfile.ZipFile(zip_path, 'r') as zf:
-                    zf.extractall(extract_path)
-                
-                extracted_props = extract_path / "Properties"
-                if extracted_props.exists():
-                    for prop_type in extracted_props.iterdir():
-                        if prop_type.is_dir():
-                            dst_dir = properties_path / prop_type.name
-                            if not dst_dir.exists():
-                                shutil.copytree(prop_type, dst_dir)
+            installed = install_template(self.templates.path("Properties.zip"), "Properties", properties_path)
+            for name in installed:
+                self.property_objects.update(name)
+            if installed:
+                self.refresh_search_index()
             
             updated = 0
             missing_template = {
@@ -696,7 +936,9 @@ class SaveManager:
                 "ToggleableStates": [True, True]
             }
             
-            for prop_type in properties_path.iterdir():
+            prop_types = [p for p in properties_path.iterdir() if p.is_dir()]
+            for n, prop_type in enumerate(prop_types):
+                task.progress(n, len(prop_types), f"Unlocking {prop_type.name}")
                 if prop_type.is_dir():
                     json_path = prop_type / "Property.json"
                     if not json_path.exists():
@@ -716,34 +958,18 @@ class SaveManager:
                         updated += 1
             
             return updated
+        except TaskCancelled:
+            raise
         except Exception as e:
             raise RuntimeError(f"Operation failed: {str(e)}")
 
-    def unlock_all_businesses(self):
-        """Unlock all businesses by downloading and updating business data."""
+    def unlock_all_businesses(self, task: TaskContext = NO_TASK):
+        """Unlock all businesses by adding missing ones from the template and updating business data."""
+        from lib.templates import install_template
         try:
             businesses_path = self.current_save / "Businesses"
-            
-            with tempfile.TemporaryDirectory() as temp_dir:
-                zip_path = Path(temp_dir) / "Businesses.zip"
-                extract_path = Path(temp_dir) / "extracted"
-                extract_path.mkdir()
-                
-                urllib.request.urlretrieve(
-                    "https://github.com/N0edL/Schedule-1-Save-Editor/raw/refs/heads/main/NPCs/Businesses.zip",
-                    zip_path
-                )
-                
-                with zipfile.ZipFile(zip_path, 'r') as zf:
-                    zf.extractall(extract_path)
-                
-                extracted_bus = extract_path / "Businesses"
-                if extracted_bus.exists():
-                    for bus_type in extracted_bus.iterdir():
-                        if bus_type.is_dir():
-                            dst_dir = businesses_path / bus_type.name
-                            if not dst_dir.exists():
-                                shutil.copytree(bus_type, dst_dir)
+            if install_template(self.templates.path("Businesses.zip"), "Businesses", businesses_path):
+                self.refresh_search_index()
             
             updated = 0
             missing_template = {
@@ -756,7 +982,9 @@ class SaveManager:
                 "ToggleableStates": [True, True]
             }
             
-            for bus_type in businesses_path.iterdir():
+            bus_types = [b for b in businesses_path.iterdir() if b.is_dir()]
+            for n, bus_type in enumerate(bus_types):
+                task.progress(n, len(bus_types), f"Unlocking {bus_type.name}")
                 if bus_type.is_dir():
                     json_path = bus_type / "Business.json"
                     if not json_path.exists():
@@ -776,11 +1004,15 @@ class SaveManager:
                         updated += 1
             
             return updated
+        except TaskCancelled:
+            raise
         except Exception as e:
             raise RuntimeError(f"Operation failed: {str(e)}")
 
-    def update_npc_relationships_function(self):
+    def update_npc_relationships_function(self, task: TaskContext = NO_TASK):
         """Update NPC relationships and recruit dealers using proper path handling and error reporting."""
+        from lib.npcs import DEALER_DATA, NPC_FILE, RELATIONSHIP_FILE
+        from lib.templates import install_template
         try:
             if not self.current_save:
                 raise ValueError("No save loaded")
@@ -788,75 +1020,61 @@ class SaveManager:
             npcs_dir = self.current_save / "NPCs"
             npcs_dir.mkdir(parents=True, exist_ok=True)
 
-            # Download and extract NPC templates
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-                zip_file = temp_path / "NPCs.zip"
-                extract_path = temp_path / "extracted"
-                
-                # Download NPC template archive
-                urllib.request.urlretrieve(
-                    "https://github.com/N0edL/Schedule-1-Save-Editor/raw/refs/heads/main/NPCs/NPCs.zip",
-                    str(zip_file)
-                )
-
-                # Extract ZIP contents
-                with zipfile.ZipFile(zip_file, 'r') as zf:
-                    zf.extractall(str(extract_path))
-
-                # Copy missing NPCs from template
-                template_dir = extract_path / "NPCs"
-                if not template_dir.exists():
-                    raise FileNotFoundError("NPC template directory missing in archive")
-
-                existing_npcs = {npc.name for npc in npcs_dir.iterdir() if npc.is_dir()}
-                for npc_template in template_dir.iterdir():
-                    if npc_template.is_dir() and npc_template.name not in existing_npcs:
-                        shutil.copytree(npc_template, npcs_dir / npc_template.name)
+            # Copy missing NPCs straight from the bundled or cached template archive
+            installed = install_template(self.templates.path("NPCs.zip"), "NPCs", npcs_dir)
+            for name in installed:
+                self.npcs.update(name)
+            if installed:
+                self.refresh_search_index()
 
             # Process all NPC relationships
+            unlocked = {"RelationDelta": 999, "Unlocked": True, "UnlockType": 1}
             updated_count = 0
-            for npc_folder in npcs_dir.iterdir():
-                if not npc_folder.is_dir():
-                    continue
-
-                # Update Relationship.json
-                relationship_file = npc_folder / "Relationship.json"
-                if relationship_file.exists():
-                    rel_data = self._load_json_file(relationship_file.relative_to(self.current_save))
-                    rel_data.update({
-                        "RelationDelta": 999,
-                        "Unlocked": True,
-                        "UnlockType": 1
-                    })
-                    self._save_json_file(relationship_file.relative_to(self.current_save), rel_data)
+            names = self.npcs.names()
+            for n, name in enumerate(names):
+                task.progress(n, len(names), f"Updating {name}")
+                npc = self.npcs.get(name)
+
+                # Update Relationship.json, skipping NPCs that are already fully unlocked
+                if npc["relationship"] is not None:
+                    if npc["relationship"] != unlocked:
+                        rel_path = Path("NPCs", name, RELATIONSHIP_FILE)
+                        rel_data = self._load_json_file(rel_path)
+                        rel_data.update(unlocked)
+                        self._save_json_file(rel_path, rel_data)
                     updated_count += 1
 
-                # Update DealerData in NPC.json
-                npc_file = npc_folder / "NPC.json"
-                if npc_file.exists():
-                    npc_data = self._load_json_file(npc_file.relative_to(self.current_save))
-                    if npc_data.get("DataType") == "DealerData":
-                        npc_data["Recruited"] = True
-                        self._save_json_file(npc_file.relative_to(self.current_save), npc_data)
+                # Recruit dealers
+                if npc["data_type"] == DEALER_DATA and npc["recruited"] is not True:
+                    npc_path = Path("NPCs", name, NPC_FILE)
+                    npc_data = self._load_json_file(npc_path)
+                    npc_data["Recruited"] = True
+                    self._save_json_file(npc_path, npc_data)
 
             return updated_count
 
+        except TaskCancelled:
+            raise
         except Exception as e:
             raise RuntimeError(f"NPC relationship update failed: {str(e)}")
 
     def create_initial_backup(self):
         """Create an initial backup of the save folder if it doesn't exist."""
+        from lib.backups import BACKUP_METADATA, write_manifest
         if not self.backup_path.exists():
             shutil.copytree(self.current_save, self.backup_path)
+            write_manifest(self.backup_path, BACKUP_METADATA)
 
-    def create_feature_backup(self, feature_name: str, paths: list[Path]):
-        """Create a timestamped backup for specific files or directories."""
-        from datetime import datetime  # Ensure datetime is imported
+    def create_feature_backup(self, feature_name: str, paths: list[Path], description: str = ""):
+        """Create a timestamped backup for specific files or directories, then prune old ones."""
+        from lib.backups import directory_stats, write_manifest
         timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
         backup_dir = self.feature_backups / feature_name / timestamp
         backup_dir.mkdir(parents=True, exist_ok=True)
+        roots = []
         for path in paths:
+            if path.exists():
+                roots.append(path.relative_to(self.current_save).as_posix())
             if path.is_file():
                 rel_path = path.relative_to(self.current_save)
                 dest = backup_dir / rel_path
@@ -866,36 +1084,198 @@ class SaveManager:
                 rel_path = path.relative_to(self.current_save)
                 dest = backup_dir / rel_path
                 shutil.copytree(path, dest, dirs_exist_ok=True)
+        files, size = directory_stats(backup_dir)
+        manifest = write_manifest(backup_dir)
+        self.backup_catalog.add(feature_name, timestamp, files, size, description, roots)
+        self.timeline.add_snapshot(feature_name, timestamp, sorted(manifest["files"]))
+        self.prune_backups()
+
+    def prune_backups(self) -> list[tuple[str, str]]:
+        """Apply the retention policy and drop evicted snapshots from the file timeline."""
+        evicted = self.retention.enforce()
+        for feature, timestamp in evicted:
+            self.timeline.remove(feature, timestamp)
+        return evicted
+
+    def set_retention_policy(self, policy: "RetentionPolicy"):
+        """Persist new retention settings and apply them to the current backups."""
+        policy.save(CONFIG_DIR / "retention.json")
+        self._retention_policy = policy
+        if self.retention:
+            self.retention.policy = policy
+            return self.prune_backups()
+        return []
+
+    def delete_all_backups(self):
+        """Delete the initial backup and every feature snapshot of the current save."""
+        shutil.rmtree(self.backup_path)
+        self.backup_catalog.clear()
+        self.timeline.clear()
 
     def list_feature_backups(self) -> dict[str, list[str]]:
-        """List all feature backups with their timestamps."""
-        if not self.feature_backups.exists():
+        """List all feature backups with their timestamps, newest first."""
+        if not self.backup_catalog:
             return {}
-        backups = {}
-        for feature_dir in self.feature_backups.iterdir():
-            if feature_dir.is_dir():
-                timestamps = [d.name for d in feature_dir.iterdir() if d.is_dir()]
-                if timestamps:
-                    backups[feature_dir.name] = sorted(timestamps, reverse=True)
-        return backups
+        return self.backup_catalog.by_feature()
 
     def revert_feature(self, feature: str, timestamp: str):
         """Revert a specific feature to a given backup timestamp."""
         backup_dir = self.feature_backups / feature / timestamp
         if not backup_dir.exists():
             raise FileNotFoundError(f"Backup not found: {backup_dir}")
-        
-        feature_dir = self.current_save / feature
-        if feature_dir.exists():
-            shutil.rmtree(feature_dir)  # Remove existing feature directory
-        shutil.copytree(backup_dir / feature, feature_dir)  # Copy entire backup directory
+
+        entry = self.backup_catalog.get(feature, timestamp) or {}
+        if entry.get("roots"):
+            # Only put back what was captured, e.g. one dealer folder rather than all of NPCs
+            for root in entry["roots"]:
+                source, target = backup_dir / root, self.current_save / root
+                if source.is_dir():
+                    if target.exists():
+                        shutil.rmtree(target)
+                    shutil.copytree(source, target)
+                elif source.is_file():
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    shutil.copy2(source, target)
+        else:
+            feature_dir = self.current_save / feature
+            if feature_dir.exists():
+                shutil.rmtree(feature_dir)  # Remove existing feature directory
+            shutil.copytree(backup_dir / feature, feature_dir)  # Copy entire backup directory
+        self.reload_summary_sources()
+        self.invalidate_indexes()
 
     def revert_all_changes(self):
         """Revert all changes by restoring the initial backup."""
+        from lib.backups import BACKUP_METADATA
         if not self.backup_path.exists():
             raise FileNotFoundError("Initial backup not found")
         shutil.rmtree(self.current_save)
-        shutil.copytree(self.backup_path, self.current_save)
+        shutil.copytree(self.backup_path, self.current_save, ignore=shutil.ignore_patterns(*BACKUP_METADATA))
+        self.reload_summary_sources()
+        self.invalidate_indexes()
+
+    def get_file_versions(self, rel_path: str) -> list[tuple[str, str]]:
+        """Every backed-up (timestamp, feature) version of a save-relative file, newest first."""
+        if not self.timeline:
+            return []
+        return self.timeline.versions(rel_path)
+
+    def get_file_version_at(self, rel_path: str, when: datetime) -> Optional[tuple[str, str]]:
+        """The (timestamp, feature) version of a save-relative file that was current at a point in time."""
+        from lib.backups import TIMESTAMP_FORMAT
+        if not self.timeline:
+            return None
+        return self.timeline.version_at(rel_path, when.strftime(TIMESTAMP_FORMAT))
+
+    def read_file_version(self, rel_path: str, timestamp: str, feature: str) -> str:
+        source = self.timeline.source(rel_path, timestamp, feature)
+        with open(source, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def restore_file_version(self, rel_path: str, timestamp: str, feature: str):
+        """Restore a single file from a backup, keeping a snapshot of the current file first."""
+        source = self.timeline.source(rel_path, timestamp, feature)
+        if not source.is_file():
+            raise FileNotFoundError(f"Backup version not found: {source}")
+        target = self.current_save / rel_path
+        if target.exists():
+            self.create_feature_backup("FileRestore", [target], f"Before restoring {rel_path}")
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(source, target)
+        self.file_written(rel_path)
+        if rel_path in SUMMARY_SOURCES.values():
+            self.reload_summary_sources()
+
+    def verify_backups(self, full: bool = False, task: TaskContext = NO_TASK) -> list[dict]:
+        """Check the initial backup and every feature snapshot against their stored digests."""
+        from lib.backups import BackupVerifier
+        if not self.backup_path or not self.backup_path.exists():
+            return []
+        return BackupVerifier(self.backup_path).verify(
+            full=full, progress=lambda done, total: task.progress(done, total, f"Hashing file {done} of {total}"))
+
+    def diff_against(self, kind: str, target=None) -> list[dict]:
+        """
+        Compare the live save with a backup or another save.
+
+        Args:
+            kind: "initial" for the initial backup, "snapshot" for a feature backup
+                (target is a (feature, timestamp) tuple) or "save" (target is a save path).
+
+        Returns:
+            list[dict]: Differing files as returned by lib.diff.diff_trees, with the
+            backup or other save as the old side and the live save as the new side.
+        """
+        from lib.backups import BACKUP_METADATA, MANIFEST_FILE
+        from lib.diff import DigestCache, SaveTree, diff_trees
+        if kind == "initial":
+            if not self.backup_path.exists():
+                raise FileNotFoundError("Initial backup not found")
+            old = SaveTree(self.backup_path, exclude=BACKUP_METADATA, use_manifest=True)
+            new = SaveTree(self.current_save)
+        elif kind == "snapshot":
+            feature, timestamp = target
+            backup_dir = self.feature_backups / feature / timestamp
+            if not backup_dir.exists():
+                raise FileNotFoundError(f"Backup not found: {backup_dir}")
+            entry = self.backup_catalog.get(feature, timestamp) or {}
+            # Only compare what the snapshot captured; anything new under those roots counts as added
+            roots = entry.get("roots") or [p.name for p in backup_dir.iterdir() if p.name != MANIFEST_FILE]
+            old = SaveTree(backup_dir, roots=roots, use_manifest=True)
+            new = SaveTree(self.current_save, roots=roots)
+        elif kind == "save":
+            old = SaveTree(Path(target))
+            new = SaveTree(self.current_save)
+        else:
+            raise ValueError(f"Unknown comparison: {kind}")
+        if self.digest_cache is None:
+            self.digest_cache = DigestCache()
+        return diff_trees(old, new, self.digest_cache)
+
+    def open_database(self, task: TaskContext = NO_TASK):
+        """The query database for the current save, re-indexing only files changed since its last use."""
+        from lib.savedb import SaveDatabase
+        if self.database is None:
+            self.database = SaveDatabase(self.current_save)
+        try:
+            self.database.refresh(lambda done, total: task.progress(done, total, "Indexing save"))
+        except BaseException:
+            self.close_database()  # A half-indexed database is rebuilt next time
+            raise
+        return self.database
+
+    def close_database(self):
+        if self.database is not None:
+            self.database.close()
+            self.database = None
+
+    def run_query(self, sql: str, task: TaskContext = NO_TASK) -> tuple[list, list, list]:
+        """
+        Run one SQL statement against the save database (see lib.savedb).
+
+        Values changed by an UPDATE are written back straight away, after a "Query"
+        feature backup of just the files that change.
+
+        Returns:
+            tuple: (column names, rows, save-relative paths of the files written)
+        """
+        db = self.open_database(task)
+        columns, rows = db.execute(sql)
+        try:
+            pending = db.pending_changes()
+            if pending:
+                summary = " ".join(sql.split())
+                self.create_feature_backup("Query", [self.current_save / rel for rel in pending],
+                                           summary if len(summary) <= 60 else summary[:57] + "...")
+            written = db.write_back()
+        except BaseException:
+            self.close_database()  # Rebuilt from the files on the next query
+            raise
+        for rel in written:
+            self.file_written(rel)
+        if any(rel in SUMMARY_SOURCES.values() for rel in written):
+            self.reload_summary_sources()
+        return columns, rows, written
 
     def remove_discovered_products(self, product_ids: list) -> list:
         products_path = self.current_save / "Products"
@@ -913,11 +1293,40 @@ class SaveManager:
                 discovered.remove(pid)
                 removed.append(pid)
 
-        with open(products_json, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4)
+        self._save_json_file("Products/Products.json", data)
 
         return removed
 
+    def delete_generated_products(self) -> int:
+        """Delete every CreatedProducts file and remove those products from all lists. Returns the number deleted."""
+        products_path = self.current_save / "Products"
+        created_path = products_path / "CreatedProducts"
+        products_json = products_path / "Products.json"
+        if not created_path.exists():
+            return 0
+
+        created_files = [f for f in created_path.glob("*.json") if f.is_file()]
+        generated_ids = {f.stem for f in created_files}
+        if not generated_ids:
+            return 0
+
+        if products_json.exists():
+            data = self._load_json_file("Products/Products.json")
+        else:
+            data = {"DiscoveredProducts": [], "ListedProducts": [], "MixRecipes": [], "ProductPrices": [], "FavouritedProducts": []}
+
+        data["DiscoveredProducts"] = [pid for pid in data.get("DiscoveredProducts", []) if pid not in generated_ids]
+        data["ListedProducts"] = [pid for pid in data.get("ListedProducts", []) if pid not in generated_ids]
+        data["MixRecipes"] = [recipe for recipe in data.get("MixRecipes", []) if recipe.get("Output") not in generated_ids]
+        data["ProductPrices"] = [price for price in data.get("ProductPrices", []) if price.get("String") not in generated_ids]
+        data["FavouritedProducts"] = [pid for pid in data.get("FavouritedProducts", []) if pid not in generated_ids]
+        self._save_json_file("Products/Products.json", data)
+
+        for file_path in created_files:
+            file_path.unlink()
+            self.file_written(file_path.relative_to(self.current_save))
+        return len(generated_ids)
+
     def get_next_save_folder_name(self) -> str:
         if not hasattr(self, 'steamid_folder') or not self.steamid_folder:
             raise ValueError("Steam ID folder not found")
@@ -944,75 +1353,39 @@ class SaveManager:
         return None
 
     def set_cash_balance(self, new_balance: int):
-        if "inventory" in self.save_data:
-            inventory = self.save_data["inventory"]
-            if "Items" in inventory:
-                for i, item_str in enumerate(inventory["Items"]):
-                    try:
-                        item = json.loads(item_str)
-                        if item.get("DataType") == "CashData":
-                            item["CashBalance"] = new_balance
-                            inventory["Items"][i] = json.dumps(item)
-                            self._save_json_file("Players/Player_0/Inventory.json", inventory)
-                            return
-                    except json.JSONDecodeError:
-                        continue
-                else:
-                    print("No CashData item found in inventory.")
-            else:
-                print("No 'Items' key in inventory.")
-        else:
+        from lib import records
+        if "inventory" not in self.save_data:
             print("No 'inventory' in save_data.")
+            return
+        inventory = self.save_data["inventory"]
+        if "Items" not in inventory:
+            print("No 'Items' key in inventory.")
+            return
+        cash_item = self._find_cash_item()
+        if cash_item is None:
+            print("No CashData item found in inventory.")
+            return
+        cash_item["CashBalance"] = new_balance
+        inventory["Items"][self._cash_index] = records.dumps(cash_item)
+        self._invalidate("cash_balance")
+        self._save_json_file("Players/Player_0/Inventory.json", inventory)
 
     def get_dealers(self) -> list[str]:
-        """Retrieve a list of dealer names from the NPCs directory."""
-        npcs_dir = self.current_save / "NPCs"
-        if not npcs_dir.exists():
-            return []
-        dealers = []
-        for npc_folder in npcs_dir.iterdir():
-            if npc_folder.is_dir():
-                npc_json_path = npc_folder / "NPC.json"
-                if npc_json_path.exists():
-                    try:
-                        with open(npc_json_path, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                        if data.get("DataType") == "DealerData":
-                            dealers.append(npc_folder.name)
-                    except json.JSONDecodeError:
-                        continue
-        return dealers
+        """Names of the NPCs whose NPC.json holds DealerData."""
+        return self.npcs.dealers() if self.npcs else []
 
     def get_plastic_pots(self, property_type: Optional[str] = None):
         """Retrieve plastic pots filtered by property type if specified."""
+        from lib.properties import PLASTIC_POT
         plastic_pots = []
-        properties_path = self.current_save / "Properties"
-        if not properties_path.exists():
-            return plastic_pots
-        
-        # Get directories to process based on filter
-        prop_dirs = []
-        if property_type:
-            target_dir = properties_path / property_type
-            if target_dir.exists():
-                prop_dirs.append(target_dir)
-        else:
-            prop_dirs = [d for d in properties_path.iterdir() if d.is_dir()]
-        
-        for prop_dir in prop_dirs:
-            objects_path = prop_dir / "Objects"
-            if objects_path.exists():
-                for obj_dir in objects_path.iterdir():
-                    if obj_dir.is_dir() and obj_dir.name.startswith("plasticpot_"):
-                        data_path = obj_dir / "Data.json"
-                        if data_path.exists():
-                            with open(data_path, 'r', encoding='utf-8') as f:
-                                data = json.load(f)
-                            plastic_pots.append({
-                                'property_type': prop_dir.name,
-                                'object_id': obj_dir.name,
-                                'data': data
-                            })
+        for prop, object_id in self.property_objects.objects(property_type, PLASTIC_POT):
+            data = self.property_objects.data(prop, object_id)  # PlantData is a slotted record
+            if data is not None:
+                plastic_pots.append({
+                    'property_type': prop,
+                    'object_id': object_id,
+                    'data': data
+                })
         return plastic_pots
 
 class FeatureRevertDialog(QDialog):
@@ -1151,6 +1524,9 @@ class RankTab(QWidget):
 
 class PropertiesTab(QWidget):
     def __init__(self, parent=None, main_window=None):
+        from lib.models import (
+            ChoiceDelegate, GROWTH_STAGES, IntegerDelegate, POT_QUALITIES, PlasticPotModel, SEED_IDS
+        )
         super().__init__(parent)
         self.main_window = main_window
         layout = QVBoxLayout()
@@ -1190,12 +1566,18 @@ class PropertiesTab(QWidget):
         self.plastic_pots_group = QGroupBox("Plastic Pots")
         plastic_pots_layout = QVBoxLayout()
 
-        self.plastic_pots_table = QTableWidget()
-        self.plastic_pots_table.setColumnCount(6)
-        self.plastic_pots_table.setHorizontalHeaderLabels([
-            "Property Type", "Object ID", "SeedID", "QualityLevel", "GrowthProgress", "RemainingSoilUses"
-        ])
+        self.plastic_pots_model = PlasticPotModel(self)
+        self.plastic_pots_table = QTableView()
+        self.plastic_pots_table.setModel(self.plastic_pots_model)
+        self.plastic_pots_table.setItemDelegateForColumn(2, ChoiceDelegate(SEED_IDS, self.plastic_pots_table))
+        self.plastic_pots_table.setItemDelegateForColumn(3, ChoiceDelegate(POT_QUALITIES, self.plastic_pots_table))
+        self.plastic_pots_table.setItemDelegateForColumn(4, ChoiceDelegate(GROWTH_STAGES, self.plastic_pots_table))
+        self.plastic_pots_table.setItemDelegateForColumn(5, IntegerDelegate(999, self.plastic_pots_table))
+        self.plastic_pots_table.setEditTriggers(
+            QTableView.DoubleClicked | QTableView.EditKeyPressed | QTableView.SelectedClicked
+        )
         self.plastic_pots_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.plastic_pots_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         plastic_pots_layout.addWidget(self.plastic_pots_table)
         self.save_plastic_pots_btn = QPushButton("Save Plastic Pots Changes")
         self.save_plastic_pots_btn.clicked.connect(self.save_plastic_pots_changes)
@@ -1210,16 +1592,16 @@ class PropertiesTab(QWidget):
         self.load_property_types()
 
     def load_property_types(self):
+        """Fill the property combo from the property index. Callers reload the pots afterwards."""
+        self.property_combo.blockSignals(True)  # Repopulating must not reload the pots once per item
         self.property_combo.clear()
         try:
             if not self.main_window or not self.main_window.manager.current_save:
                 return
 
-            properties_path = self.main_window.manager.current_save / "Properties"
-            if not properties_path.exists():
+            dirs = self.main_window.manager.property_objects.properties()
+            if not dirs:
                 return
-
-            dirs = [d.name for d in properties_path.iterdir() if d.is_dir()]
             
             dir_mapping = {
                 "barn": "Barn",
@@ -1245,6 +1627,8 @@ class PropertiesTab(QWidget):
         except Exception as e:
             print(f"Error loading properties: {str(e)}")
             self.property_combo.addItem("Error loading properties", "error")
+        finally:
+            self.property_combo.blockSignals(False)
 
     def update_properties(self):
         if not self.main_window or not self.main_window.manager.current_save:
@@ -1257,176 +1641,71 @@ class PropertiesTab(QWidget):
             update_type = self.update_combo.currentText()
             quality = self.quality_combo.currentText()
 
-            # Backup properties
-            properties_path = self.main_window.manager.current_save / "Properties"
-            self.main_window.manager.create_feature_backup("Properties", [properties_path])
+            manager = self.main_window.manager
 
-            updated = self.main_window.manager.update_property_quantities(
-                property_type, quantity, packaging, update_type, quality
-            )
-            self.main_window.backups_tab.refresh_backup_list()
-            QMessageBox.information(self, "Success", f"Updated {updated} property locations")
+            def work(task):
+                # Backup properties
+                properties_path = manager.current_save / "Properties"
+                manager.create_feature_backup("Properties", [properties_path], "Update property quantities")
+                return manager.update_property_quantities(
+                    property_type, quantity, packaging, update_type, quality, task=task
+                )
+
+            def done(updated):
+                self.main_window.mark_tabs_stale("backups_tab")
+                QMessageBox.information(self, "Success", f"Updated {updated} property locations")
+
+            self.main_window.tasks.run("Updating properties", work, on_done=done)
         except ValueError:
             QMessageBox.warning(self, "Invalid Input", "Please enter a valid quantity")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to update properties: {str(e)}")
 
     def load_plastic_pots(self):
-        self.plastic_pots_table.setRowCount(0)
         selected_property = self.property_combo.currentData()
         plastic_pots = self.main_window.manager.get_plastic_pots(
             selected_property if selected_property != "all" else None
         )
-        for pot in plastic_pots:
-            row = self.plastic_pots_table.rowCount()
-            self.plastic_pots_table.insertRow(row)
-            self.plastic_pots_table.setItem(row, 0, QTableWidgetItem(pot['property_type']))
-            self.plastic_pots_table.setItem(row, 1, QTableWidgetItem(pot['object_id']))
-            
-            # Access PlantData sub-object
-            plant_data = pot['data'].get("PlantData", {})
-            
-            # SeedID
-            seed_combo = QComboBox()
-            seed_options = ["ogkushseed", "sourdieselseed", "greencrackseed", "granddaddypurpleseed"]
-            seed_combo.addItems(seed_options)
-            current_seed = plant_data.get("SeedID", "")
-            if current_seed in seed_options:
-                seed_combo.setCurrentText(current_seed)
-            else:
-                seed_combo.setCurrentIndex(0)  # Default to first option if invalid
-            self.plastic_pots_table.setCellWidget(row, 2, seed_combo)
-            
-            # QualityLevel
-            quality_combo = QComboBox()
-            quality_labels = ["trash", "poor", "standard", "premium", "heavenly"]
-            quality_combo.addItems(quality_labels)
-            current_quality = plant_data.get("QualityLevel", 0.0)
-            quality_label = self.get_quality_label(current_quality)
-            if quality_label in quality_labels:
-                quality_combo.setCurrentText(quality_label)
-            else:
-                quality_combo.setCurrentText("standard")  # Default if unknown
-            self.plastic_pots_table.setCellWidget(row, 3, quality_combo)
-            
-            # GrowthProgress
-            growth_combo = QComboBox()
-            growth_labels = ["not grown", "abit grown", "medium grown", "near grown", "fully grown"]
-            growth_combo.addItems(growth_labels)
-            current_growth = plant_data.get("GrowthProgress", 0.0)
-            growth_label = self.get_growth_label(current_growth)
-            if growth_label in growth_labels:
-                growth_combo.setCurrentText(growth_label)
-            else:
-                growth_combo.setCurrentText("not grown")  # Default if unknown
-            self.plastic_pots_table.setCellWidget(row, 4, growth_combo)
-            
-            # RemainingSoilUses (still at root level)
-            remaining_uses = str(pot['data'].get("RemainingSoilUses", 0))
-            uses_edit = QLineEdit()
-            uses_edit.setValidator(QIntValidator(0, 999))
-            uses_edit.setText(remaining_uses)
-            self.plastic_pots_table.setCellWidget(row, 5, uses_edit)
-
-    def get_quality_label(self, value):
-            if 0.1 <= value <= 0.2:
-                return "trash"
-            elif 0.3 <= value <= 0.4:
-                return "poor"
-            elif 0.5 <= value <= 0.6:
-                return "standard"
-            elif 0.7 <= value <= 0.8:
-                return "premium"
-            elif 0.9 <= value <= 1.0:
-                return "heavenly"
-            else:
-                return "unknown"
-
-    def get_growth_label(self, value):
-        if 0.1 <= value <= 0.2:
-            return "not grown"
-        elif 0.3 <= value <= 0.4:
-            return "abit grown"
-        elif 0.5 <= value <= 0.6:
-            return "medium grown"
-        elif 0.7 <= value <= 0.8:
-            return "near grown"
-        elif 0.9 <= value <= 1.0:
-            return "fully grown"
-        else:
-            return "unknown"
+        self.plastic_pots_model.load(plastic_pots)
 
     def save_plastic_pots_changes(self):
-        for row in range(self.plastic_pots_table.rowCount()):
-            property_type = self.plastic_pots_table.item(row, 0).text()
-            object_id = self.plastic_pots_table.item(row, 1).text()
-            data_path = self.main_window.manager.current_save / "Properties" / property_type / "Objects" / object_id / "Data.json"
-            if not data_path.exists():
-                continue
-            
-            # Load the existing data
-            with open(data_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Clean up any incorrect root-level fields (optional but recommended)
-            for field in ["SeedID", "QualityLevel", "GrowthProgress"]:
-                if field in data:
-                    del data[field]
-            
-            # Ensure PlantData exists and update its fields
-            if "PlantData" not in data:
-                data["PlantData"] = {
-                    "DataType": "PlantData",
-                    "DataVersion": 0,
-                    "GameVersion": "0.3.3f15",
-                    "SeedID": "",
-                    "GrowthProgress": 0.0,
-                    "YieldLevel": 0.0,
-                    "QualityLevel": 0.0,
-                    "ActiveBuds": []
-                }
-            
-            # Update SeedID
-            seed_combo = self.plastic_pots_table.cellWidget(row, 2)
-            data["PlantData"]["SeedID"] = seed_combo.currentText()
-            
-            # Update QualityLevel
-            quality_combo = self.plastic_pots_table.cellWidget(row, 3)
-            quality_label = quality_combo.currentText()
-            quality_value = {
-                "trash": 0.15,
-                "poor": 0.35,
-                "standard": 0.55,
-                "premium": 0.75,
-                "heavenly": 0.95
-            }.get(quality_label, 0.0)
-            data["PlantData"]["QualityLevel"] = quality_value
-            
-            # Update GrowthProgress
-            growth_combo = self.plastic_pots_table.cellWidget(row, 4)
-            growth_label = growth_combo.currentText()
-            growth_value = {
-                "not grown": 0.15,
-                "abit grown": 0.35,
-                "medium grown": 0.55,
-                "near grown": 0.75,
-                "fully grown": 0.95
-            }.get(growth_label, 0.0)
-            data["PlantData"]["GrowthProgress"] = growth_value
-            
-            # Update RemainingSoilUses (still at root level)
-            uses_edit = self.plastic_pots_table.cellWidget(row, 5)
-            try:
-                remaining_uses = int(uses_edit.text())
-            except ValueError:
-                remaining_uses = 0
-            data["RemainingSoilUses"] = remaining_uses
-            
-            # Save the updated data
-            with open(data_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4)
-        
-        QMessageBox.information(self, "Success", "Plastic pots changes saved successfully!")
+        """Write only the plastic pots that were edited since they were loaded."""
+        dirty = self.plastic_pots_model.dirty_pots()
+        if not dirty:
+            QMessageBox.information(self, "No Changes", "No plastic pots have been modified.")
+            return
+        manager = self.main_window.manager
+        data_paths = [
+            manager.current_save / "Properties" / pot['property_type'] / "Objects" / pot['object_id'] / "Data.json"
+            for pot, _ in dirty
+        ]
+
+        def work(task):
+            from lib.models import PlasticPotModel
+            manager.create_feature_backup("Properties", [p for p in data_paths if p.exists()],
+                                          f"Edit {len(dirty)} plastic pots")
+            saved = []
+            for n, ((pot, edits), data_path) in enumerate(zip(dirty, data_paths)):
+                task.progress(n, len(dirty), f"Saving {pot['object_id']}")
+                if not data_path.exists():
+                    continue
+                with open(data_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                data = PlasticPotModel.apply_edits(data, edits)
+                with open(data_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=4)
+                manager.file_written(data_path.relative_to(manager.current_save))
+                saved.append((pot, data))
+            return saved
+
+        def done(saved):
+            for pot, data in saved:
+                pot['data'] = data
+            self.plastic_pots_model.mark_saved()
+            self.main_window.mark_tabs_stale("backups_tab")
+            QMessageBox.information(self, "Success", f"Saved changes to {len(saved)} plastic pots.")
+
+        self.main_window.tasks.run("Saving plastic pots", work, on_done=done, cancellable=False)
 
 class ProductsTab(QWidget):
     def __init__(self, parent=None, main_window=None):
@@ -1550,17 +1829,19 @@ class ProductsTab(QWidget):
         if not products_to_discover:
             QMessageBox.warning(self, "No Selection", "Please select at least one product to discover.")
             return
+        manager = self.main_window.manager
 
-        try:
+        def work(task):
             # Create backup before modification
-            products_path = self.main_window.manager.current_save / "Products"
-            self.main_window.manager.create_feature_backup("Products", [products_path])
-            self.main_window.backups_tab.refresh_backup_list()
+            products_path = manager.current_save / "Products"
+            manager.create_feature_backup("Products", [products_path], "Discover products")
+            manager.add_discovered_products(products_to_discover)
 
-            self.main_window.manager.add_discovered_products(products_to_discover)
+        def done(_):
+            self.main_window.mark_tabs_stale("backups_tab")
             QMessageBox.information(self, "Success", "Successfully discovered selected products!")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to discover products: {str(e)}")
+
+        self.main_window.tasks.run("Discovering products", work, on_done=done)
 
     def undiscover_selected_products(self):
         """Handle the undiscovery of selected products."""
@@ -1577,20 +1858,22 @@ class ProductsTab(QWidget):
         if not products_to_undiscover:
             QMessageBox.warning(self, "No Selection", "Please select at least one product to undiscover.")
             return
+        manager = self.main_window.manager
 
-        try:
+        def work(task):
             # Create backup before modification
-            products_path = self.main_window.manager.current_save / "Products"
-            self.main_window.manager.create_feature_backup("Products", [products_path])
-            self.main_window.backups_tab.refresh_backup_list()
+            products_path = manager.current_save / "Products"
+            manager.create_feature_backup("Products", [products_path], "Undiscover products")
+            return manager.remove_discovered_products(products_to_undiscover)
 
-            removed = self.main_window.manager.remove_discovered_products(products_to_undiscover)
+        def done(removed):
+            self.main_window.mark_tabs_stale("backups_tab")
             if removed:
                 QMessageBox.information(self, "Success", f"Successfully undiscovered: {', '.join(removed)}")
             else:
                 QMessageBox.information(self, "Info", "No selected products were discovered.")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to undiscover products: {str(e)}")
+
+        self.main_window.tasks.run("Undiscovering products", work, on_done=done)
 
     def generate_products(self):
         if not self.main_window or not hasattr(self.main_window, 'manager'):
@@ -1629,19 +1912,23 @@ class ProductsTab(QWidget):
             if max_props > 34:
                 raise ValueError("Maximum cannot exceed 34 (total available properties)")
 
-            # Backup products FIRST
-            products_path = self.main_window.manager.current_save / "Products"
-            self.main_window.manager.create_feature_backup("Products", [products_path])
-            self.main_window.backups_tab.refresh_backup_list()
+            manager = self.main_window.manager
 
-            # SINGLE call to generate_products
-            self.main_window.manager.generate_products(
-                count, id_length, price, 
-                add_to_listed, add_to_favourited,
-                min_props, max_props, drug_type, use_id_as_name
-            )
+            def work(task):
+                # Backup products FIRST
+                products_path = manager.current_save / "Products"
+                manager.create_feature_backup("Products", [products_path], f"Generate {count} products")
+                manager.generate_products(
+                    count, id_length, price,
+                    add_to_listed, add_to_favourited,
+                    min_props, max_props, drug_type, use_id_as_name, task=task
+                )
 
-            QMessageBox.information(self, "Success", f"Generated {count} products successfully!")
+            def done(_):
+                self.main_window.mark_tabs_stale("backups_tab")
+                QMessageBox.information(self, "Success", f"Generated {count} products successfully!")
+
+            self.main_window.tasks.run("Generating products", work, on_done=done)
         except ValueError as ve:
             QMessageBox.warning(self, "Invalid Input", f"Please enter valid numbers: {str(ve)}")
         except Exception as e:
@@ -1657,43 +1944,16 @@ class ProductsTab(QWidget):
         )
         
         if reply == QMessageBox.Yes:
-            try:
-                products_path = self.main_window.manager.current_save / "Products"
-                created_path = products_path / "CreatedProducts"
-                products_json = products_path / "Products.json"
-                
-                if not created_path.exists():
+            def done(deleted):
+                if not deleted:
                     QMessageBox.information(self, "Info", "No generated products to delete.")
                     return
-                
-                generated_ids = [f.stem for f in created_path.glob("*.json") if f.is_file()]
-                
-                if not generated_ids:
-                    QMessageBox.information(self, "Info", "No generated products to delete.")
-                    return
-                
-                if products_json.exists():
-                    with open(products_json, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                else:
-                    data = {"DiscoveredProducts": [], "ListedProducts": [], "MixRecipes": [], "ProductPrices": [], "FavouritedProducts": []}
-                
-                data["DiscoveredProducts"] = [pid for pid in data.get("DiscoveredProducts", []) if pid not in generated_ids]
-                data["ListedProducts"] = [pid for pid in data.get("ListedProducts", []) if pid not in generated_ids]
-                data["MixRecipes"] = [recipe for recipe in data.get("MixRecipes", []) if recipe.get("Output") not in generated_ids]
-                data["ProductPrices"] = [price for price in data.get("ProductPrices", []) if price.get("String") not in generated_ids]
-                data["FavouritedProducts"] = [pid for pid in data.get("FavouritedProducts", []) if pid not in generated_ids]
-                
-                with open(products_json, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=4)
-                
-                for file_path in created_path.glob("*.json"):
-                    file_path.unlink()
-                
-                QMessageBox.information(self, "Success", f"Deleted {len(generated_ids)} generated products.")
-            
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Deletion failed: {str(e)}")
+
+                QMessageBox.information(self, "Success", f"Deleted {deleted} generated products.")
+
+            self.main_window.tasks.run("Deleting generated products",
+                                       lambda task: self.main_window.manager.delete_generated_products(),
+                                       on_done=done, cancellable=False)
 
 class UnlocksTab(QWidget):
     def __init__(self, parent=None, main_window=None):
@@ -1748,16 +2008,22 @@ class UnlocksTab(QWidget):
                 QMessageBox.critical(self, "Error", "No save file loaded")
                 return
             
-            # Backup Rank.json
-            rank_path = self.main_window.manager.current_save / "Rank.json"
-            self.main_window.manager.create_feature_backup("ItemsWeeds", [rank_path])
-            self.main_window.backups_tab.refresh_backup_list()
-            
-            result = self.main_window.manager.unlock_all_items_weeds()
-            if result == 1:
-                QMessageBox.information(self, "Success", "Unlocked all items and weeds!")
-            else:
-                QMessageBox.warning(self, "Warning", "Failed to unlock items and weeds.")
+            manager = self.main_window.manager
+
+            def work(task):
+                # Backup Rank.json
+                rank_path = manager.current_save / "Rank.json"
+                manager.create_feature_backup("ItemsWeeds", [rank_path], "Unlock all items and weeds")
+                return manager.unlock_all_items_weeds()
+
+            def done(result):
+                self.main_window.mark_tabs_stale("backups_tab")
+                if result == 1:
+                    QMessageBox.information(self, "Success", "Unlocked all items and weeds!")
+                else:
+                    QMessageBox.warning(self, "Warning", "Failed to unlock items and weeds.")
+
+            self.main_window.tasks.run("Unlocking items and weeds", work, on_done=done)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to unlock items and weeds: {str(e)}")
 
@@ -1767,13 +2033,19 @@ class UnlocksTab(QWidget):
                 QMessageBox.critical(self, "Error", "No save file loaded")
                 return
 
-            # Backup properties
-            properties_path = self.main_window.manager.current_save / "Properties"
-            self.main_window.manager.create_feature_backup("Properties", [properties_path])
-            self.main_window.backups_tab.refresh_backup_list()  # Add this line
+            manager = self.main_window.manager
 
-            updated = self.main_window.manager.unlock_all_properties()
-            QMessageBox.information(self, "Success", f"Unlocked {updated} properties!")
+            def work(task):
+                # Backup properties
+                properties_path = manager.current_save / "Properties"
+                manager.create_feature_backup("Properties", [properties_path], "Unlock all properties")
+                return manager.unlock_all_properties(task=task)
+
+            def done(updated):
+                self.main_window.mark_tabs_stale("backups_tab", "properties_tab")
+                QMessageBox.information(self, "Success", f"Unlocked {updated} properties!")
+
+            self.main_window.tasks.run("Unlocking properties", work, on_done=done)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to unlock properties: {str(e)}")
 
@@ -1784,13 +2056,19 @@ class UnlocksTab(QWidget):
                 QMessageBox.critical(self, "Error", "No save file loaded")
                 return
             
-            # Backup businesses
-            businesses_path = self.main_window.manager.current_save / "Businesses"
-            self.main_window.manager.create_feature_backup("Businesses", [businesses_path])
-            
-            updated = self.main_window.manager.unlock_all_businesses()
-            self.main_window.backups_tab.refresh_backup_list()
-            QMessageBox.information(self, "Success", f"Unlocked {updated} businesses!")
+            manager = self.main_window.manager
+
+            def work(task):
+                # Backup businesses
+                businesses_path = manager.current_save / "Businesses"
+                manager.create_feature_backup("Businesses", [businesses_path], "Unlock all businesses")
+                return manager.unlock_all_businesses(task=task)
+
+            def done(updated):
+                self.main_window.mark_tabs_stale("backups_tab")
+                QMessageBox.information(self, "Success", f"Unlocked {updated} businesses!")
+
+            self.main_window.tasks.run("Unlocking businesses", work, on_done=done)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to unlock businesses: {str(e)}")
 
@@ -1800,16 +2078,22 @@ class UnlocksTab(QWidget):
                 QMessageBox.critical(self, "Error", "No save file loaded")
                 return
             
-            # Backup NPCs
-            npcs_path = self.main_window.manager.current_save / "NPCs"
-            self.main_window.manager.create_feature_backup("NPCs", [npcs_path])
-            
-            updated = self.main_window.manager.update_npc_relationships_function()
-            self.main_window.backups_tab.refresh_backup_list()
-            QMessageBox.information(
-                self, "Success",
-                f"Updated relationships for {updated} NPCs and recruited dealers!"
-            )
+            manager = self.main_window.manager
+
+            def work(task):
+                # Backup NPCs
+                npcs_path = manager.current_save / "NPCs"
+                manager.create_feature_backup("NPCs", [npcs_path], "Unlock all NPCs")
+                return manager.update_npc_relationships_function(task=task)
+
+            def done(updated):
+                self.main_window.mark_tabs_stale("backups_tab", "inventory_tab")
+                QMessageBox.information(
+                    self, "Success",
+                    f"Updated relationships for {updated} NPCs and recruited dealers!"
+                )
+
+            self.main_window.tasks.run("Updating NPC relationships", work, on_done=done)
         except Exception as e:
             QMessageBox.critical(
                 self, "Error",
@@ -1818,6 +2102,7 @@ class UnlocksTab(QWidget):
 
 class InventoryTab(QWidget):
     def __init__(self, parent=None, main_window=None):
+        from lib.models import ChoiceDelegate, IntegerDelegate, InventoryModel, PACKAGINGS, QUALITIES
         super().__init__(parent)
         self.main_window = main_window
         layout = QVBoxLayout()
@@ -1846,14 +2131,20 @@ class InventoryTab(QWidget):
         self.cash_group.setVisible(False)  # Hidden by default
 
         # Inventory table
-        self.inventory_table = QTableWidget()
-        self.inventory_table.setColumnCount(5)
-        self.inventory_table.setHorizontalHeaderLabels(["Item Type", "ID", "Quantity", "Quality", "PackagingID"])
-        self.inventory_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.inventory_table.setSelectionMode(QTableWidget.SingleSelection)
-        self.inventory_table.setEditTriggers(QTableWidget.DoubleClicked | QTableWidget.EditKeyPressed)
-        self.inventory_table.itemChanged.connect(self.on_item_changed)
+        self.inventory_model = InventoryModel(self)
+        self.inventory_table = QTableView()
+        self.inventory_table.setModel(self.inventory_model)
+        self.inventory_table.setItemDelegateForColumn(2, IntegerDelegate(parent=self.inventory_table))
+        self.inventory_table.setItemDelegateForColumn(3, ChoiceDelegate(QUALITIES, self.inventory_table))
+        self.inventory_table.setItemDelegateForColumn(4, ChoiceDelegate(PACKAGINGS, self.inventory_table))
+        self.inventory_table.setSelectionBehavior(QTableView.SelectRows)
+        self.inventory_table.setSelectionMode(QTableView.SingleSelection)
+        self.inventory_table.setEditTriggers(
+            QTableView.DoubleClicked | QTableView.EditKeyPressed | QTableView.SelectedClicked
+        )
         self.inventory_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        # Fixed row heights let the view skip measuring rows it never shows
+        self.inventory_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         layout.addWidget(self.inventory_table, 1)
 
         # Buttons
@@ -1899,7 +2190,7 @@ class InventoryTab(QWidget):
         """Handle type change: update entity combo, hide/show cash group, and load inventory."""
         self.load_entities()
         self.cash_group.setVisible(self.type_combo.currentText() == "Dealers")
-        self.inventory_table.setRowCount(0)
+        self.inventory_model.load([])
         self.cash_input.clear()
         # If entities exist, select the first one and load its inventory
         if self.entity_combo.count() > 0:
@@ -1916,7 +2207,7 @@ class InventoryTab(QWidget):
         self.current_type = self.type_combo.currentText()
         self.current_entity = self.entity_combo.currentText()
         if not self.current_entity:
-            self.inventory_table.setRowCount(0)
+            self.inventory_model.load([])
             self.cash_input.clear()
             return
         if self.current_type == "Dealers":
@@ -1925,14 +2216,8 @@ class InventoryTab(QWidget):
             items = self._load_items(inventory_path)
             self.display_inventory(items)
             # Load cash
-            npc_json_path = self.main_window.manager.current_save / "NPCs" / self.current_entity / "NPC.json"
-            if npc_json_path.exists():
-                with open(npc_json_path, 'r', encoding='utf-8') as f:
-                    npc_data = json.load(f)
-                cash = round(npc_data.get("Cash", 0))
-                self.cash_input.setText(str(cash))
-            else:
-                self.cash_input.setText("0")
+            npc = self.main_window.manager.npcs.get(self.current_entity)
+            self.cash_input.setText(str(round(npc["cash"] or 0)) if npc else "0")
         elif self.current_type == "Vehicles":
             # Load inventory
             contents_path = self.main_window.manager.current_save / "OwnedVehicles" / self.current_entity / "Contents.json"
@@ -1949,146 +2234,19 @@ class InventoryTab(QWidget):
 
     def display_inventory(self, items):
         """Display the inventory in the table."""
-        self.inventory_table.blockSignals(True)
-        self.inventory_table.setRowCount(0)
-        for item_str in items:
-            try:
-                item = json.loads(item_str)
-                item_type = item.get("DataType", "Unknown")
-                item_id = item.get("ID", "Unknown")
-                quantity = str(item.get("Quantity", 0))
-                quality = item.get("Quality", "")
-                packaging = item.get("PackagingID", "")
-                row = self.inventory_table.rowCount()
-                self.inventory_table.insertRow(row)
-                self.inventory_table.setItem(row, 0, QTableWidgetItem(item_type))
-                self.inventory_table.setItem(row, 1, QTableWidgetItem(item_id))
-                quantity_item = QTableWidgetItem(quantity)
-                quantity_item.setData(Qt.UserRole, item_str)
-                self.inventory_table.setItem(row, 2, quantity_item)
-                if item_type in ("WeedData", "CocaineData", "MethData"):
-                    quality_combo = QComboBox()
-                    quality_combo.addItems(["Trash", "Poor", "Standard", "Premium", "Heavenly"])
-                    quality_combo.setCurrentText(quality if quality else "Standard")
-                    quality_combo.currentTextChanged.connect(
-                        lambda text, r=row: self.update_item_json(r, "Quality", text)
-                    )
-                    self.inventory_table.setCellWidget(row, 3, quality_combo)
-                    packaging_combo = QComboBox()
-                    packaging_combo.addItems(["none", "baggie", "jar"])
-                    packaging_combo.setCurrentText(packaging if packaging else "none")
-                    packaging_combo.currentTextChanged.connect(
-                        lambda text, r=row: self.update_item_json(r, "PackagingID", text)
-                    )
-                    self.inventory_table.setCellWidget(row, 4, packaging_combo)
-                else:
-                    quality_item = QTableWidgetItem("N/A")
-                    quality_item.setFlags(quality_item.flags() & ~Qt.ItemIsEditable)
-                    self.inventory_table.setItem(row, 3, quality_item)
-                    packaging_item = QTableWidgetItem("N/A")
-                    packaging_item.setFlags(packaging_item.flags() & ~Qt.ItemIsEditable)
-                    self.inventory_table.setItem(row, 4, packaging_item)
-            except json.JSONDecodeError:
-                continue
-        self.inventory_table.blockSignals(False)
-
-    def on_item_changed(self, item):
-        """Handle changes to editable table cells."""
-        row, column = item.row(), item.column()
-        if column in (0, 1, 2):
-            field = ["DataType", "ID", "Quantity"][column]
-            value = item.text()
-            if column == 2:
-                try:
-                    value = int(value)
-                except ValueError:
-                    QMessageBox.warning(self, "Invalid Quantity", "Quantity must be an integer.")
-                    item.setText("0")
-                    return
-            self.update_item_json(row, field, value)
-            if column == 0:
-                self.update_quality_packaging_cells(row, value)
-
-    def update_quality_packaging_cells(self, row, item_type):
-        """Update Quality and PackagingID cells based on item type."""
-        for col in (3, 4):
-            self.inventory_table.removeCellWidget(row, col)
-            self.inventory_table.setItem(row, col, None)
-        if item_type in ("WeedData", "CocaineData", "MethData"):
-            quality_combo = QComboBox()
-            quality_combo.addItems(["Trash", "Poor", "Standard", "Premium", "Heavenly"])
-            quality_combo.setCurrentText("Standard")
-            quality_combo.currentTextChanged.connect(
-                lambda text, r=row: self.update_item_json(r, "Quality", text)
-            )
-            self.inventory_table.setCellWidget(row, 3, quality_combo)
-            packaging_combo = QComboBox()
-            packaging_combo.addItems(["none", "baggie", "jar"])
-            packaging_combo.setCurrentText("none")
-            packaging_combo.currentTextChanged.connect(
-                lambda text, r=row: self.update_item_json(r, "PackagingID", text)
-            )
-            self.inventory_table.setCellWidget(row, 4, packaging_combo)
-        else:
-            for col in (3, 4):
-                na_item = QTableWidgetItem("N/A")
-                na_item.setFlags(na_item.flags() & ~Qt.ItemIsEditable)
-                self.inventory_table.setItem(row, col, na_item)
-        quantity_item = self.inventory_table.item(row, 2)
-        if quantity_item:
-            item_str = quantity_item.data(Qt.UserRole)
-            if item_str:
-                try:
-                    item = json.loads(item_str)
-                    if item_type in ("WeedData", "CocaineData", "MethData"):
-                        item.setdefault("Quality", "Standard")
-                        item.setdefault("PackagingID", "none")
-                    else:
-                        item.pop("Quality", None)
-                        item.pop("PackagingID", None)
-                    quantity_item.setData(Qt.UserRole, json.dumps(item))
-                except json.JSONDecodeError:
-                    pass
-
-    def update_item_json(self, row, field, value):
-        """Update the JSON data for an item."""
-        quantity_item = self.inventory_table.item(row, 2)
-        if quantity_item:
-            item_str = quantity_item.data(Qt.UserRole)
-            if item_str:
-                try:
-                    item = json.loads(item_str)
-                    item[field] = value
-                    quantity_item.setData(Qt.UserRole, json.dumps(item))
-                except json.JSONDecodeError:
-                    QMessageBox.warning(self, "Error", "Invalid item data")
+        self.inventory_model.load(items)
 
     def insert_row(self):
         """Insert a new row with default values."""
-        self.inventory_table.blockSignals(True)
-        row = self.inventory_table.rowCount()
-        self.inventory_table.insertRow(row)
-        item = {"DataType": "ItemData", "ID": "new_item", "Quantity": 1}
-        item_str = json.dumps(item)
-        self.inventory_table.setItem(row, 0, QTableWidgetItem("ItemData"))
-        self.inventory_table.setItem(row, 1, QTableWidgetItem("new_item"))
-        quantity_item = QTableWidgetItem("1")
-        quantity_item.setData(Qt.UserRole, item_str)
-        self.inventory_table.setItem(row, 2, quantity_item)
-        for col in (3, 4):
-            na_item = QTableWidgetItem("N/A")
-            na_item.setFlags(na_item.flags() & ~Qt.ItemIsEditable)
-            self.inventory_table.setItem(row, col, na_item)
-        self.inventory_table.blockSignals(False)
+        row = self.inventory_model.insert_item({"DataType": "ItemData", "ID": "new_item", "Quantity": 1})
+        self.inventory_table.scrollToBottom()
+        self.inventory_table.selectRow(row)
 
     def delete_selected_row(self):
         """Delete the selected row from the table."""
-        selected = self.inventory_table.selectedItems()
+        selected = self.inventory_table.selectionModel().selectedRows()
         if selected:
-            row = selected[0].row()
-            self.inventory_table.blockSignals(True)
-            self.inventory_table.removeRow(row)
-            self.inventory_table.blockSignals(False)
+            self.inventory_model.remove_item(selected[0].row())
         else:
             QMessageBox.warning(self, "No Selection", "Please select a row to delete.")
 
@@ -2099,39 +2257,53 @@ class InventoryTab(QWidget):
             return
         if not self.current_entity:
             return
-        items = [self.inventory_table.item(row, 2).data(Qt.UserRole) for row in range(self.inventory_table.rowCount())]
-        if self.current_type == "Dealers":
-            inventory_path = self.main_window.manager.current_save / "NPCs" / self.current_entity / "Inventory.json"
-            npc_json_path = self.main_window.manager.current_save / "NPCs" / self.current_entity / "NPC.json"
-            self.main_window.manager.create_feature_backup("NPCs", [inventory_path.parent])
-            # Save inventory
-            inventory_data = {"DataType": "InventoryData", "DataVersion": 0, "GameVersion": "0.3.3f15", "Items": items}
-            with open(inventory_path, 'w', encoding='utf-8') as f:
-                json.dump(inventory_data, f, indent=4)
-            # Save cash
-            cash_value = self.cash_input.text()
-            if cash_value:
-                try:
-                    cash = int(cash_value)
+        items = self.inventory_model.items()
+        manager = self.main_window.manager
+        entity, entity_type = self.current_entity, self.current_type
+        cash = None
+        cash_value = self.cash_input.text()
+        if entity_type == "Dealers" and cash_value:
+            try:
+                cash = int(cash_value)
+            except ValueError:
+                QMessageBox.warning(self, "Invalid Cash", "Cash must be an integer.")
+                return
+
+        def work(task):
+            if entity_type == "Dealers":
+                inventory_path = manager.current_save / "NPCs" / entity / "Inventory.json"
+                npc_json_path = manager.current_save / "NPCs" / entity / "NPC.json"
+                manager.create_feature_backup("NPCs", [inventory_path.parent], f"Edit {entity} inventory")
+                # Save inventory
+                inventory_data = {"DataType": "InventoryData", "DataVersion": 0, "GameVersion": "0.3.3f15", "Items": items}
+                with open(inventory_path, 'w', encoding='utf-8') as f:
+                    json.dump(inventory_data, f, indent=4)
+                manager.file_written(inventory_path.relative_to(manager.current_save))
+                # Save cash
+                if cash is not None:
                     with open(npc_json_path, 'r', encoding='utf-8') as f:
                         npc_data = json.load(f)
                     npc_data["Cash"] = cash
                     with open(npc_json_path, 'w', encoding='utf-8') as f:
                         json.dump(npc_data, f, indent=4)
-                except ValueError:
-                    QMessageBox.warning(self, "Invalid Cash", "Cash must be an integer.")
-                    return
-        elif self.current_type == "Vehicles":
-            contents_path = self.main_window.manager.current_save / "OwnedVehicles" / self.current_entity / "Contents.json"
-            self.main_window.manager.create_feature_backup("Vehicles", [contents_path.parent])
-            data = {"DataType": "InventoryData", "DataVersion": 0, "GameVersion": "0.3.3f15", "Items": items}
-            with open(contents_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4)
-        QMessageBox.information(self, "Success", f"Inventory for {self.current_entity} saved successfully!")
-        self.main_window.backups_tab.refresh_backup_list()
+                    manager.file_written(npc_json_path.relative_to(manager.current_save))
+            elif entity_type == "Vehicles":
+                contents_path = manager.current_save / "OwnedVehicles" / entity / "Contents.json"
+                manager.create_feature_backup("Vehicles", [contents_path.parent], f"Edit {entity} contents")
+                data = {"DataType": "InventoryData", "DataVersion": 0, "GameVersion": "0.3.3f15", "Items": items}
+                with open(contents_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=4)
+                manager.file_written(contents_path.relative_to(manager.current_save))
+
+        def done(_):
+            QMessageBox.information(self, "Success", f"Inventory for {entity} saved successfully!")
+            self.main_window.mark_tabs_stale("backups_tab")
+
+        self.main_window.tasks.run(f"Saving {entity}", work, on_done=done, cancellable=False)
 
 class MiscTab(QWidget):
     def __init__(self, parent=None, main_window=None):
+        from lib.quests import COMPLETED, NOT_STARTED
         super().__init__(parent)
         self.main_window = main_window
         layout = QVBoxLayout()
@@ -2172,6 +2344,27 @@ class MiscTab(QWidget):
         self.complete_quests_btn = QPushButton("Complete All Quests")
         self.complete_quests_btn.clicked.connect(self.complete_all_quests)
         quests_layout.addWidget(self.complete_quests_btn)
+        quest_select_layout = QHBoxLayout()
+        self.quest_selector_input = QLineEdit()
+        self.quest_selector_input.setPlaceholderText("Quest or Quest/Objective, e.g. Money Management or */Deposit*")
+        self.quest_selector_input.returnPressed.connect(self.show_quests)
+        quest_select_layout.addWidget(self.quest_selector_input)
+        self.show_quests_btn = QPushButton("Show")
+        self.show_quests_btn.clicked.connect(self.show_quests)
+        quest_select_layout.addWidget(self.show_quests_btn)
+        self.complete_selected_btn = QPushButton("Complete")
+        self.complete_selected_btn.clicked.connect(lambda: self.set_quest_state(COMPLETED))
+        quest_select_layout.addWidget(self.complete_selected_btn)
+        self.reset_selected_btn = QPushButton("Reset")
+        self.reset_selected_btn.clicked.connect(lambda: self.set_quest_state(NOT_STARTED))
+        quest_select_layout.addWidget(self.reset_selected_btn)
+        quests_layout.addLayout(quest_select_layout)
+        self.quests_tree = QTreeWidget()
+        self.quests_tree.setHeaderLabels(["Quest / Objective", "State"])
+        self.quests_tree.header().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.quests_tree.setMaximumHeight(200)
+        self.quests_tree.hide()
+        quests_layout.addWidget(self.quests_tree)
         quests_group.setLayout(quests_layout)
         layout.addWidget(quests_group)
 
@@ -2184,6 +2377,17 @@ class MiscTab(QWidget):
         self.vars_btn = QPushButton("Modify All Variables")
         self.vars_btn.clicked.connect(self.modify_variables)
         vars_layout.addWidget(self.vars_btn)
+        set_var_layout = QHBoxLayout()
+        self.var_pattern_input = QLineEdit()
+        self.var_pattern_input.setPlaceholderText("Variable name or pattern, e.g. *_acquired")
+        set_var_layout.addWidget(self.var_pattern_input)
+        self.var_value_input = QLineEdit()
+        self.var_value_input.setPlaceholderText("Value")
+        set_var_layout.addWidget(self.var_value_input)
+        self.set_var_btn = QPushButton("Set Variables")
+        self.set_var_btn.clicked.connect(self.set_variables)
+        set_var_layout.addWidget(self.set_var_btn)
+        vars_layout.addLayout(set_var_layout)
         vars_group.setLayout(vars_layout)
         layout.addWidget(vars_group)
 
@@ -2217,9 +2421,12 @@ class MiscTab(QWidget):
     def set_data(self, info):
         """Populate the input fields with data from the info dictionary."""
         self.organisation_name_input.setText(info.get("organisation_name", ""))
-        # Get ConsoleEnabled from Settings
-        game_data = self.main_window.manager._load_json_file("Game.json")
-        console_enabled = game_data.get("Settings", {}).get("ConsoleEnabled", False)
+        if "console_enabled" in info:
+            console_enabled = info["console_enabled"]
+        else:
+            # Get ConsoleEnabled from Settings
+            game_data = self.main_window.manager._load_json_file("Game.json")
+            console_enabled = game_data.get("Settings", {}).get("ConsoleEnabled", False)
         self.console_enabled_cb.setChecked(console_enabled)
 
     def get_data(self):
@@ -2230,20 +2437,68 @@ class MiscTab(QWidget):
         }
         
     def complete_all_quests(self):
+        from lib.quests import COMPLETED
         if not self.main_window or not self.main_window.manager.current_save:
             QMessageBox.critical(self, "Error", "No save file loaded")
             return
+        self.run_quest_update("*", COMPLETED, "Complete all quests")
+
+    def set_quest_state(self, state):
+        """Complete or reset the quests or objectives named in the selector box."""
+        from lib.quests import COMPLETED
+        if not self.main_window or not self.main_window.manager.current_save:
+            QMessageBox.critical(self, "Error", "No save file loaded")
+            return
+        selector = self.quest_selector_input.text().strip()
+        if not selector:
+            QMessageBox.warning(self, "Error", "Enter a quest, or a quest and objective as Quest/Objective")
+            return
+        action = "Complete" if state == COMPLETED else "Reset"
+        self.run_quest_update(selector, state, f"{action} {selector}")
+
+    def run_quest_update(self, selector, state, description):
+        from lib.quests import COMPLETED
         try:
-            # Backup quests
-            quests_path = self.main_window.manager.current_save / "Quests"
-            self.main_window.manager.create_feature_backup("Quests", [quests_path])
-
-            quests_completed, objectives_completed = self.main_window.manager.complete_all_quests()
-            self.main_window.backups_tab.refresh_backup_list()
-            QMessageBox.information(self, "Quests Completed",
-                                    f"Marked {quests_completed} quests and {objectives_completed} objectives as completed!")
+            manager = self.main_window.manager
+
+            def work(task):
+                # Backup only the quest files that change
+                planned = manager.quest_changes(selector, state)
+                if planned:
+                    manager.create_feature_backup("Quests", [manager.current_save / rel for rel, *_ in planned],
+                                                  description)
+                return manager.set_quest_state(selector, state, task=task)
+
+            def done(result):
+                quests_changed, objectives_changed = result
+                self.main_window.mark_tabs_stale("backups_tab")
+                if not self.quests_tree.isHidden():
+                    self.show_quests()
+                verb = "completed" if state == COMPLETED else "reset"
+                QMessageBox.information(self, "Quests Updated",
+                                        f"Marked {quests_changed} quests and {objectives_changed} objectives as {verb}!")
+
+            self.main_window.tasks.run("Updating quests", work, on_done=done)
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to complete quests: {str(e)}")
+            QMessageBox.critical(self, "Error", f"Failed to update quests: {str(e)}")
+
+    def show_quests(self):
+        """List the quests and objectives matching the selector box (all quests when it is empty)."""
+        from lib.quests import state_name
+        if not self.main_window or not self.main_window.manager.current_save:
+            QMessageBox.critical(self, "Error", "No save file loaded")
+            return
+        selector = self.quest_selector_input.text().strip() or "*"
+        self.quests_tree.clear()
+        for quest in self.main_window.manager.quests.describe(selector):
+            quest_item = QTreeWidgetItem([quest["title"], state_name(quest["state"])])
+            quest_item.setToolTip(0, quest["file"])
+            for entry in quest["entries"]:
+                QTreeWidgetItem(quest_item, [entry["name"] or "", state_name(entry["state"])])
+            self.quests_tree.addTopLevelItem(quest_item)
+        if "/" in selector:
+            self.quests_tree.expandAll()
+        self.quests_tree.show()
 
     def modify_variables(self):
         if not hasattr(self, 'main_window') or not self.main_window.manager.current_save:
@@ -2251,32 +2506,58 @@ class MiscTab(QWidget):
             return
         try:
             # Backup variables
-            variables_paths = [self.main_window.manager.current_save / "Variables"]
-            for i in range(10):
-                player_vars = self.main_window.manager.current_save / f"Players/Player_{i}/Variables"
-                if player_vars.exists():
-                    variables_paths.append(player_vars)
-            self.main_window.manager.create_feature_backup("Variables", variables_paths)
-
-            count = self.main_window.manager.modify_variables()
-            self.main_window.backups_tab.refresh_backup_list()
-            QMessageBox.information(self, "Variables Modified",
-                                    f"Successfully updated {count} variables!")
+            manager = self.main_window.manager
+            variables_paths = [manager.current_save / d for d in manager.variables.directories()]
+
+            def work(task):
+                manager.create_feature_backup("Variables", variables_paths, "Modify all variables")
+                return manager.modify_variables(task=task)
+
+            def done(count):
+                self.main_window.mark_tabs_stale("backups_tab")
+                QMessageBox.information(self, "Variables Modified",
+                                        f"Successfully updated {count} variables!")
+
+            self.main_window.tasks.run("Modifying variables", work, on_done=done)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to modify variables: {str(e)}")
 
+    def set_variables(self):
+        if not self.main_window or not self.main_window.manager.current_save:
+            QMessageBox.critical(self, "Error", "No save file loaded")
+            return
+        pattern = self.var_pattern_input.text().strip()
+        value = self.var_value_input.text().strip()
+        if not pattern or not value:
+            QMessageBox.warning(self, "Error", "Enter a variable name or pattern and a value")
+            return
+        manager = self.main_window.manager
+
+        def work(task):
+            matches = manager.variables.find(pattern)
+            if matches:
+                # Backup only the matching files
+                manager.create_feature_backup("Variables", [manager.current_save / rel for rel, _ in matches],
+                                              f"Set {pattern} to {value}")
+            return len(matches), len(manager.set_variables(pattern, value, task=task))
+
+        def done(result):
+            matched, changed = result
+            if not matched:
+                QMessageBox.warning(self, "No Variables", f"No variables match {pattern}")
+                return
+            self.main_window.mark_tabs_stale("backups_tab")
+            QMessageBox.information(self, "Variables Set",
+                                    f"Set {pattern} to {value}: {changed} of {matched} matching variables changed")
+
+        self.main_window.tasks.run("Setting variables", work, on_done=done)
+
     def update_vars_warning(self):
         """Update the variables warning message with detected player directories."""
         if not self.main_window or not self.main_window.manager.current_save:
             return  # No save loaded
 
-        players_path = self.main_window.manager.current_save / "Players"
-        player_dirs = []
-        # Check for Player_0 to Player_9
-        for i in range(10):
-            dir_path = players_path / f"Player_{i}"
-            if dir_path.exists():
-                player_dirs.append(f"Player_{i}")
+        player_dirs = self.main_window.manager.variables.players()
 
         # Build the warning message lines
         lines = ["- Variables/"]
@@ -2284,7 +2565,7 @@ class MiscTab(QWidget):
             for dir_name in player_dirs:
                 lines.append(f"- Players/{dir_name}/Variables/")
         else:
-            lines.append("- Players/Player_*/Variables/ (no player directories found)")
+            lines.append("- Players/Player_*/Variables/ (no player variables found)")
 
         warning_text = "WARNING: Modifies variables in:\n" + "\n".join(lines)
         self.vars_warning_label.setText(warning_text)
@@ -2329,7 +2610,8 @@ class MiscTab(QWidget):
                     return
 
             try:
-                urllib.request.urlretrieve(dll_url, dll_path)
+                if not DownloadDialog([(dll_url, dll_path, None)], "Downloading AchievementUnlocker.dll...", self).run():
+                    return
                 QMessageBox.information(
                     self,
                     "Success",
@@ -2358,31 +2640,7 @@ class MiscTab(QWidget):
             
             new_save_path = self.main_window.manager.steamid_folder / next_save_name
             
-            with tempfile.TemporaryDirectory() as temp_dir:
-                zip_path = Path(temp_dir) / "SaveGame_1.zip"
-                urllib.request.urlretrieve(
-                    "https://github.com/N0edL/Schedule-1-Save-Editor/raw/refs/heads/main/NPCs/SaveGame_1.zip",
-                    zip_path
-                )
-                with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                    for member in zip_ref.namelist():
-                        if member.endswith('/'):
-                            continue
-                        relative_path = Path(member).relative_to('SaveGame_1')
-                        target_path = new_save_path / relative_path
-                        target_path.parent.mkdir(parents=True, exist_ok=True)
-                        with zip_ref.open(member) as source, open(target_path, 'wb') as target:
-                            target.write(source.read())
-            
-            game_json_path = new_save_path / "Game.json"
-            if game_json_path.exists():
-                with open(game_json_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                data["OrganisationName"] = new_org_name
-                with open(game_json_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=4)
-            else:
-                raise FileNotFoundError("Game.json not found in the new save folder")
+            self.main_window.manager.templates.create_save(new_save_path, new_org_name)
             
             QMessageBox.information(
                 self,
@@ -2433,7 +2691,7 @@ class MiscTab(QWidget):
 
         # Proceed with deletion if user confirms
         if reply == QMessageBox.Yes:
-            try:
+            def work(task):
                 # Delete the main save folder
                 shutil.rmtree(save_path)
 
@@ -2441,6 +2699,7 @@ class MiscTab(QWidget):
                 if backup_path.exists():
                     shutil.rmtree(backup_path)
 
+            def done(_):
                 # Notify user of success
                 QMessageBox.information(self, "Success", "Save folder and its backup deleted successfully.")
                 
@@ -2451,9 +2710,154 @@ class MiscTab(QWidget):
                 # If the deleted save was the current one, return to selection screen
                 if Path(save_path) == self.main_window.manager.current_save:
                     self.main_window.back_to_selection()
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to delete save folder or backup: {str(e)}")
+
+            self.main_window.tasks.run("Deleting save", work, on_done=done, cancellable=False)
                 
+class QueryTab(QWidget):
+    MAX_ROWS = 1000  # Rows shown in the results table
+
+    def __init__(self, parent=None, main_window=None):
+        super().__init__(parent)
+        self.main_window = main_window
+        layout = QVBoxLayout()
+        layout.setContentsMargins(10, 10, 10, 10)
+        layout.setSpacing(15)
+
+        query_group = QGroupBox("SQL Query")
+        query_layout = QVBoxLayout()
+        query_layout.setContentsMargins(10, 10, 10, 10)
+        query_layout.addWidget(QLabel(
+            "Each DataType is a table (QuestData, DealerData, ...) and every entry of an Items list is a row in "
+            "items.\nJoin on files (id, path) through _file. UPDATEs are saved right away, with a backup of the "
+            "files they change."))
+        self.query_input = QTextEdit()
+        self.query_input.setAcceptRichText(False)
+        self.query_input.setPlaceholderText(
+            "UPDATE items SET Quality = 'Premium'\n"
+            "WHERE DataType = 'WeedData' AND Quality = 'Poor'\n"
+            "AND _file IN (SELECT id FROM files WHERE path LIKE 'Properties/%')")
+        self.query_input.setMaximumHeight(120)
+        query_layout.addWidget(self.query_input)
+        button_layout = QHBoxLayout()
+        run_btn = QPushButton("Run Query")
+        run_btn.clicked.connect(self.run_query)
+        tables_btn = QPushButton("Show Tables")
+        tables_btn.clicked.connect(self.show_tables)
+        button_layout.addWidget(run_btn)
+        button_layout.addWidget(tables_btn)
+        query_layout.addLayout(button_layout)
+        query_group.setLayout(query_layout)
+        layout.addWidget(query_group)
+
+        self.status_label = QLabel()
+        layout.addWidget(self.status_label)
+        self.results_table = QTableWidget()
+        self.results_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        layout.addWidget(self.results_table, 1)
+        self.setLayout(layout)
+
+    def run_query(self):
+        if not self.main_window or not self.main_window.manager.current_save:
+            QMessageBox.critical(self, "Error", "No save file loaded")
+            return
+        sql = self.query_input.toPlainText().strip()
+        if not sql:
+            return
+
+        def done(result):
+            columns, rows, written = result
+            self.display_rows(columns, rows)
+            if written:
+                self.main_window.mark_tabs_stale()  # Any tab may show one of the files
+                self.status_label.setText(f"Updated {len(written)} files: " + ", ".join(written[:10])
+                                          + (", ..." if len(written) > 10 else ""))
+            elif columns:
+                shown = min(len(rows), self.MAX_ROWS)
+                self.status_label.setText(f"{len(rows)} rows" + (f" (showing {shown})" if shown < len(rows) else ""))
+            else:
+                self.status_label.setText("No values changed")
+
+        self.main_window.tasks.run("Running query", self.main_window.manager.run_query, sql, on_done=done)
+
+    def show_tables(self):
+        if not self.main_window or not self.main_window.manager.current_save:
+            QMessageBox.critical(self, "Error", "No save file loaded")
+            return
+        manager = self.main_window.manager
+
+        def work(task):
+            return manager.open_database(task).tables()
+
+        def done(tables):
+            self.display_rows(["Table", "Columns"], [(table, ", ".join(columns)) for table, columns in tables.items()])
+            self.status_label.setText(f"{len(tables)} tables")
+
+        self.main_window.tasks.run("Indexing save", work, on_done=done)
+
+    def display_rows(self, columns, rows):
+        self.results_table.clear()
+        self.results_table.setColumnCount(len(columns))
+        self.results_table.setHorizontalHeaderLabels(columns)
+        rows = rows[:self.MAX_ROWS]
+        self.results_table.setRowCount(len(rows))
+        for r, row in enumerate(rows):
+            for c, value in enumerate(row):
+                self.results_table.setItem(r, c, QTableWidgetItem("" if value is None else str(value)))
+        self.results_table.resizeColumnsToContents()
+
+
+class SearchTab(QWidget):
+    def __init__(self, parent=None, main_window=None):
+        super().__init__(parent)
+        self.main_window = main_window
+        layout = QVBoxLayout()
+        layout.setContentsMargins(10, 10, 10, 10)
+        layout.setSpacing(15)
+
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Search for an item ID, NPC name, product ID, key or value...")
+        self.search_input.textChanged.connect(lambda: self.search_timer.start())
+        layout.addWidget(self.search_input)
+        # Wait for a pause in typing before searching
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(150)
+        self.search_timer.timeout.connect(self.run_search)
+
+        self.status_label = QLabel()
+        layout.addWidget(self.status_label)
+        self.results_table = QTableWidget(0, 4)
+        self.results_table.setHorizontalHeaderLabels(["File", "JSON Path", "Match", "Text"])
+        self.results_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.results_table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.results_table.horizontalHeader().setStretchLastSection(True)
+        layout.addWidget(self.results_table, 1)
+        self.setLayout(layout)
+
+    def run_search(self):
+        """Show the hits for the current text, retrying shortly while the index is being built or refreshed."""
+        index = self.main_window.manager.search_index if self.main_window else None
+        query = self.search_input.text()
+        if index is None or not query.strip():
+            self.results_table.setRowCount(0)
+            self.status_label.clear()
+            return
+        if not index.is_ready():
+            self.status_label.setText("Indexing…")
+            self.search_timer.start()
+            return
+        start = time.perf_counter()
+        results, total = index.search(query)
+        elapsed = (time.perf_counter() - start) * 1000
+        self.results_table.setRowCount(len(results))
+        for row, hit in enumerate(results):
+            for column, value in enumerate((hit["file"], hit["path"] or "(file name)", hit["kind"].capitalize(), hit["text"])):
+                self.results_table.setItem(row, column, QTableWidgetItem(value))
+        self.results_table.resizeColumnsToContents()
+        shown = f" (showing {len(results)})" if len(results) < total else ""
+        self.status_label.setText(f"{total} hits{shown} in {elapsed:.1f} ms")
+
+
 class BackupsTab(QWidget):
     def __init__(self, parent=None, main_window=None):
         super().__init__(parent)
@@ -2482,6 +2886,52 @@ class BackupsTab(QWidget):
         revert_group.setLayout(revert_layout)
         layout.addWidget(revert_group)
 
+        # File History Section
+        history_group = QGroupBox("File History")
+        history_layout = QFormLayout()
+        history_layout.setContentsMargins(10, 10, 10, 10)
+        self.history_path_input = QLineEdit()
+        self.history_path_input.setPlaceholderText("e.g. NPCs/Benji Coleman/Inventory.json")
+        self.history_path_input.editingFinished.connect(self.load_file_versions)
+        # Built once; refresh_backup_list swaps the path list only when the timeline's paths change
+        self.history_paths_model = QStringListModel(self)
+        self.history_paths_version = None
+        self.history_path_input.setCompleter(QCompleter(self.history_paths_model, self))
+        history_layout.addRow("File:", self.history_path_input)
+        self.history_version_combo = QComboBox()
+        history_layout.addRow("Version:", self.history_version_combo)
+        as_of_layout = QHBoxLayout()
+        self.history_as_of_input = QDateTimeEdit(QDateTime.currentDateTime())
+        self.history_as_of_input.setDisplayFormat("yyyy-MM-dd HH:mm:ss")
+        self.history_as_of_input.setCalendarPopup(True)
+        as_of_layout.addWidget(self.history_as_of_input, 1)
+        find_version_btn = QPushButton("Select Version")
+        find_version_btn.clicked.connect(self.select_version_as_of)
+        as_of_layout.addWidget(find_version_btn)
+        history_layout.addRow("As of:", as_of_layout)
+        history_buttons = QHBoxLayout()
+        view_version_btn = QPushButton("View Version")
+        view_version_btn.clicked.connect(self.view_file_version)
+        restore_version_btn = QPushButton("Restore Version")
+        restore_version_btn.clicked.connect(self.restore_file_version)
+        history_buttons.addWidget(view_version_btn)
+        history_buttons.addWidget(restore_version_btn)
+        history_layout.addRow(history_buttons)
+        history_group.setLayout(history_layout)
+        layout.addWidget(history_group)
+
+        # Compare Section
+        compare_group = QGroupBox("Compare Save")
+        compare_layout = QVBoxLayout()
+        compare_layout.setContentsMargins(10, 10, 10, 10)
+        self.compare_combo = QComboBox()
+        compare_layout.addWidget(self.compare_combo)
+        compare_btn = QPushButton("Show Differences")
+        compare_btn.clicked.connect(self.show_differences)
+        compare_layout.addWidget(compare_btn)
+        compare_group.setLayout(compare_layout)
+        layout.addWidget(compare_group)
+
         # Delete Backups Section
         delete_group = QGroupBox("Delete Backups")
         delete_layout = QVBoxLayout()
@@ -2492,20 +2942,276 @@ class BackupsTab(QWidget):
         delete_group.setLayout(delete_layout)
         layout.addWidget(delete_group)
 
+        # Integrity Section
+        integrity_group = QGroupBox("Backup Integrity")
+        integrity_layout = QVBoxLayout()
+        integrity_layout.setContentsMargins(10, 10, 10, 10)
+        self.full_verify_cb = QCheckBox("Re-hash every file (ignore verified digest cache)")
+        integrity_layout.addWidget(self.full_verify_cb)
+        verify_btn = QPushButton("Verify Backups")
+        verify_btn.clicked.connect(self.verify_backups)
+        integrity_layout.addWidget(verify_btn)
+        integrity_group.setLayout(integrity_layout)
+        layout.addWidget(integrity_group)
+
+        # Retention Section
+        retention_group = QGroupBox("Backup Retention")
+        retention_layout = QFormLayout()
+        retention_layout.setContentsMargins(10, 10, 10, 10)
+        self.keep_last_input = QLineEdit()
+        self.keep_last_input.setValidator(QIntValidator(1, 1000))
+        self.keep_daily_input = QLineEdit()
+        self.keep_daily_input.setValidator(QIntValidator(0, 1000))
+        self.keep_weekly_input = QLineEdit()
+        self.keep_weekly_input.setValidator(QIntValidator(0, 1000))
+        self.max_size_input = QLineEdit()
+        self.max_size_input.setValidator(QIntValidator(0, 1000000))
+        retention_layout.addRow("Keep Last (per feature):", self.keep_last_input)
+        retention_layout.addRow("Daily Checkpoints:", self.keep_daily_input)
+        retention_layout.addRow("Weekly Checkpoints:", self.keep_weekly_input)
+        retention_layout.addRow("Size Budget (MB, 0 = unlimited):", self.max_size_input)
+        self.retention_usage_label = QLabel()
+        retention_layout.addRow("Current Usage:", self.retention_usage_label)
+        save_retention_btn = QPushButton("Save Settings && Prune")
+        save_retention_btn.clicked.connect(self.save_retention_settings)
+        retention_layout.addRow(save_retention_btn)
+        retention_group.setLayout(retention_layout)
+        layout.addWidget(retention_group)
+        self.load_retention_settings()
+
         layout.addStretch()
         self.setLayout(layout)
 
+    def verify_backups(self):
+        """Verify all backups and report missing or altered files."""
+        if not self.main_window or not self.main_window.manager.current_save:
+            QMessageBox.critical(self, "Error", "No save file loaded")
+            return
+        self.main_window.tasks.run("Verifying backups", self.main_window.manager.verify_backups,
+                                   self.full_verify_cb.isChecked(), on_done=self.show_verify_results, guarded=False)
+
+    def show_verify_results(self, reports):
+        from lib.backups import summarize_reports
+        if not reports:
+            QMessageBox.information(self, "No Backups", "There are no backups to verify.")
+            return
+        damaged = [r["snapshot"] for r in reports if r["missing"] or r["altered"]]
+        unverifiable = [r["snapshot"] for r in reports if not r["has_manifest"]]
+        msg = QMessageBox(self)
+        msg.setWindowTitle("Backup Verification")
+        if damaged:
+            msg.setIcon(QMessageBox.Warning)
+            msg.setText(f"{len(damaged)} of {len(reports)} backups have missing or altered files:\n"
+                        + "\n".join(damaged[:10]))
+        else:
+            msg.setIcon(QMessageBox.Information)
+            msg.setText(f"All {len(reports) - len(unverifiable)} verifiable backups are intact.")
+        if unverifiable:
+            msg.setInformativeText(f"{len(unverifiable)} backups were made by an older version and have no stored digests.")
+        msg.setDetailedText(summarize_reports(reports))
+        msg.exec()
+
+    def load_retention_settings(self):
+        """Fill the retention inputs from the active policy."""
+        if not self.main_window:
+            return
+        policy = self.main_window.manager.retention_policy
+        self.keep_last_input.setText(str(policy.keep_last))
+        self.keep_daily_input.setText(str(policy.keep_daily))
+        self.keep_weekly_input.setText(str(policy.keep_weekly))
+        self.max_size_input.setText(str(policy.max_total_mb))
+        self.update_retention_usage()
+
+    def update_retention_usage(self):
+        catalog = self.main_window.manager.backup_catalog if self.main_window else None
+        if not catalog:
+            self.retention_usage_label.setText("No save loaded")
+            return
+        self.retention_usage_label.setText(
+            f"{catalog.total_bytes() / (1024 * 1024):.1f} MB in {len(catalog.entries)} backups"
+        )
+
+    def save_retention_settings(self):
+        """Store the retention settings and prune existing backups with them."""
+        from lib.backups import RetentionPolicy
+        try:
+            policy = RetentionPolicy(
+                keep_last=max(1, int(self.keep_last_input.text())),
+                keep_daily=int(self.keep_daily_input.text()),
+                keep_weekly=int(self.keep_weekly_input.text()),
+                max_total_mb=int(self.max_size_input.text())
+            )
+        except ValueError:
+            QMessageBox.warning(self, "Invalid Input", "Please enter valid numbers for every retention setting.")
+            return
+        def done(evicted):
+            self.refresh_backup_list()
+            QMessageBox.information(self, "Success", f"Retention settings saved. Pruned {len(evicted)} backups.")
+
+        self.main_window.tasks.run("Pruning backups",
+                                   lambda task: self.main_window.manager.set_retention_policy(policy),
+                                   on_done=done, cancellable=False, guarded=False)
+
     def refresh_backup_list(self):
         """Refresh the list of available backups in the combo box."""
         self.feature_combo.clear()
         if not self.main_window or not self.main_window.manager.current_save:
             return
+        catalog = self.main_window.manager.backup_catalog
         backups = self.main_window.manager.list_feature_backups()
         for feature, timestamps in backups.items():
             if timestamps:
                 latest = timestamps[0]
                 display_text = f"{feature} ({datetime.strptime(latest, '%Y%m%d%H%M%S').strftime('%c')})"
+                description = catalog.get(feature, latest).get("description")
+                if description:
+                    display_text += f" - {description}"
                 self.feature_combo.addItem(display_text, (feature, latest))
+        if hasattr(self, 'retention_usage_label'):
+            self.load_compare_targets()
+            self.update_retention_usage()
+            timeline = self.main_window.manager.timeline
+            if timeline.paths_version != self.history_paths_version:
+                self.history_paths_model.setStringList(timeline.paths())
+                self.history_paths_version = timeline.paths_version
+            self.load_file_versions()
+
+    def load_compare_targets(self):
+        """List the initial backup, every feature backup and the other saves as comparison targets."""
+        self.compare_combo.clear()
+        manager = self.main_window.manager
+        if manager.backup_path.exists():
+            self.compare_combo.addItem("Initial Backup", ("initial", None))
+        for (feature, timestamp), entry in sorted(manager.backup_catalog.entries.items(),
+                                                  key=lambda item: item[0][1], reverse=True):
+            try:
+                when = datetime.strptime(timestamp, '%Y%m%d%H%M%S').strftime('%c')
+            except ValueError:
+                when = timestamp
+            display_text = f"{feature} ({when})"
+            if entry.get("description"):
+                display_text += f" - {entry['description']}"
+            self.compare_combo.addItem(display_text, ("snapshot", (feature, timestamp)))
+        for folder in manager.get_save_folders():
+            if Path(folder["path"]) != manager.current_save:
+                self.compare_combo.addItem(f"{folder['name']} - {folder['organisation_name']}", ("save", folder["path"]))
+
+    def show_differences(self):
+        """Show what changed between the selected backup or save and the live save."""
+        if not self.main_window or not self.main_window.manager.current_save:
+            QMessageBox.critical(self, "Error", "No save file loaded")
+            return
+        if self.compare_combo.count() == 0:
+            QMessageBox.warning(self, "Nothing to Compare", "No backups or other saves available.")
+            return
+        kind, target = self.compare_combo.currentData()
+        try:
+            results = self.main_window.manager.diff_against(kind, target)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to compare saves: {str(e)}")
+            return
+        if not results:
+            QMessageBox.information(self, "No Differences", "The live save matches the selected comparison.")
+            return
+
+        dialog = QDialog(self)
+        dialog.setWindowTitle(f"Changes since {self.compare_combo.currentText()}")
+        dialog_layout = QVBoxLayout()
+        dialog_layout.addWidget(QLabel(f"{len(results)} files differ"))
+        tree = QTreeWidget()
+        tree.setHeaderLabels(["Path", "Change", "Old", "New"])
+        for result in results:
+            file_item = QTreeWidgetItem([result["path"], result["status"].capitalize(), "", ""])
+            for change in result["changes"]:
+                QTreeWidgetItem(file_item, [
+                    change["path"] or "(whole file)", change["kind"].capitalize(),
+                    "" if change["old"] is None else json.dumps(change["old"]),
+                    "" if change["new"] is None else json.dumps(change["new"])
+                ])
+            tree.addTopLevelItem(file_item)
+        if len(results) <= 20:
+            tree.expandAll()
+        tree.header().setSectionResizeMode(0, QHeaderView.ResizeToContents)
+        dialog_layout.addWidget(tree)
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(dialog.accept)
+        dialog_layout.addWidget(close_btn)
+        dialog.setLayout(dialog_layout)
+        dialog.resize(800, 500)
+        dialog.exec()
+
+    def load_file_versions(self):
+        """List every backed-up version of the file entered in the history box."""
+        self.history_version_combo.clear()
+        rel_path = self.history_path_input.text().strip().replace("\\", "/")
+        if not rel_path or not self.main_window or not self.main_window.manager.current_save:
+            return
+        for timestamp, feature in self.main_window.manager.get_file_versions(rel_path):
+            try:
+                when = datetime.strptime(timestamp, '%Y%m%d%H%M%S').strftime('%c')
+            except ValueError:
+                when = timestamp
+            self.history_version_combo.addItem(f"{when} ({feature})", (rel_path, timestamp, feature))
+
+    def select_version_as_of(self):
+        """Select the version of the file that was current at the chosen date and time."""
+        if self.history_version_combo.count() == 0:
+            QMessageBox.warning(self, "No Version", "Enter a backed-up file first.")
+            return
+        rel_path = self.history_version_combo.currentData()[0]
+        when = self.history_as_of_input.dateTime().toPython()
+        version = self.main_window.manager.get_file_version_at(rel_path, when)
+        if version is None:
+            QMessageBox.information(self, "No Version", f"{rel_path} has no backed-up version from before {when:%c}.")
+            return
+        for i in range(self.history_version_combo.count()):
+            if self.history_version_combo.itemData(i) == (rel_path, *version):
+                self.history_version_combo.setCurrentIndex(i)
+                break
+
+    def view_file_version(self):
+        """Show the contents of the selected file version."""
+        if self.history_version_combo.count() == 0:
+            QMessageBox.warning(self, "No Version", "Enter a backed-up file and select a version first.")
+            return
+        rel_path, timestamp, feature = self.history_version_combo.currentData()
+        try:
+            content = self.main_window.manager.read_file_version(rel_path, timestamp, feature)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to read backup: {str(e)}")
+            return
+        dialog = QDialog(self)
+        dialog.setWindowTitle(f"{rel_path} - {self.history_version_combo.currentText()}")
+        dialog_layout = QVBoxLayout()
+        viewer = QTextEdit()
+        viewer.setReadOnly(True)
+        viewer.setPlainText(content)
+        dialog_layout.addWidget(viewer)
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(dialog.accept)
+        dialog_layout.addWidget(close_btn)
+        dialog.setLayout(dialog_layout)
+        dialog.resize(600, 500)
+        dialog.exec()
+
+    def restore_file_version(self):
+        """Restore only the selected file version into the save."""
+        if self.history_version_combo.count() == 0:
+            QMessageBox.warning(self, "No Version", "Enter a backed-up file and select a version first.")
+            return
+        rel_path, timestamp, feature = self.history_version_combo.currentData()
+        reply = QMessageBox.question(self, "Confirm Restore",
+                                    f"Restore {rel_path} to the selected version?\n"
+                                    "The current file is backed up first.",
+                                    QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+        if reply == QMessageBox.Yes:
+            def done(_):
+                QMessageBox.information(self, "Success", f"Restored {rel_path}")
+                self.main_window.mark_tabs_stale()  # The restored file may feed any tab
+
+            self.main_window.tasks.run("Restoring file",
+                                       lambda task: self.main_window.manager.restore_file_version(rel_path, timestamp, feature),
+                                       on_done=done, cancellable=False)
 
     def revert_selected(self):
         """Revert the selected feature to its latest backup."""
@@ -2513,12 +3219,14 @@ class BackupsTab(QWidget):
             QMessageBox.warning(self, "No Backups", "No feature backups available to revert.")
             return
         feature, timestamp = self.feature_combo.currentData()
-        try:
-            self.main_window.manager.revert_feature(feature, timestamp)
+
+        def done(_):
             QMessageBox.information(self, "Success", f"Reverted {feature} to backup from {timestamp}")
-            self.refresh_backup_list()  # Refresh after reverting
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to revert feature: {str(e)}")
+            self.main_window.mark_tabs_stale()  # Refresh this tab now and the others when next shown
+
+        self.main_window.tasks.run("Reverting feature",
+                                   lambda task: self.main_window.manager.revert_feature(feature, timestamp),
+                                   on_done=done, cancellable=False)
 
     def revert_all_changes(self):
         """Revert all changes to the initial backup."""
@@ -2526,12 +3234,13 @@ class BackupsTab(QWidget):
                                     "This will revert ALL changes since the initial backup. Continue?",
                                     QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         if reply == QMessageBox.Yes:
-            try:
-                self.main_window.manager.revert_all_changes()
+            def done(_):
                 QMessageBox.information(self, "Success", "All changes reverted to initial backup.")
-                self.refresh_backup_list()  # Refresh after reverting
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to revert all changes: {str(e)}")
+                self.main_window.mark_tabs_stale()  # Refresh this tab now and the others when next shown
+
+            self.main_window.tasks.run("Reverting all changes",
+                                       lambda task: self.main_window.manager.revert_all_changes(),
+                                       on_done=done, cancellable=False)
 
     def delete_all_backups(self):
         """Delete all backups for the current save."""
@@ -2542,12 +3251,13 @@ class BackupsTab(QWidget):
                                     "Delete all backups for this save?",
                                     QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         if reply == QMessageBox.Yes:
-            try:
-                shutil.rmtree(self.main_window.manager.backup_path)
+            def done(_):
                 QMessageBox.information(self, "Success", "All backups deleted successfully")
                 self.refresh_backup_list()  # Refresh after deletion
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to delete backups: {str(e)}")
+
+            self.main_window.tasks.run("Deleting backups",
+                                       lambda task: self.main_window.manager.delete_all_backups(),
+                                       on_done=done, cancellable=False, guarded=False)
 
 class ThemeTab(QWidget):
     def __init__(self, parent=None):
@@ -2790,6 +3500,8 @@ class CreditsTab(QWidget):
         self.setLayout(layout)
 
 class SaveEditorWindow(QMainWindow):
+    FORM_TABS = ("money_tab", "rank_tab", "misc_tab")  # Tabs whose fields Apply Changes writes
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Schedule I Save Editor")
@@ -2806,9 +3518,54 @@ class SaveEditorWindow(QMainWindow):
             return os.path.join(base_path, relative_path)
         
         self.setWindowIcon(QIcon(icon_path("icon.ico")))
-        self.check_for_updates() 
+        self.game_monitor = GameMonitor(parent=self)
+        self.game_monitor.running_changed.connect(self.on_game_running_changed)
+        self.game_write_confirmed = False  # Asked once per game session, see confirm_write
+        self.tasks = TaskRunner(self, guard=self.confirm_write)  # Shared background runner for long save operations
+        self.first_paint_done = False  # after_first_paint is scheduled by the first paintEvent
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self.first_paint_done:
+            self.first_paint_done = True
+            # Queued, so the frame being painted reaches the screen before the startup work runs
+            QTimer.singleShot(0, self.after_first_paint)
+
+    def after_first_paint(self):
+        """Startup work that does not need to block the first frame."""
+        PROFILE.mark("first paint")
+        if PROFILE.enabled:
+            PROFILE.report()
+            QApplication.quit()
+            return
+        self.game_monitor.start()
+        self.check_for_updates()
         self.check_first_run()
-        
+
+    def on_game_running_changed(self, running):
+        self.game_write_confirmed = False
+        self.setWindowTitle("Schedule I Save Editor (game running)" if running else "Schedule I Save Editor")
+
+    def confirm_write(self) -> bool:
+        """
+        Ask before writing to the save while the game is running.
+
+        Uses the game monitor's cached state, so no process scan happens here.
+        The answer holds until the game is started or closed again.
+        """
+        if self.game_write_confirmed or not self.game_monitor.is_running():
+            return True
+        reply = QMessageBox.question(
+            self,
+            "Game Running",
+            "The game is currently running.\nChanges to a save that is loaded in game will be overwritten "
+            "when the game saves. Only continue if you are on the main menu.\n\nWrite changes anyway?",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No
+        )
+        self.game_write_confirmed = reply == QMessageBox.Yes
+        return self.game_write_confirmed
+
     def center_window(self):
         """Center the window on the screen."""
         frame_geo = self.frameGeometry()
@@ -2816,6 +3573,7 @@ class SaveEditorWindow(QMainWindow):
         frame_geo.moveCenter(screen_center)
         self.move(frame_geo.topLeft())
         self.manager = SaveManager()  # Assume SaveManager is defined elsewhere
+        PROFILE.mark("window and SaveManager")
         self.stacked_widget = QStackedWidget()
         self.setCentralWidget(self.stacked_widget)
 
@@ -2823,6 +3581,7 @@ class SaveEditorWindow(QMainWindow):
         self.save_selection_page = self.create_save_selection_page()
         self.save_info_page = self.create_save_info_page()
         self.edit_save_page = self.create_edit_save_page()
+        PROFILE.mark("build pages")
 
         # Add pages to stacked widget
         self.stacked_widget.addWidget(self.save_selection_page)
@@ -2832,8 +3591,14 @@ class SaveEditorWindow(QMainWindow):
         # Populate the save table initially and set the initial page
         self.populate_save_table()
         self.stacked_widget.setCurrentWidget(self.save_selection_page)
+        PROFILE.mark("populate save table")
 
     def check_for_updates(self):
+        cached = UpdateChecker.cached_result()
+        if cached:
+            # Fresh answer on disk: no thread, no network during startup
+            QTimer.singleShot(0, lambda: self.handle_update_result(cached))
+            return
         self.update_thread = QThread()
         self.update_worker = UpdateChecker()
         self.update_worker.moveToThread(self.update_thread)
@@ -2845,7 +3610,7 @@ class SaveEditorWindow(QMainWindow):
         self.update_thread.start()
 
     def handle_update_result(self, result):
-        latest_version, download_url = result
+        latest_version, download_url, sha256 = result
         if not latest_version or not download_url:
             return
 
@@ -2861,31 +3626,22 @@ class SaveEditorWindow(QMainWindow):
                 QMessageBox.No
             )
             if reply == QMessageBox.Yes:
-                self.download_and_apply_update(download_url)
+                self.download_and_apply_update(download_url, sha256)
 
-    def download_and_apply_update(self, download_url):
+    def download_and_apply_update(self, download_url, sha256=None):
         if not getattr(sys, 'frozen', False):
             QMessageBox.information(self, "Info", "Auto-update is only supported in the packaged executable.")
             return
 
+        import subprocess, tempfile
         try:
             # Download the new executable
             downloads_dir = Path.home() / "Downloads"
             downloaded_exe = downloads_dir / os.path.basename(download_url)
             
-            # Show download progress
-            progress = QProgressDialog("Downloading update...", "Cancel", 0, 100, self)
-            progress.setWindowTitle("Updating")
-            progress.setWindowModality(Qt.WindowModal)
-            
-            def update_progress(count, block_size, total_size):
-                percent = (count * block_size * 100) // total_size
-                progress.setValue(percent)
-                if progress.wasCanceled():
-                    raise Exception("Download canceled")
-            
-            urllib.request.urlretrieve(download_url, downloaded_exe, update_progress)
-            progress.close()
+            # Download on a worker thread; a canceled download is resumed next time
+            if not DownloadDialog([(download_url, downloaded_exe, sha256)], "Downloading update...", self).run():
+                return
 
             # Create batch script
             current_exe = sys.executable
@@ -2935,10 +3691,8 @@ del "%~f0"
         return 0
 
     def check_first_run(self):
-        # Define the config directory in AppData
-        config_dir = Path.home() / "AppData" / "Local" / "noedl.xyz" / "Schedule1Editor"
-        config_dir.mkdir(parents=True, exist_ok=True)
-        flag_file = config_dir / "first_run.flag"
+        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        flag_file = CONFIG_DIR / "first_run.flag"
 
         # Check if this is the first run
         if not flag_file.exists():
@@ -3090,36 +3844,41 @@ del "%~f0"
         page = QWidget()
         layout = QVBoxLayout()
 
-        tab_widget = QTabWidget()
-        self.money_tab = MoneyTab()
-        self.rank_tab = RankTab()
-        self.products_tab = ProductsTab(main_window=self)
-        self.properties_tab = PropertiesTab(main_window=self)
-        self.unlocks_tab = UnlocksTab(main_window=self)
-        self.inventory_tab = InventoryTab(main_window=self)
-        self.misc_tab = MiscTab(main_window=self)
-        self.backups_tab = BackupsTab(main_window=self)
-        self.theme_tab = ThemeTab()
-        self.credits_tab = CreditsTab()
-        
-        tab_widget.addTab(self.money_tab, "Money")
-        tab_widget.addTab(self.rank_tab, "Rank")
-        tab_widget.addTab(self.products_tab, "Products")
-        tab_widget.addTab(self.properties_tab, "Properties")
-        tab_widget.addTab(self.unlocks_tab, "Unlocks")
-        tab_widget.addTab(self.inventory_tab, "Inventory")
-        tab_widget.addTab(self.misc_tab, "Misc")
-        tab_widget.addTab(self.backups_tab, "Backups")
-        tab_widget.addTab(self.theme_tab, "Themes")
-        tab_widget.addTab(self.credits_tab, "Credits")
-
-        layout.addWidget(tab_widget)
+        # Tabs are built the first time they are shown. Until then each page holds an
+        # empty placeholder and the tab attribute (self.money_tab, ...) is None.
+        self.edit_tab_factories = [
+            ("money_tab", "Money", MoneyTab),
+            ("rank_tab", "Rank", RankTab),
+            ("products_tab", "Products", lambda: ProductsTab(main_window=self)),
+            ("properties_tab", "Properties", lambda: PropertiesTab(main_window=self)),
+            ("unlocks_tab", "Unlocks", lambda: UnlocksTab(main_window=self)),
+            ("inventory_tab", "Inventory", lambda: InventoryTab(main_window=self)),
+            ("misc_tab", "Misc", lambda: MiscTab(main_window=self)),
+            ("query_tab", "Query", lambda: QueryTab(main_window=self)),
+            ("search_tab", "Search", lambda: SearchTab(main_window=self)),
+            ("backups_tab", "Backups", lambda: BackupsTab(main_window=self)),
+            ("theme_tab", "Themes", ThemeTab),
+            ("credits_tab", "Credits", CreditsTab),
+        ]
+        self.stale_tabs = set()  # Built tabs whose contents no longer match the save
+        self.form_loaded = {}  # Form tab -> the get_data() it showed when last filled from the save
+
+        self.tab_widget = QTabWidget()
+        for name, label, _ in self.edit_tab_factories:
+            setattr(self, name, None)
+            placeholder = QWidget()
+            placeholder_layout = QVBoxLayout(placeholder)
+            placeholder_layout.setContentsMargins(0, 0, 0, 0)
+            self.tab_widget.addTab(placeholder, label)
+        self.tab_widget.currentChanged.connect(self.activate_tab)
+
+        layout.addWidget(self.tab_widget)
 
         button_layout = QHBoxLayout()
         apply_button = QPushButton("Apply Changes")
         apply_button.clicked.connect(self.apply_changes)
         cancel_button = QPushButton("Cancel")
-        cancel_button.clicked.connect(lambda: self.stacked_widget.setCurrentWidget(self.save_info_page))
+        cancel_button.clicked.connect(self.back_to_save_info)
         button_layout.addWidget(apply_button)
         button_layout.addWidget(cancel_button)
 
@@ -3128,35 +3887,112 @@ del "%~f0"
         return page
 
     def show_edit_page(self):
-        """Show the edit save page and update its data."""
-        if is_game_running():
+        """Show the edit save page, loading only the visible tab."""
+        if self.game_monitor.is_running():
             QMessageBox.information(
             self,
             "Game Running",
             "The game is currently running.\nEnsure you are on the main menu and not loaded in to a save before editing.",
             )
         self.update_edit_save_page()
-        self.backups_tab.refresh_backup_list()
         self.stacked_widget.setCurrentWidget(self.edit_save_page)
 
     def update_edit_save_page(self):
+        """Mark every built tab stale and refresh the visible one; the rest refresh when activated."""
+        self.mark_tabs_stale()
+        self.activate_tab(self.tab_widget.currentIndex())
+
+    def activate_tab(self, index):
+        """Build the tab at index on first use, or refresh it if it has gone stale."""
+        if index < 0:
+            return
+        name = self.edit_tab_factories[index][0]
+        if getattr(self, name) is None:
+            tab = self.edit_tab_factories[index][2]()
+            self.tab_widget.widget(index).layout().addWidget(tab)
+            setattr(self, name, tab)
+            self.refresh_tab(name)
+        elif name in self.stale_tabs:
+            self.refresh_tab(name)
+
+    def refresh_tab(self, name):
+        """Reload a built tab from the current save. Form tabs keep the fields the user has edited."""
+        tab = getattr(self, name)
+        if name in self.FORM_TABS:
+            try:
+                edits = self.form_edits(name)
+            except ValueError:
+                return  # A half-typed number; leave the tab stale rather than lose it
             info = self.manager.get_save_info()
-            self.money_tab.set_data(info)
-            self.rank_tab.set_data(info)
-            self.misc_tab.set_data(info)
-            self.misc_tab.update_vars_warning()
-            self.properties_tab.load_property_types()
-            self.properties_tab.load_plastic_pots()
-            self.backups_tab.refresh_backup_list()
-            self.inventory_tab.refresh_data()
-            self.misc_tab.load_save_folders()
+            tab.set_data(info)
+            self.form_loaded[name] = tab.get_data()
+            if edits:
+                tab.set_data({**info, **edits})
+        self.stale_tabs.discard(name)
+        if name == "misc_tab":
+            tab.update_vars_warning()
+            tab.load_save_folders()
+            if not tab.quests_tree.isHidden():
+                tab.show_quests()
+        elif name == "properties_tab":
+            tab.load_property_types()
+            tab.load_plastic_pots()
+        elif name == "inventory_tab":
+            tab.refresh_data()
+        elif name == "backups_tab":
+            tab.refresh_backup_list()
+        elif name == "search_tab":
+            tab.run_search()
+
+    def mark_tabs_stale(self, *names):
+        """
+        Flag tabs whose data changed on disk. With no names, every tab is flagged.
+
+        The visible tab is refreshed right away; the others refresh when next activated,
+        and tabs that were never built have nothing to refresh.
+        """
+        names = names or [name for name, _, _ in self.edit_tab_factories]
+        current = self.edit_tab_factories[self.tab_widget.currentIndex()][0]
+        for name in names:
+            if getattr(self, name) is None:
+                continue
+            if name == current and self.stacked_widget.currentWidget() is self.edit_save_page:
+                self.refresh_tab(name)
+            else:
+                self.stale_tabs.add(name)
+
+    def fresh_tab(self, name):
+        """The named tab if it is built and shows the current save, otherwise None."""
+        tab = getattr(self, name)
+        return tab if tab is not None and name not in self.stale_tabs else None
+
+    def form_edits(self, name) -> dict:
+        """
+        Fields of a built form tab that differ from what it was last filled with.
+        Raises ValueError when a number field does not parse.
+        """
+        tab = getattr(self, name)
+        if tab is None or name not in self.form_loaded:
+            return {}
+        loaded = self.form_loaded[name]
+        return {field: value for field, value in tab.get_data().items() if loaded.get(field) != value}
+
+    def discard_form_edits(self):
+        """Forget edits when leaving the edit page, so the form tabs refill from the save next time."""
+        for name in self.FORM_TABS:
+            if self.form_loaded.pop(name, None) is not None:
+                self.stale_tabs.add(name)
 
     def apply_changes(self):
             try:
-                money_data = self.money_tab.get_data()
-                rank_data = self.rank_tab.get_data()
-                misc_data = self.misc_tab.get_data()
+                # Only fields the user changed are written. A tab that went stale after it was
+                # edited still applies its edits, and its untouched fields never overwrite newer values.
+                money_data, rank_data, misc_data = (self.form_edits(name) for name in self.FORM_TABS)
+            except ValueError:
+                QMessageBox.warning(self, "Invalid Input", "Please enter valid integer values.")
+                return
 
+            def work(task):
                 # Backup stats files
                 stats_files = [
                     self.manager.current_save / "Money.json",
@@ -3164,44 +4000,64 @@ del "%~f0"
                     self.manager.current_save / "Game.json",
                     self.manager.current_save / "Players/Player_0/Inventory.json"
                 ]
-                self.manager.create_feature_backup("Stats", stats_files)
-                self.backups_tab.refresh_backup_list()
-
-                # Apply money changes
-                self.manager.set_online_money(money_data["online_money"])
-                self.manager.set_networth(money_data["networth"])
-                self.manager.set_lifetime_earnings(money_data["lifetime_earnings"])
-                self.manager.set_weekly_deposit_sum(money_data["weekly_deposit_sum"])
-                self.manager.set_cash_balance(money_data["cash_balance"])
-
-                # Apply rank changes
-                self.manager.set_rank(rank_data["current_rank"])
-                self.manager.set_rank_number(rank_data["rank_number"])
-                self.manager.set_tier(rank_data["tier"])
-
-                self.manager.set_organisation_name(misc_data["organisation_name"])
-                
-                # Update ConsoleEnabled in Game.json Settings
-                game_data = self.manager._load_json_file("Game.json")
-                # Ensure Settings dictionary exists
-                game_data.setdefault("Settings", {})
-                game_data["Settings"]["ConsoleEnabled"] = misc_data["console_enabled"]
-                self.manager._save_json_file("Game.json", game_data)
-
+                self.manager.create_feature_backup("Stats", stats_files, "Apply stat changes")
+
+                # Apply money and rank changes
+                setters = {
+                    "online_money": self.manager.set_online_money,
+                    "networth": self.manager.set_networth,
+                    "lifetime_earnings": self.manager.set_lifetime_earnings,
+                    "weekly_deposit_sum": self.manager.set_weekly_deposit_sum,
+                    "cash_balance": self.manager.set_cash_balance,
+                    "current_rank": self.manager.set_rank,
+                    "rank_number": self.manager.set_rank_number,
+                    "tier": self.manager.set_tier,
+                }
+                for field, value in {**money_data, **rank_data}.items():
+                    setters[field](value)
+
+                if "organisation_name" in misc_data:
+                    self.manager.set_organisation_name(misc_data["organisation_name"])
+
+                if "console_enabled" in misc_data:
+                    # Update ConsoleEnabled in Game.json Settings
+                    game_data = self.manager._load_json_file("Game.json")
+                    # Ensure Settings dictionary exists
+                    game_data.setdefault("Settings", {})
+                    game_data["Settings"]["ConsoleEnabled"] = misc_data["console_enabled"]
+                    self.manager._save_json_file("Game.json", game_data)
+
+            def done(_):
+                self.discard_form_edits()
+                self.mark_tabs_stale("backups_tab")
                 QMessageBox.information(self, "Success", "Changes applied successfully!")
                 self.update_save_info_page()
                 self.stacked_widget.setCurrentWidget(self.save_info_page)
-            except ValueError:
-                QMessageBox.warning(self, "Invalid Input", "Please enter valid integer values.")
+
+            self.tasks.run("Applying changes", work, on_done=done, cancellable=False)
+
+    def back_to_save_info(self):
+        """Leave the edit page, dropping unapplied edits. The summary is memoized, so refreshing it here is cheap."""
+        self.discard_form_edits()
+        self.update_save_info_page()
+        self.stacked_widget.setCurrentWidget(self.save_info_page)
 
     def back_to_selection(self):
         """Refresh the save table and navigate back to the save selection page."""
         self.populate_save_table()  # Refresh table with latest data
         self.stacked_widget.setCurrentWidget(self.save_selection_page)
 
+    def closeEvent(self, event):
+        # Let a running save operation stop at a safe point before the process exits
+        self.tasks.wait()
+        self.game_monitor.stop()
+        super().closeEvent(event)
+
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    PROFILE.mark("QApplication")
     widget = QWidget()
     window = SaveEditorWindow()
     window.show()
+    PROFILE.mark("show window")
     sys.exit(app.exec())
\ No newline at end of file
@@ -0,0 +1,167 @@
+import hashlib, tempfile, threading, time, unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from lib.downloads import DownloadCancelled, DownloadError, DownloadManager
+
+DATA = bytes(range(256)) * 400
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append((self.path, dict(self.headers)))
+        if self.path == "/redirect":
+            self.send_response(302)
+            self.send_header("Location", "/file")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path == "/stall":
+            # Half the body, then nothing until the client gives up
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(DATA)))
+            self.end_headers()
+            self.wfile.write(DATA[:len(DATA) // 2])
+            self.wfile.flush()
+            server.release.wait(10)
+            return
+        data, etag = server.data, server.etag
+        start = None
+        range_header = self.headers.get("Range")
+        if range_header and self.headers.get("If-Range") in (None, etag):
+            start = int(range_header.split("=")[1].rstrip("-"))
+        if start is not None and server.misplaced_resume:
+            start = 0
+        if start is not None and start >= len(data):
+            self.send_response(416)
+            self.send_header("Content-Range", f"bytes */{len(data)}")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = data if start is None else data[start:]
+        self.send_response(200 if start is None else 206)
+        if start is not None:
+            self.send_header("Content-Range", f"bytes {start}-{len(data) - 1}/{len(data)}")
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class DownloadManagerTest(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.server.requests = []
+        self.server.data = DATA
+        self.server.etag = '"v1"'
+        self.server.misplaced_resume = False
+        self.server.release = threading.Event()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dest = Path(self.tmp.name) / "file.bin"
+        self.partial = self.dest.with_name("file.bin.part")
+        self.manager = DownloadManager(timeout=5, retries=1)
+
+    def tearDown(self):
+        self.server.release.set()
+        self.manager.close()
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp.cleanup()
+
+    def leave_partial(self, url: str, size: int):
+        """Cancel a download of url once size bytes have arrived."""
+        received = []
+        with self.assertRaises(DownloadCancelled):
+            self.manager.download(url, self.dest, progress=lambda done, total: received.append(done),
+                                  cancelled=lambda: bool(received) and received[-1] >= size)
+        self.server.requests.clear()
+
+    def test_download_and_checksum(self):
+        sha = hashlib.sha256(DATA).hexdigest()
+        self.assertEqual(self.manager.download(self.base + "/file", self.dest, sha), self.dest)
+        self.assertEqual(self.dest.read_bytes(), DATA)
+        self.assertFalse(self.partial.exists())
+
+    def test_checksum_mismatch_removes_partial(self):
+        with self.assertRaises(DownloadError):
+            self.manager.download(self.base + "/file", self.dest, "0" * 64)
+        self.assertFalse(self.dest.exists())
+        self.assertFalse(self.partial.exists())
+
+    def test_redirect(self):
+        self.manager.download(self.base + "/redirect", self.dest)
+        self.assertEqual(self.dest.read_bytes(), DATA)
+        self.assertEqual([path for path, _ in self.server.requests], ["/redirect", "/file"])
+
+    def test_resume_sends_if_range(self):
+        self.manager.chunk_size = 4096
+        self.leave_partial(self.base + "/file", 8192)
+        self.manager.download(self.base + "/file", self.dest)
+        self.assertEqual(self.dest.read_bytes(), DATA)
+        headers = self.server.requests[0][1]
+        self.assertEqual(headers["Range"], f"bytes={8192}-")
+        self.assertEqual(headers["If-Range"], '"v1"')
+
+    def test_changed_file_restarts(self):
+        self.manager.chunk_size = 4096
+        self.leave_partial(self.base + "/file", 8192)
+        self.server.data, self.server.etag = DATA[::-1], '"v2"'
+        self.manager.download(self.base + "/file", self.dest)
+        self.assertEqual(self.dest.read_bytes(), DATA[::-1])
+
+    def test_partial_from_other_url_is_discarded(self):
+        self.manager.chunk_size = 4096
+        self.leave_partial(self.base + "/file", 8192)
+        self.manager.download(self.base + "/file?other", self.dest)
+        self.assertEqual(self.dest.read_bytes(), DATA)
+        self.assertNotIn("Range", self.server.requests[0][1])
+
+    def test_misplaced_resume_restarts(self):
+        self.manager.chunk_size = 4096
+        self.leave_partial(self.base + "/file", 8192)
+        self.server.misplaced_resume = True
+        self.manager.download(self.base + "/file", self.dest)
+        self.assertEqual(self.dest.read_bytes(), DATA)
+
+    def test_complete_partial_answered_with_416(self):
+        self.partial.write_bytes(DATA)
+        self.partial.with_name("file.bin.part.json").write_text(
+            '{"url": "%s/file", "validator": "\\"v1\\""}' % self.base)
+        self.manager.download(self.base + "/file", self.dest)
+        self.assertEqual(self.dest.read_bytes(), DATA)
+        self.assertEqual(self.server.requests[0][1]["Range"], f"bytes={len(DATA)}-")
+
+    def test_416_for_longer_partial_restarts(self):
+        self.partial.write_bytes(DATA + b"extra")
+        self.partial.with_name("file.bin.part.json").write_text(
+            '{"url": "%s/file", "validator": "\\"v1\\""}' % self.base)
+        self.manager.download(self.base + "/file", self.dest)
+        self.assertEqual(self.dest.read_bytes(), DATA)
+
+    def test_abort_wakes_blocked_read(self):
+        self.manager.chunk_size = len(DATA) // 2
+        cancelled = threading.Event()
+
+        def cancel_later(received, total):
+            def cancel():
+                cancelled.set()
+                self.manager.abort()
+            threading.Timer(0.2, cancel).start()
+
+        started = time.monotonic()
+        with self.assertRaises(DownloadCancelled):
+            self.manager.download(self.base + "/stall", self.dest, progress=cancel_later, cancelled=cancelled.is_set)
+        self.assertLess(time.monotonic() - started, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()